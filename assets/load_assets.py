@@ -7,8 +7,11 @@ All assets are registered and loaded on-demand (lazy loading).
 
 import pygame
 from typing import Any
-from config import WIDTH, HEIGHT, SHIP_CONFIG, ENEMY_CONFIG, PROJECTILES_CONFIG, SHIELD_CONFIG
+from config import WIDTH, HEIGHT, SHIP_CONFIG, ENEMY_CONFIG, PROJECTILES_CONFIG, SHIELD_CONFIG, EXPLOSION_PREWARM
 from manager.asset_manager import AssetManager
+from system.mask_bank import mask_bank
+from system.rotation_cache import rotation_cache
+from system.frame_cache import frame_cache
 
 
 class AssetProxy:
@@ -97,6 +100,8 @@ def load_assets() -> AssetProxy:
         manager.register_asset(key, ecfg["img"])
         img = manager.load_image(ecfg["img"], ecfg["size"])
         manager._cache[key] = img
+        # Kollisionsmaske pro Gegner-Typ (nur nach bestandenem AABB-Test benutzt)
+        manager._cache[f"{key}_mask"] = mask_bank.surface_mask(img)
 
     # ===== Projectiles (Images, Sounds, Explosions) =====
     for weapon_name, pcfg in PROJECTILES_CONFIG.items():
@@ -105,6 +110,9 @@ def load_assets() -> AssetProxy:
         manager.register_asset(img_key, pcfg["img"])
         base_img = manager.load_image(pcfg["img"], pcfg.get("size"))
         manager._cache[img_key] = base_img
+        # Raketen werden in Flugrichtung gedreht gezeichnet: alle Rasterwinkel vorbauen
+        if weapon_name in ("rocket", "homing_rocket"):
+            rotation_cache.prewarm(base_img)
 
         # --- Special: Yellow laser for enemies ---
         if weapon_name == "laser":
@@ -170,6 +178,10 @@ def load_assets() -> AssetProxy:
             proxy[f"expl_{weapon_name}_fps"]  = ex.get("fps", 24)
             proxy[f"expl_{weapon_name}_keep"] = ex.get("keep", None)
 
+    # Explosions-Skalierungen der Waffen vorbauen (sonst smoothscale mitten im Kampf)
+    for expl_key, scales in EXPLOSION_PREWARM.items():
+        frame_cache.prewarm(manager._cache.get(expl_key) or [], scales)
+
     # ===== Music Paths =====
     proxy["music_paths"] = {"raining_bits": "assets/music/raining_bits.ogg"}
 
@@ -184,6 +196,13 @@ def load_assets() -> AssetProxy:
     )
     manager._cache["shield_frames"] = frames
 
+    # Shield frames + per-frame masks for every ship stage size (built once)
+    from entities.shield import Shield
+    for stage in SHIP_CONFIG:
+        ship_img = manager._cache[f"player_stage{stage}"]
+        sf = Shield.scale_for_player(ship_img.get_rect(), frames, scfg.get("scale", 1.0))
+        mask_bank.frame_set(frames, Shield.frame_size(frames, sf))
+
     # Shield metadata as special data
     proxy["shield_fps"]      = scfg.get("fps")
     proxy["shield_duration"] = scfg.get("duration")
@@ -203,5 +222,9 @@ def load_assets() -> AssetProxy:
     except Exception:
         manager._cache["shield_activate_sound"] = None
 
+    # ===== Waffen-Specs (Muzzles, Winkel, Geschwindigkeiten, Sounds einmal kompiliert) =====
+    from entities.weapon_spec import compile_weapon_specs
+    compile_weapon_specs(proxy)
+
     return proxy
 
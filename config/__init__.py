@@ -1,5 +1,7 @@
 from .enemy import ENEMY_CONFIG
-from .weapon import WEAPON_CONFIG, PROJECTILES_CONFIG, EMP_CONFIG
+from .weapon import WEAPON_CONFIG, PROJECTILES_CONFIG, EMP_CONFIG, INTERCEPTION_CONFIG, CULL_CONFIG, PROJECTILE_BUDGETS, EXPLOSION_PREWARM, EXPLOSION_LOD
 from .settings import WIDTH, HEIGHT, FPS, FONT_SIZE, LIVES, LIVES_COOLDOWN, RESPAWN_PROTECTION, MASTER_VOLUME, MUSIC_VOLUME, SFX_VOLUME
+from .settings import USE_SPATIAL_HASH, SPATIAL_CELL_SIZE, PHYSICS_HZ, COLLISION_MODE, PROJECTILE_BACKEND, ROTATION_CACHE_STEPS, EXPLOSION_CACHE_MB, EXPLOSION_QUALITY
+from .settings import TELEMETRY_FILE, TELEMETRY_INTERVAL_MS, PARTICLE_CAPACITY
 from .shield import SHIELD_CONFIG
 from .ship import SHIP_CONFIG
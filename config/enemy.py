@@ -171,6 +171,8 @@ ENEMY_CONFIG = {
             "nuke",
             "homing_rocket"
         ],
+        # Bullet-Patterns aus config/patterns.py (Cooldown/Chance stehen beim Pattern)
+        "patterns": ["ring_16", "spiral_4", "fan_aimed"],
         "spawn": {
             "y": 140
         }
@@ -0,0 +1,41 @@
+# config/particles.py - Partikel-Effekte (ParticleManager)
+#
+# Ein Effekt beschreibt eine Emission: "count" Partikel pro Aufruf, Lebensdauer "life_ms"
+# (min, max), Tempo "speed" (min, max) in px pro 60-Hz-Frame, Streuung "spread_deg" um die
+# Richtung (360 = rundherum, ohne Richtung immer rundherum), "drag" (Tempo-Faktor pro Frame),
+# "gravity" (px/Frame² nach unten), Größe "size" (1 oder 2 px) und "colors" (zufällig pro
+# Partikel). Die Farbe dunkelt über die Lebensdauer ab.
+PARTICLE_CONFIG = {
+    "spark": {
+        "count": 24, "life_ms": (150, 400), "speed": (2.0, 7.0), "spread_deg": 360,
+        "drag": 0.90, "gravity": 0.0, "size": 1,
+        "colors": [(255, 245, 200), (255, 210, 90), (255, 150, 40)],
+    },
+    "debris": {
+        "count": 14, "life_ms": (400, 900), "speed": (1.0, 4.0), "spread_deg": 360,
+        "drag": 0.97, "gravity": 0.08, "size": 2,
+        "colors": [(150, 135, 120), (110, 100, 90), (200, 120, 60)],
+    },
+    "nuke_debris": {
+        "count": 600, "life_ms": (600, 1600), "speed": (2.0, 12.0), "spread_deg": 360,
+        "drag": 0.95, "gravity": 0.05, "size": 2,
+        "colors": [(255, 255, 220), (255, 200, 80), (255, 120, 40), (180, 170, 160)],
+    },
+    "rocket_trail": {
+        "count": 2, "life_ms": (150, 320), "speed": (0.3, 1.5), "spread_deg": 40,
+        "drag": 0.93, "gravity": 0.0, "size": 1,
+        "colors": [(255, 190, 70), (255, 140, 40), (190, 190, 190)],
+    },
+    "nuke_trail": {
+        "count": 5, "life_ms": (250, 500), "speed": (0.5, 2.0), "spread_deg": 60,
+        "drag": 0.93, "gravity": 0.0, "size": 2,
+        "colors": [(200, 255, 160), (255, 230, 120), (160, 160, 160)],
+    },
+}
+
+# Projektil-Kind -> Trail-Effekt (jeden Frame hinter jedem lebenden Schuss, entgegen der Flugrichtung)
+PARTICLE_TRAILS = {
+    "rocket":        "rocket_trail",
+    "homing_rocket": "rocket_trail",
+    "nuke":          "nuke_trail",
+}
@@ -0,0 +1,65 @@
+# config/patterns.py - Bullet-Patterns für Gegner (Emitter)
+#
+# Gegner referenzieren Patterns über ENEMY_CONFIG[typ]["patterns"] (Liste von Namen).
+# Ein Pattern feuert "volleys" Salven im Abstand "interval_ms"; jede Salve ist ein Batch
+# (ein Ursprung, ein Start-Tick, ein Winkel-Array) statt einzelner Projektile.
+#
+# Winkel wie bei den Gegner-Waffen: 0° = gerade nach unten, positiv = nach rechts.
+# Typen:
+#   ring   - "count" Kugeln gleichmäßig im Kreis, pro Salve um "spin_deg" gedreht
+#   spiral - "arms" Arme, pro Salve um "step_deg" weitergedreht (viele kurze Salven)
+#   fan    - "count" Kugeln über "spread_deg" verteilt, mit "aimed" auf den Spieler gerichtet
+#   burst  - wie fan, Standard: eine Kugel pro Salve, auf den Spieler gezielt
+# Bilder sind Asset-Keys, "size" skaliert einmal beim Kompilieren des Patterns.
+PATTERN_CONFIG = {
+    "ring_16": {
+        "type": "ring",
+        "count": 16,
+        "spin_deg": 11.25,
+        "volleys": 3,
+        "interval_ms": 250,
+        "cooldown_ms": 3000,
+        "prob": 0.01,          # Chance pro Frame, sobald der Cooldown abgelaufen ist
+        "speed": 4.0,
+        "accel": 1.0,
+        "bullet": {"img": "blaster_img", "size": (10, 10), "dmg": 20},
+    },
+    "spiral_4": {
+        "type": "spiral",
+        "arms": 4,
+        "step_deg": 9.0,
+        "volleys": 40,
+        "interval_ms": 60,
+        "cooldown_ms": 6000,
+        "prob": 0.01,
+        "speed": 3.5,
+        "accel": 1.005,
+        "bullet": {"img": "blaster_img", "size": (9, 9), "dmg": 15},
+    },
+    "fan_aimed": {
+        "type": "fan",
+        "count": 7,
+        "spread_deg": 50.0,
+        "aimed": True,
+        "volleys": 1,
+        "interval_ms": 0,
+        "cooldown_ms": 2500,
+        "prob": 0.01,
+        "speed": 6.0,
+        "accel": 1.0,
+        "bullet": {"img": "blaster_img", "size": (8, 8), "dmg": 25},
+    },
+    "burst_aimed": {
+        "type": "burst",
+        "count": 1,
+        "spread_deg": 0.0,
+        "aimed": True,
+        "volleys": 5,
+        "interval_ms": 90,
+        "cooldown_ms": 2000,
+        "prob": 0.01,
+        "speed": 8.0,
+        "accel": 1.0,
+        "bullet": {"img": "blaster_img", "size": (7, 7), "dmg": 20},
+    },
+}
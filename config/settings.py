@@ -17,3 +17,18 @@ RESPAWN_PROTECTION = 3000
 MASTER_VOLUME      = 0.1
 MUSIC_VOLUME       = 0.3
 SFX_VOLUME         = 0.5
+
+# Kollision: Broadphase (Spatial Hash) für Player-Schüsse vs. Gegner
+USE_SPATIAL_HASH   = True  # False = Brute-Force-Pfad (zum Vergleichen der Ergebnisse)
+SPATIAL_CELL_SIZE  = 128   # Zellgröße in Pixeln
+
+# Physik: Bewegungen sind auf 60 Hz normiert, bei niedrigerer Rate wird pro Schritt skaliert
+PHYSICS_HZ         = 60
+COLLISION_MODE     = "swept"  # "swept" = Pfad seit letztem Tick prüfen, "discrete" = nur Endposition
+PROJECTILE_BACKEND = "objects"  # "numpy" = Structure-of-Arrays-Physik, "analytic" = geschlossene Bahnen (beide ohne NumPy automatisch "objects")
+ROTATION_CACHE_STEPS = 64  # Vorgedrehte Winkel pro Projektil-Sprite (Raketen), 360/64 = 5.6° Raster
+EXPLOSION_CACHE_MB   = 96  # Byte-Budget für skalierte Explosions-Frames (LRU), Misses werden im Hintergrund gebaut
+EXPLOSION_QUALITY    = "high"  # Explosions-LOD (EXPLOSION_LOD in config/weapon.py): "ultra" = aus, "high", "medium", "low"
+TELEMETRY_FILE        = "telemetry.jsonl"  # Snapshots der In-Memory-Telemetrie (relativ zum Projekt, None = nicht schreiben)
+TELEMETRY_INTERVAL_MS = 1000               # Abstand der Snapshots in ms Spielzeit
+PARTICLE_CAPACITY     = 65536  # Ring-Buffer der Partikel (Effekte in config/particles.py), voll = älteste überschreiben
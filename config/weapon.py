@@ -11,6 +11,11 @@ WEAPON_CONFIG = {
         "amount": -1,
         "speed": 15,
         "accel": 1,
+        "mode": "projectile",   # "projectile" = einzelne Laser-Objekte, "beam" = Hitscan-Strahl (nur Player)
+        "beam": {
+            "width": 4,         # Strahlbreite in px (Double-Laser: doppelt)
+            "hit_fx_ms": 120,   # Abstand der Treffer-Funken am Ziel
+        },
         "img": "assets/images/weapon/laser_vertical.png",
         "sound_start": "assets/sound/laser_shoot.wav",
         "sound_hit": "assets/sound/laser_explosion.wav",
@@ -179,3 +184,71 @@ PROJECTILES_CONFIG = WEAPON_CONFIG
 
 # EMP-Konfiguration als Alias für einheitliche Nutzung
 EMP_CONFIG = WEAPON_CONFIG["emp"]
+
+# Abfangen von Gegner-Projektilen durch Spieler-Projektile (Broadphase: Sort-and-Sweep auf x)
+INTERCEPTION_CONFIG = {
+    "enabled": False,
+    # Spieler-Projektil-Kind -> Gegner-Projektil-Kinds, die es abschießen kann
+    "matrix": {
+        "laser":        ("rocket", "homing_rocket"),
+        "double_laser": ("rocket", "homing_rocket"),
+        "blaster":      ("rocket", "homing_rocket"),
+    },
+    "explosion_scale": 0.6,
+}
+
+# Entfernen von Projektilen: jeden Tick gegen den Viewport (+ Rand), zusätzlich nach Lebensdauer.
+# Geradeaus fliegende Schüsse werden entfernt, sobald sie draußen sind und sich weiter entfernen;
+# lenkende Kinds bekommen einen Rand, weil sie noch umkehren können.
+CULL_CONFIG = {
+    "margin": 0,        # Standard-Rand in px um den Viewport
+    "ttl_ms": 15000,    # Standard-Lebensdauer in Physik-Zeit (None = unbegrenzt)
+    "kinds": {
+        "homing_rocket": {"margin": 100, "ttl_ms": 12000},
+        "blaster":       {"margin": 100, "ttl_ms": 8000},
+    },
+}
+
+# Admission Control im ProjectileManager: Budgets pro Owner und pro Kind, Gesamtlimit = max_projectiles.
+# Owner-Budgets sind Anteile an max_projectiles: "max" = Obergrenze, "reserve" = für den Owner
+# freigehaltene Plätze (andere Owner können sie nicht belegen). Kind-Budgets sind absolute Zahlen.
+# Ist ein Budget voll, wird ein Schuss mit niedrigerer oder gleicher Priorität verdrängt
+# (niedrigste Priorität zuerst, darin der älteste); sonst wird der neue Schuss abgelehnt.
+PROJECTILE_BUDGETS = {
+    "owners": {
+        "player": {"max": None, "reserve": 0.2},   # None = nur Gesamtlimit
+        "enemy":  {"max": 0.6,  "reserve": 0.0},
+    },
+    "kinds": {          # Owner -> Kind -> Obergrenze
+        "player": {"nuke": 50},
+        "enemy":  {"nuke": 40, "homing_rocket": 300, "rocket": 800},
+    },
+    "priority": {       # unbekannte Kinds: 0
+        "laser": 0, "double_laser": 0, "pattern": 0,
+        "blaster": 1, "rocket": 2, "homing_rocket": 2, "nuke": 3,
+    },
+    "evict": True,      # False = volle Budgets lehnen nur ab
+}
+
+# Explosions-Skalierungen, die beim Laden in den FrameCache vorgebaut werden:
+# Asset-Key -> Skalierungen, wie sie die on_hit-/Kill-Aufrufe an add_explosion übergeben
+# (Boss-Kills im AoE: expl_scale * 1.5). Nicht gelistete Skalierungen baut der Cache bei
+# Bedarf im Hintergrund nach.
+EXPLOSION_PREWARM = {
+    "expl_rocket": (0.6, 0.7, 0.8, 1.05, 1.2, 1.6, 2.0, 3.5, 5.0),  # Rakete, Homing, Blaster, Abfangen, Kills
+    "expl_laser":  (2.0, 2.5),                                       # Laser-Kills, Spieler-Treffer
+    "expl_nuke":   (1.2, 1.5, 4.0),                                  # Nuke-Ring, Boss, Zentrum
+}
+
+# Explosions-LOD pro Qualitätsstufe (EXPLOSION_QUALITY in settings.py), begrenzt den Overdraw:
+# - Zusammenfassen: startet eine Explosion derselben Frames höchstens merge_ms vorher näher als
+#   merge_px, wird sie zu einer größeren (Flächen addieren sich: scale = sqrt(s1² + s2²),
+#   höchstens max_scale und die größte vorgewärmte Skalierung)
+# - Regionen: Bildschirm-Raster mit region_px Zellen, höchstens per_region laufende Explosionen
+#   pro Zelle; eine weitere ersetzt die älteste der Zelle
+EXPLOSION_LOD = {
+    "ultra":  None,     # kein LOD, jede Explosion einzeln
+    "high":   {"merge_px": 24, "merge_ms": 80,  "max_scale": 5.0, "region_px": 256, "per_region": 24},
+    "medium": {"merge_px": 48, "merge_ms": 120, "max_scale": 5.0, "region_px": 256, "per_region": 12},
+    "low":    {"merge_px": 80, "merge_ms": 160, "max_scale": 4.0, "region_px": 320, "per_region": 6},
+}
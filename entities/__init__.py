@@ -3,5 +3,6 @@ from .enemy import Enemy
 from .projectile import Projectile, Rocket, Nuke, Laser, DoubleLaser
 from .explosion import Explosion
 from .shield import Shield
+from .beam import LaserBeam
 from .powerup import PowerUp
 
@@ -0,0 +1,121 @@
+# entities/beam.py
+import math, pygame
+from config import MASTER_VOLUME, SFX_VOLUME
+from config.weapon import PROJECTILES_CONFIG
+from entities.projectile import _expl_frames
+
+# Gestreckte Strahl-Sprites: (id(img), Breite, Länge quantisiert, Winkel) -> Surface
+_BEAM_SPRITES = {}
+LENGTH_STEP   = 16   # Längen-Raster für den Sprite-Cache
+
+
+def _quantize(length):
+    return max(LENGTH_STEP, int(math.ceil(length / LENGTH_STEP)) * LENGTH_STEP)
+
+
+def _beam_sprite(img, width, length, angle_deg):
+    q    = _quantize(length)
+    key  = (id(img), width, q, angle_deg)
+    surf = _BEAM_SPRITES.get(key)
+    if surf is None:
+        surf = pygame.transform.scale(img, (width, q))
+        if angle_deg:
+            surf = pygame.transform.rotate(surf, -angle_deg)
+        _BEAM_SPRITES[key] = surf
+    return surf
+
+
+class LaserBeam:
+    """
+    Hitscan-Laser einer Mündung: ein Raycast pro Tick statt vieler Laser-Objekte.
+
+    cast() sucht das erste Ziel entlang des Strahls (Kollisions-Stufe),
+    tick_damage() liefert den Schaden dieses Ticks (Auflösungs-Stufe).
+    """
+
+    __slots__ = ("x", "y", "angle_deg", "dx", "dy", "length", "target",
+                 "dps", "width", "img", "_dmg_acc", "_next_fx")
+
+    def __init__(self, x, y, angle_deg, img, width, dps):
+        self.img      = img
+        self.width    = int(width)
+        self.dps      = float(dps)
+        self.length   = 0.0
+        self.target   = None
+        self._dmg_acc = 0.0
+        self._next_fx = 0
+        self.aim(x, y, angle_deg)
+
+    @classmethod
+    def create(cls, x, y, assets, angle_deg=0, double=False):
+        cfg   = PROJECTILES_CONFIG["laser"]
+        bcfg  = cfg.get("beam", {})
+        width = bcfg.get("width", 4) * (2 if double else 1)
+        img   = assets.get("double_laser_img") if double else None
+        img   = img or assets["laser_img"]
+        # Gleiche DPS wie der Projektil-Laser: dmg pro cooldown
+        dps   = cfg["dmg"] * 1000.0 / max(1, cfg["cooldown"])
+        return cls(x, y, angle_deg, img, width, dps)
+
+    def aim(self, x, y, angle_deg):
+        """Setzt Mündung und Richtung (Winkel wie bei Laser.create, 0 = nach oben)"""
+        self.x, self.y = x, y
+        if angle_deg != getattr(self, "angle_deg", None):
+            rad = math.radians(angle_deg)
+            self.angle_deg = angle_deg
+            self.dx, self.dy = math.sin(rad), -math.cos(rad)
+
+    def max_range(self):
+        """Strecke bis zum oberen Bildschirmrand"""
+        return max(0.0, self.y / -self.dy) if self.dy < 0 else 0.0
+
+    def cast(self, raycast):
+        """Raycast (x, y, dx, dy, max_dist) -> (Ziel, Abstand); setzt target und length"""
+        self.target, self.length = raycast(self.x, self.y, self.dx, self.dy, self.max_range())
+        return self.target
+
+    def tick_damage(self, dt):
+        """Ganzzahliger Schaden für dt Sekunden (Nachkommaanteil wird angesammelt)"""
+        self._dmg_acc += self.dps * dt
+        dmg = int(self._dmg_acc)
+        self._dmg_acc -= dmg
+        return dmg
+
+    def want_hit_fx(self, now):
+        """True höchstens alle hit_fx_ms: Treffer-Funken am Ziel"""
+        if now < self._next_fx:
+            return False
+        self._next_fx = now + PROJECTILES_CONFIG["laser"].get("beam", {}).get("hit_fx_ms", 120)
+        return True
+
+    def on_hit(self, game):
+        """Treffer-Funken + Sound am Auftreffpunkt (wie Laser.on_hit)"""
+        frames, fps = _expl_frames(game, "expl_laser")
+        if game.assets.get("laser_sound_destroy"):
+            game.assets["laser_sound_destroy"].set_volume(MASTER_VOLUME * SFX_VOLUME)
+            game.assets["laser_sound_destroy"].play()
+        keep = game.assets.get("expl_laser_keep")
+        if keep:
+            frames = frames[:keep]
+        x, y = self.hit_pos()
+        game.explosion_manager.add_explosion(x, y, frames, fps=fps)
+
+    def hit_pos(self):
+        return (int(self.x + self.dx * self.length), int(self.y + self.dy * self.length))
+
+    def draw(self, screen):
+        if self.length <= 0:
+            return
+        sprite = _beam_sprite(self.img, self.width, self.length, self.angle_deg)
+        # Sprite ist auf LENGTH_STEP gerundet -> an der Mündung ausrichten,
+        # der Überstand liegt im Ziel (Gegner werden danach gezeichnet)
+        q   = _quantize(self.length)
+        mid = (self.x + self.dx * q / 2, self.y + self.dy * q / 2)
+        screen.blit(sprite, sprite.get_rect(center=(int(mid[0]), int(mid[1]))))
+
+    @staticmethod
+    def play_start_sound(assets):
+        snd = assets.get("laser_sound_start")
+        if snd:
+            snd.set_volume(MASTER_VOLUME * SFX_VOLUME)
+            snd.play()
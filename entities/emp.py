@@ -1,4 +1,3 @@
-import math
 import pygame
 from config import WIDTH, HEIGHT
 from config.weapon import EMP_CONFIG
@@ -69,6 +68,11 @@ class EMPPulseWave:
         # Betroffene Entitäten verfolgen (für einmalige Effekte)
         self.affected_entities = set()
 
+        # Gegner nach Distanz² zum Zentrum sortiert (beim ersten Update gebaut);
+        # der Zeiger wandert mit dem Radius -> pro Tick nur der Ring [r_alt, r_neu]
+        self._sweep      = None
+        self._sweep_next = 0
+
         # Animation
         self.current_frame = 0
         self.animation_timer = 0
@@ -101,47 +105,58 @@ class EMPPulseWave:
         # 4. Fertig wenn Zeit abgelaufen
         return self.timer < self.duration
 
+    def _build_sweep(self, game):
+        """Sortiert alle Gegner einmal nach Distanz² zum EMP-Zentrum"""
+        px, py = self.position
+        items = []
+        for group in (game.enemies, game.fly_in_enemies):
+            for enemy in group:
+                dx = enemy.rect.centerx - px
+                dy = enemy.rect.centery - py
+                items.append((dx*dx + dy*dy, enemy))
+        items.sort(key=lambda item: item[0])  # stabil: gleiche Distanz in Listen-Reihenfolge
+        self._sweep = items
+
     def apply_emp_collision_detection(self, game):
         """EMP-Kollisionserkennung für Gegner und Projektile"""
         emp_radius = self.current_diameter / 2
-
-        # Alle Gegner-Listen sammeln
-        all_enemies = []
-        if hasattr(game, 'enemies'):
-            all_enemies.extend(game.enemies)
-        if hasattr(game, 'fly_in_enemies'):
-            all_enemies.extend(game.fly_in_enemies)
-
-        # Gegner-Effekte für ALLE Gegner
-        for enemy in all_enemies:
-            # Distanz zum EMP-Zentrum prüfen (verwende rect.center für korrekte Position)
-            dx = enemy.rect.centerx - self.position[0]
-            dy = enemy.rect.centery - self.position[1]
-            distance = math.sqrt(dx*dx + dy*dy)
-
-            # Wenn in Reichweite, EMP-Effekt anwenden
-            if distance <= emp_radius:
-                # Verhindere mehrfache Anwendung auf denselben Gegner
-                if enemy not in self.affected_entities:
-                    enemy.apply_emp_effect()
-                    self.affected_entities.add(enemy)
-
-        # Projektile-Effekte (verwende enemy_shots, nicht enemy_projectiles)
-        if hasattr(game, 'enemy_shots'):
-            for projectile in game.enemy_shots[:]:  # Copy for safe removal
-                dx = projectile.rect.centerx - self.position[0]
-                dy = projectile.rect.centery - self.position[1]
-                distance = math.sqrt(dx*dx + dy*dy)
-
-                if distance <= emp_radius:
-                    # Laser/Blaster verschwinden sofort
-                    if projectile.kind in ['laser', 'blaster']:
-                        game.enemy_shots.remove(projectile)
-                    # Raketen explodieren bei EMP-Kontakt
-                    elif projectile.kind in ['rocket', 'homing_rocket']:
-                        # Triggere Explosion an der Projektilposition
-                        projectile.on_hit(game, projectile.rect.center)
-                        game.enemy_shots.remove(projectile)
+        r2 = emp_radius * emp_radius
+
+        # Gegner: nur der Ring seit dem letzten Tick, jeder Gegner genau einmal
+        # (O(betroffene) über die ganze Welle; Distanz = Position beim Auslösen)
+        if self._sweep is None:
+            self._build_sweep(game)
+        sweep = self._sweep
+        i, n = self._sweep_next, len(sweep)
+        while i < n and sweep[i][0] <= r2:
+            enemy = sweep[i][1]
+            # O(1): zwischenzeitlich zerstörte Gegner überspringen
+            if enemy in game.enemies or enemy in game.fly_in_enemies:
+                enemy.apply_emp_effect()
+                self.affected_entities.add(enemy)
+            i += 1
+        self._sweep_next = i
+
+        # Gegner-Projektile bewegen sich und entstehen laufend neu -> ein d²-Durchgang pro Tick,
+        # Entfernen über den ProjectileManager (O(1) je Schuss)
+        pm = game.projectile_manager
+        px, py = self.position
+        for projectile in pm.enemy_shots:
+            kind = projectile.kind
+            if kind not in ('laser', 'blaster', 'rocket', 'homing_rocket'):
+                continue
+            cx, cy = projectile.rect.center
+            if (cx - px)**2 + (cy - py)**2 > r2:
+                continue
+            # Raketen explodieren bei EMP-Kontakt, Laser/Blaster verschwinden sofort
+            if kind in ('rocket', 'homing_rocket'):
+                projectile.on_hit(game, projectile.rect.center)
+            pm.remove_shot(projectile)
+
+        # Kugeln der Bullet-Patterns verschwinden wie Laser (vektorisiert pro Salve)
+        emitters = getattr(game, "emitter_manager", None)
+        if emitters is not None:
+            emitters.clear_circle(self.position, r2)
 
     def apply_emp_to_enemy(self, enemy):
         """Wende EMP-Effekte auf einen einzelnen Gegner an"""
@@ -2,8 +2,11 @@
 import math, random, pygame
 from config import WIDTH, HEIGHT
 from config.enemy import ENEMY_CONFIG
+from config.patterns import PATTERN_CONFIG
+from system.mask_bank import mask_bank
 
 from entities.projectile import Laser, Rocket, Nuke, Blaster, HomingRocket
+from entities.weapon_spec import weapon_spec
 
 KIND2CLS = {"laser": Laser, "rocket": Rocket, "nuke": Nuke, "blaster": Blaster, "homing_rocket": HomingRocket}
 
@@ -53,6 +56,11 @@ class Enemy:
             raw = pygame.image.load(self.cfg["img"]).convert_alpha()
             self.img = pygame.transform.smoothscale(raw, self.cfg["size"])
 
+        # Kollisionsmaske (vorab beim Asset-Laden gebaut)
+        self.mask = assets.get(f"enemy_{etype}_mask")
+        if self.mask is None:
+            self.mask = mask_bank.surface_mask(self.img)
+
         # Stats
         self.max_hp = int(self.cfg["hp"])
         self.hp     = int(self.cfg["hp"])
@@ -73,6 +81,10 @@ class Enemy:
         self.weapons = _norm_weapons(self.cfg.get("weapons", {"laser": 1}))
         self._last   = {w: 0 for w in self.weapons.keys()}
 
+        # Bullet-Patterns (gefeuert vom EmitterManager) + Cooldowns
+        self.patterns = [p for p in self.cfg.get("patterns", ()) if p in PATTERN_CONFIG]
+        self._pattern_last = {p: 0 for p in self.patterns}
+
         # HP-Bar Timer
         self._show_hp_until = 0
         
@@ -187,18 +199,15 @@ class Enemy:
 
     # --- Schießen (nur shoot_weapon) ---
     def shoot_weapon(self, weapon: str, amount: int = 1):
-        import pygame, random
-        from config.weapon import PROJECTILES_CONFIG
-
         # EMP-Check: Kann nicht schießen wenn EMP-disabled
         if not self.can_shoot:
             return []
 
         # 1) Cooldown check
-        now = pygame.time.get_ticks()
-        cd  = PROJECTILES_CONFIG[weapon]["cooldown"]
+        now  = pygame.time.get_ticks()
+        spec = weapon_spec(weapon, "enemy", self.etype, self.assets)
         last = self._last.get(weapon, 0)
-        if now - last < cd:
+        if now - last < spec.cooldown:
             return []
 
         # 2) Probability check (aus ENEMY_CONFIG)
@@ -210,26 +219,26 @@ class Enemy:
         if prob <= 0.0 or random.random() >= prob:
             return []
 
-        # 3) Winkel anwenden
-        angles = self.cfg.get("angle", {}).get(weapon, []) or [0]
-        cls = KIND2CLS[weapon]
-        shots = []
-        use_amt = max(1, int(amount))
-        for i in range(use_amt):
-            ang = angles[i % len(angles)]
-            shots.append(
-                cls.create(
-                    self.rect.centerx,
-                    self.rect.bottom,
-                    self.assets,
-                    owner="enemy",
-                    angle_deg=ang
-                )
-            )
+        # 3) Alle Schüsse von der Unterkante, Winkel aus der kompilierten Spec
+        shots = spec.fire(KIND2CLS[weapon], self.rect.centerx, self.rect.bottom, amount)
 
         self._last[weapon] = now
         return shots
 
+    def trigger_pattern(self, name: str) -> bool:
+        """Cooldown + Chance eines Bullet-Patterns; True = EmitterManager soll es starten"""
+        if not self.can_shoot:
+            return False
+        cfg = PATTERN_CONFIG[name]
+        now = pygame.time.get_ticks()
+        if now - self._pattern_last.get(name, 0) < cfg.get("cooldown_ms", 0):
+            return False
+        prob = float(cfg.get("prob", 1.0))
+        if prob <= 0.0 or random.random() >= prob:
+            return False
+        self._pattern_last[name] = now
+        return True
+
     def offscreen(self):
         # Für fly_in Enemies: vollständige Bildschirmrand-Prüfung mit aktueller Bildschirmgröße
         if self.move_cfg.get("type") == "fly_in":
@@ -1,8 +1,8 @@
 # entities/player.py
 import pygame
 from config.ship import SHIP_CONFIG
-from config.weapon import PROJECTILES_CONFIG
 from entities.projectile import Laser, Rocket, Nuke, HomingRocket, Blaster, DoubleLaser
+from entities.weapon_spec import weapon_spec, stage_weapons
 
 WEAPON_CLS = {"laser": Laser, "rocket": Rocket, "homing_rocket": HomingRocket, "nuke": Nuke, "blaster": Blaster}
 
@@ -33,34 +33,13 @@ class Player:
 
         self.tilt_deg = 0.0   # aktueller Winkel
         self.tilt_dir = 0     # -1, 0, +1
+        self._arm()
 
     # Hilfen
-    def _muzzles(self, weapon: str, amount: int):
-        cfg = SHIP_CONFIG[self.stage]
-        cx, top = self.rect.centerx, self.rect.top
-        offs = (cfg.get("muzzles", {}).get(weapon, []) or [(0, 6)]).copy()
-        # falls zu wenig Offsets, zyklisch auffüllen
-        i = 0
-        out = []
-        while len(out) < amount:
-            dx, dy = offs[i % len(offs)]
-            out.append((cx + dx, top + dy))
-            i += 1
-        return out[:amount]
-
-    def _angles(self, weapon: str, amount: int):
-        angs = SHIP_CONFIG[self.stage].get("angle", {}).get(weapon, []) or [0]
-        i = 0
-        out = []
-        while len(out) < amount:
-            out.append(angs[i % len(angs)])
-            i += 1
-
-        return out[:amount]
-
-    def _stage_weapons(self):
-        w = SHIP_CONFIG[self.stage]["weapons"]
-        return {k: 1 for k in w} if isinstance(w, list) else dict(w)
+    def _arm(self):
+        """Kompilierte Waffen der aktuellen Stage: Waffe -> (Projektil-Klasse, WeaponSpec)"""
+        self._armory = {w: (WEAPON_CLS[w], weapon_spec(w, "player", self.stage, self.assets))
+                        for w, amount in stage_weapons(self.stage).items() if amount > 0 and w in WEAPON_CLS}
 
     # API
     def set_stage(self, stage: int):
@@ -83,6 +62,7 @@ class Player:
         self.base_img = img
         self.rect = self.base_img.get_rect(center=center)
         self._last_shots.clear()
+        self._arm()
 
     def handle_input(self, keys, width, height):
         hdir = 0
@@ -106,22 +86,24 @@ class Player:
 
     def shoot_weapon(self, weapon: str, amount: int = None):
         # Stage-Gate
-        allowed = self._stage_weapons().get(weapon, 0)
-        if allowed <= 0:
+        armed = self._armory.get(weapon)
+        if armed is None:
+            return []
+        cls, spec = armed
+        now = pygame.time.get_ticks()
+        if now - self._last_shots.get(weapon, 0) < spec.cooldown:
             return []
-        shots, now = [], pygame.time.get_ticks()
-        cfg = PROJECTILES_CONFIG[weapon]
-        last = self._last_shots.get(weapon, 0)
-        if now - last < cfg["cooldown"]:
-            return shots
-        amount = max(1, amount if amount is not None else allowed)
-        coords = self._muzzles(weapon, amount)
-        angles = self._angles(weapon, amount)
-        for (mx, my), ang in zip(coords, angles):
-            shots.append(WEAPON_CLS[weapon].create(mx, my, self.assets, owner="player", angle_deg=ang))
+        shots = spec.fire(cls, self.rect.centerx, self.rect.top, amount)
         self._last_shots[weapon] = now
         return shots
 
+    def aim_points(self, weapon: str):
+        """((x, y), Winkel) aller Läufe einer Waffe (Stage-Gate, ohne Cooldown) - für Beams"""
+        armed = self._armory.get(weapon)
+        if armed is None:
+            return []
+        cx, top = self.rect.centerx, self.rect.top
+        return [((cx + dx, top + dy), ang) for dx, dy, ang, _, _ in armed[1].barrels]
 
     def draw(self, screen):
         img = self.base_img
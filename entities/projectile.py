@@ -1,11 +1,33 @@
 import math, pygame
 from config import WIDTH, HEIGHT, MASTER_VOLUME, MUSIC_VOLUME, SFX_VOLUME
-from config.weapon import PROJECTILES_CONFIG
 from entities.explosion import Explosion
+from system.rotation_cache import rotation_cache
+from entities.weapon_spec import weapon_spec
 
 def _expl_frames(game, key):
     return game.assets.get(key, []), game.assets.get(f"{key}_fps", 24)
 
+def _particles(game, effect, x, y, direction=None):
+    """Partikel-Effekt aus config/particles.py (ohne ParticleManager nichts)"""
+    particles = getattr(game, "particle_manager", None)
+    if particles is not None:
+        particles.emit(effect, x, y, direction)
+
+def _aoe_targets(game, cx, cy, radius):
+    """Alle Gegner im Radius als (enemy, dist) - über den Spatial Hash oder per Brute-Force"""
+    if getattr(game, "use_spatial_hash", False):
+        return [(en, dist) for en, dist in game.enemy_grid.query_radius(cx, cy, radius) if en.hp > 0]
+    targets = []
+    for group in (game.enemies, getattr(game, "fly_in_enemies", ())):
+        for en in group:
+            if en.hp <= 0:  # im selben Resolve-Pass schon zerstört, aber noch registriert
+                continue
+            ex, ey = en.rect.center
+            dist   = math.hypot(ex - cx, ey - cy)
+            if dist <= radius:
+                targets.append((en, dist))
+    return targets
+
 def _apply_aoe(
     game,
     cx:          int,
@@ -17,97 +39,52 @@ def _apply_aoe(
     weapon_type: str | None = None
 ) -> int:
     """
-    Wendet Area-of-Effect Schaden an und erstellt IMMER Explosionen für JEDEN getroffenen Gegner.
-    
+    Wendet Area-of-Effect Schaden an und erstellt IMMER Explosionen für JEDEN getöteten Gegner.
+
+    Ablauf im Batch: eine Radius-Abfrage, dann Schaden, danach Score/Drops/Explosionen
+    für alle Toten und zum Schluss ein einziger Kompaktierungs-Durchgang der Gegner-Listen.
+
     Returns:
         Anzahl der getroffenen Gegner
     """
+    if radius <= 0:
+        return 0
     frames, fps = _expl_frames(game, expl_key)
-    enemies_hit = 0
 
-    # ===== Normale Feinde =====
-    for en in game.enemies[:]:  # [:] erstellt Kopie der Liste
-        ex, ey = en.rect.center
-        dist   = math.hypot(ex - cx, ey - cy)
-        
-        if dist <= radius:
-            dmg = int(max_damage * (1 - dist / radius))
-            
-            if dmg > 0:
-                enemies_hit += 1
-                is_dead = en.take_damage(dmg)
-                
-                if is_dead:
-                    # Gegner ist tot - Score, PowerUp, Explosion
-                    game.score     = game.score + en.points
-                    game.highscore = max(game.highscore, game.score)
-                    
-                    if hasattr(game, '_total_kills'):
-                        game._total_kills += 1
-                    
-                    # Weapon-Statistik: Kill registrieren
-                    if weapon_type:
-                        game.explosion_manager.register_enemy_death(weapon_type)
-                    
-                    game._try_drop_powerup(ex, ey)
-                    
-                    # EXPLOSION GARANTIERT!
-                    game.explosion_manager.add_explosion(
-                        x           = ex,
-                        y           = ey,
-                        frames      = frames,
-                        fps         = fps,
-                        scale       = expl_scale,
-                        weapon_type = weapon_type
-                    )
-                    
-                    # Gegner aus Liste entfernen
-                    if en in game.enemies:
-                        game.enemies.remove(en)
-
-    # ===== Fly-In Feinde =====
-    if hasattr(game, 'fly_in_enemies'):
-        for en in game.fly_in_enemies[:]:  # [:] erstellt Kopie
+    # ===== Normale + Fly-In Feinde =====
+    hits = []
+    for en, dist in _aoe_targets(game, cx, cy, radius):
+        dmg = int(max_damage * (1 - dist / radius))
+        if dmg > 0:
+            hits.append((en, dmg))
+    enemies_hit = len(hits)
+    dead = [en for en, dmg in hits if en.take_damage(dmg)]
+
+    if dead:
+        # Score einmal für alle Toten
+        game.score     = game.score + sum(en.points for en in dead)
+        game.highscore = max(game.highscore, game.score)
+        if hasattr(game, '_total_kills'):
+            game._total_kills += len(dead)
+
+        for en in dead:
             ex, ey = en.rect.center
-            dist   = math.hypot(ex - cx, ey - cy)
-            
-            if dist <= radius:
-                dmg = int(max_damage * (1 - dist / radius))
-                
-                if dmg > 0:
-                    enemies_hit += 1
-                    is_dead = en.take_damage(dmg)
-                    
-                    if is_dead:
-                        # Gegner ist tot
-                        game.score     = game.score + en.points
-                        game.highscore = max(game.highscore, game.score)
-                        
-                        if hasattr(game, '_total_kills'):
-                            game._total_kills += 1
-                        
-                        # Weapon-Statistik: Kill registrieren
-                        if weapon_type:
-                            game.explosion_manager.register_enemy_death(weapon_type)
-                        
-                        game._try_drop_powerup(ex, ey)
-                        
-                        # EXPLOSION GARANTIERT!
-                        game.explosion_manager.add_explosion(
-                            x           = ex,
-                            y           = ey,
-                            frames      = frames,
-                            fps         = fps,
-                            scale       = expl_scale,
-                            weapon_type = weapon_type
-                        )
-                        
-                        # Aus Liste entfernen
-                        if en in game.fly_in_enemies:
-                            game.fly_in_enemies.remove(en)
-                            
-                            if hasattr(game, '_fly_in_spawn_count'):
-                                game._fly_in_spawn_count = max(0, game._fly_in_spawn_count - 1)
+            # Weapon-Statistik: Kill registrieren
+            if weapon_type:
+                game.explosion_manager.register_enemy_death(weapon_type)
+            game._try_drop_powerup(ex, ey)
+            # EXPLOSION GARANTIERT!
+            game.explosion_manager.add_explosion(
+                x           = ex,
+                y           = ey,
+                frames      = frames,
+                fps         = fps,
+                scale       = expl_scale,
+                weapon_type = weapon_type
+            )
+
+        # Tote Gegner in einem Durchgang aus den Listen entfernen
+        game.remove_enemies(dead)
 
     # ===== Boss (falls vorhanden) =====
     if getattr(game, "boss", None):
@@ -146,12 +123,73 @@ def _apply_aoe(
 
     return enemies_hit
 
+def _steer(shot, tx, ty, min_angle=None) -> bool:
+    """
+    Mischt die Flugrichtung zum Ziel (tx, ty), höchstens min(homing_strength, max_turn_rate).
+    Unter min_angle (rad) Abweichung geradeaus; bei Abstand 0 bleibt vx/vy unverändert.
+    Gleiche Regeln wie system.homing.steer_batch. True wenn die Richtung korrigiert wurde.
+    """
+    mx, my = shot.rect.center
+    target_dx, target_dy = tx - mx, ty - my
+    target_dist = math.hypot(target_dx, target_dy)
+    if target_dist <= 0:
+        return False
+
+    # Normalisierte Zielrichtung
+    target_dir_x = target_dx / target_dist
+    target_dir_y = target_dy / target_dist
+    dir_x, dir_y = shot._dir
+    if min_angle is not None and abs(math.atan2(target_dir_y, target_dir_x) - math.atan2(dir_y, dir_x)) <= min_angle:
+        # Geradeaus wenn Richtung passt
+        shot.vx = dir_x * shot._speed
+        shot.vy = dir_y * shot._speed
+        return False
+
+    # Aktuelle Richtung mit Zielrichtung mischen und normalisieren
+    blend_factor = min(shot.homing_strength, shot.max_turn_rate)
+    new_dir_x = dir_x + (target_dir_x - dir_x) * blend_factor
+    new_dir_y = dir_y + (target_dir_y - dir_y) * blend_factor
+    new_dir_len = math.hypot(new_dir_x, new_dir_y)
+    if new_dir_len <= 0:
+        return False
+    shot._dir = (new_dir_x / new_dir_len, new_dir_y / new_dir_len)
+    shot.vx = shot._dir[0] * shot._speed
+    shot.vy = shot._dir[1] * shot._speed
+    return True
+
 class Projectile:
-    __slots__ = ("img","rect","vx","vy","dmg","owner","radius","kind","accel","_dir","_speed")
+    __slots__ = ("img","rect","vx","vy","dmg","owner","radius","kind","accel","_dir","_speed","eid","prev_x","prev_y","_si","born")
+
+    # Free-Listen pro Kind (ProjectileManager): spawn() nimmt freie Objekte statt neu zu bauen
+    pool = None
+    # Schlüssel der kompilierten WeaponSpec für create()
+    weapon = None
 
     def __init__(self, x, y, vx, vy, img, dmg, owner="player", radius=0, kind="generic", accel=1.0):
+        self.rect = None
+        self.reset(x, y, vx, vy, img, dmg, owner, radius, kind, accel)
+
+    @classmethod
+    def create(cls, x, y, assets, owner="player", angle_deg=0):
+        """Ein Schuss der Waffe cls.weapon über die kompilierte WeaponSpec (Sound, Bild, Tempo)"""
+        return weapon_spec(cls.weapon, owner, None, assets).shoot(cls, x, y, angle_deg)
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        """Wie cls(...), aber aus dem Pool (reset statt Konstruktion), falls einer gesetzt ist"""
+        pool = Projectile.pool
+        if pool is None:
+            return cls(*args, **kwargs)
+        return pool.acquire(cls, *args, **kwargs)
+
+    def reset(self, x, y, vx, vy, img, dmg, owner="player", radius=0, kind="generic", accel=1.0):
+        """Setzt den kompletten Zustand neu (Konstruktor und Wiederverwendung aus dem Pool)"""
         self.img   = img
-        self.rect  = img.get_rect(center=(x, y))
+        if self.rect is None:
+            self.rect = img.get_rect(center=(x, y))
+        else:
+            self.rect.size   = img.get_size()
+            self.rect.center = (x, y)
         self.vx    = float(vx)
         self.vy    = float(vy)
         self.dmg   = int(dmg)
@@ -164,33 +202,41 @@ class Projectile:
             self._dir = (0.0, -1.0); self._speed = 0.0
         else:
             self._dir = (self.vx/sp, self.vy/sp); self._speed = sp
+        # Startpunkt des Pfads seit dem letzten Kollisionsdurchgang (Swept-Kollision)
+        self.prev_x, self.prev_y = self.rect.topleft
+        self._si = -1  # Spalte im SoA-Backend des ProjectileManagers (-1 = Objekt-Physik)
+        self.born = 0.0  # Physik-Zeit in ms beim Hinzufügen (ProjectileManager, für TTL)
 
     def physics_update(self, game):
         """Fixed timestep physics update"""
+        # Werte sind auf 60 Hz normiert, bei niedrigerer PHYSICS_HZ größere Schritte
+        k = game.physics_step_scale
         if self.accel != 1.0:
-            self._speed *= self.accel
+            self._speed *= self.accel if k == 1.0 else self.accel ** k
             self.vx = self._dir[0] * self._speed
             self.vy = self._dir[1] * self._speed
             
-        # Da wir fixen Timestep haben (z.B. 1/120), müssen wir nicht mehr mit dt multiplizieren
-        self.rect.x += int(self.vx)
-        self.rect.y += int(self.vy)
+        # Da wir fixen Timestep haben, müssen wir nicht mehr mit dt multiplizieren
+        self.rect.x += int(self.vx * k)
+        self.rect.y += int(self.vy * k)
     
     def update(self):
         """Legacy update - sollte nicht mehr für Bewegung verwendet werden"""
         pass
 
-    def offscreen(self):
-        # Verwende aktuelle Bildschirmgröße statt Konstanten
-        screen = pygame.display.get_surface()
-        if screen:
-            current_width, current_height = screen.get_size()
-            return (self.rect.right < 0 or self.rect.left > current_width or
-                    self.rect.bottom < 0 or self.rect.top > current_height)
-        else:
-            # Fallback zu Konstanten falls kein Screen verfügbar
-            return (self.rect.right < 0 or self.rect.left > WIDTH or
-                    self.rect.bottom < 0 or self.rect.top > HEIGHT)
+    def offscreen(self, bounds=None):
+        """
+        Außerhalb von bounds (left, top, right, bottom) und auf dem Weg nach draußen?
+        Ohne bounds wird der aktuelle Bildschirm ohne Rand benutzt.
+        """
+        if bounds is None:
+            screen = pygame.display.get_surface()
+            w, h   = screen.get_size() if screen else (WIDTH, HEIGHT)
+            bounds = (0, 0, w, h)
+        left, top, right, bottom = bounds
+        r = self.rect
+        return ((r.right < left and self.vx <= 0) or (r.left > right and self.vx >= 0) or
+                (r.bottom < top and self.vy <= 0) or (r.top > bottom and self.vy >= 0))
 
     def draw(self, screen):
         screen.blit(self.img, self.rect)
@@ -199,26 +245,8 @@ class Projectile:
         pass
 
 class Laser(Projectile):
-    kind = "laser"
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg    = PROJECTILES_CONFIG["laser"]
-        speed  = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel  = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base   = -1 if owner=="player" else +1
-        rad    = math.radians(angle_deg)
-        vx     =  speed * math.sin(rad)
-        vy     =  base  * speed * math.cos(rad)
-        # Unterschiedliche Bilder für Player und Enemy
-        if owner == "enemy":
-            img = assets["laser_yellow_img"]  # Gelbe Version für Enemies
-        else:
-            img = assets["laser_img"]         # Normale Version für Player
-
-        if owner=="player" and assets.get("laser_sound_start"):
-            assets["laser_sound_start"].set_volume(MASTER_VOLUME * SFX_VOLUME)
-            assets["laser_sound_start"].play()
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, radius=0, kind="laser", accel=accel)
+    __slots__ = ()
+    weapon = "laser"
 
     def on_hit(self, game, hit_pos):
         frames, fps = _expl_frames(game, "expl_laser")
@@ -232,24 +260,8 @@ class Laser(Projectile):
         game.explosion_manager.add_explosion(hit_pos[0], hit_pos[1], frames, fps=fps)
 
 class DoubleLaser(Projectile):
-    kind = "double_laser"
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg    = PROJECTILES_CONFIG["laser"]  # Verwende normale Laser-Konfiguration
-        speed  = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel  = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base   = -1 if owner=="player" else +1
-        rad    = math.radians(angle_deg)
-        vx     =  speed * math.sin(rad)
-        vy     =  base  * speed * math.cos(rad)
-
-        # Double Laser Bild
-        img = assets.get("double_laser_img", assets.get("laser_img"))  # Fallback auf normalen Laser
-
-        if owner=="player" and assets.get("laser_sound_start"):
-            assets["laser_sound_start"].set_volume(MASTER_VOLUME * SFX_VOLUME)
-            assets["laser_sound_start"].play()
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, kind="double_laser", accel=accel)
+    __slots__ = ()
+    weapon = "double_laser"
 
     def on_hit(self, game, hit_pos):
         frames, fps = _expl_frames(game, "expl_laser")
@@ -262,32 +274,16 @@ class DoubleLaser(Projectile):
         game.explosion_manager.add_explosion(hit_pos[0], hit_pos[1], frames, fps=fps)
 
 class Rocket(Projectile):
-    kind = "rocket"
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg    = PROJECTILES_CONFIG["rocket"]
-        speed  = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel  = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base   = -1 if owner=="player" else +1
-        rad    = math.radians(angle_deg)
-        vx     =  speed * math.sin(rad)
-        vy     =  base  * speed * math.cos(rad)
-        img    = assets["rocket_img"]
-        if owner=="player" and assets.get("rocket_sound_start"):
-            assets["rocket_sound_start"].set_volume(MASTER_VOLUME * SFX_VOLUME)
-            assets["rocket_sound_start"].play()
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, radius=cfg.get("radius",0), kind="rocket", accel=accel)
+    __slots__ = ()
+    weapon = "rocket"
 
     def draw(self, screen):
         # Raketen rotieren basierend auf ihrer Bewegungsrichtung
         angle_rad = math.atan2(-self.vx, -self.vy)  # Beide negativ für korrekte Orientierung
         angle_deg = math.degrees(angle_rad)
 
-        # Rakete rotieren
-        rotated_img = pygame.transform.rotate(self.img, angle_deg)
-        rotated_rect = rotated_img.get_rect(center=self.rect.center)
-
-        screen.blit(rotated_img, rotated_rect)
+        # Vorgedrehtes Sprite zum nächstgelegenen Rasterwinkel
+        rotation_cache.blit(screen, self.img, angle_deg, self.rect.center)
 
     def on_hit(self, game, hit_pos):
         cx, cy = hit_pos
@@ -299,12 +295,22 @@ class Rocket(Projectile):
         # Haupt-Explosion
         frames, fps = _expl_frames(game, "expl_rocket")
         game.explosion_manager.add_explosion(cx, cy, frames, fps=fps, scale=1.6, weapon_type="rocket")  # Größere Hauptexplosion
+        _particles(game, "spark", cx, cy)
+        _particles(game, "debris", cx, cy)
 
 class Blaster(Projectile):
-    kind = "blaster"
+    __slots__ = ("homing", "homing_strength", "max_turn_rate", "launch_time", "homing_delay",
+                 "homing_duration", "current_target", "target_lost_time",
+                 "max_course_corrections", "course_corrections")
+
+    weapon          = "blaster"
+    min_steer_angle = 0.1  # Lenkt nur bei deutlichem Richtungsunterschied (rad)
 
     def __init__(self, x, y, vx, vy, img, dmg, owner="enemy", radius=0, kind="blaster", accel=1.0):
         super().__init__(x, y, vx, vy, img, dmg, owner, radius, kind, accel)
+
+    def reset(self, x, y, vx, vy, img, dmg, owner="enemy", radius=0, kind="blaster", accel=1.0):
+        super().reset(x, y, vx, vy, img, dmg, owner, radius, kind, accel)
         self.homing = True
         self.homing_strength  = 0.12  # Noch schwächere Lenkung
         self.max_turn_rate    = 0.06  # Sehr begrenzte Wendegeschwindigkeit
@@ -316,53 +322,22 @@ class Blaster(Projectile):
         self.max_course_corrections = 10  # Maximal 8 Richtungsänderungen
         self.course_corrections = 0
 
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg = PROJECTILES_CONFIG["blaster"]
-        speed = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base = -1 if owner=="player" else +1
-        rad = math.radians(angle_deg)
-        vx = speed * math.sin(rad)
-        vy = base * speed * math.cos(rad)
-
-        # Blaster-Bild verwenden
-        img = assets["blaster_img"]
-
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, radius=0, kind="blaster", accel=accel)
-
     def _find_nearest_target(self, game):
         """Findet das nächste Ziel für Blaster"""
         if self.owner == "player":
-            # Player-Blaster suchen Enemies - alle Listen prüfen
-            all_enemies = []
-
-            # Normale Enemies
-            if hasattr(game, 'enemies') and game.enemies:
-                all_enemies.extend(game.enemies)
-
-            # Fly-in Enemies
-            if hasattr(game, 'fly_in_enemies') and game.fly_in_enemies:
-                all_enemies.extend(game.fly_in_enemies)
-
-            # Boss
-            if hasattr(game, 'boss') and game.boss:
-                all_enemies.append(game.boss)
-
-            if not all_enemies:
-                return None
-
-            closest_enemy = None
-            closest_dist = float('inf')
+            # Player-Blaster suchen Enemies - über den Ziel-Index des Games
             mx, my = self.rect.center
+            closest_enemy = game.enemy_grid.nearest(mx, my)
 
-            for enemy in all_enemies:
-                if hasattr(enemy, 'rect'):
-                    ex, ey = enemy.rect.center
-                    dist = math.hypot(ex - mx, ey - my)
-                    if dist < closest_dist:
-                        closest_dist = dist
-                        closest_enemy = enemy
+            # Boss
+            boss = getattr(game, 'boss', None)
+            if boss:
+                bx, by = boss.rect.center
+                if closest_enemy is None:
+                    return boss
+                ex, ey = closest_enemy.rect.center
+                if math.hypot(bx - mx, by - my) < math.hypot(ex - mx, ey - my):
+                    return boss
 
             return closest_enemy
         elif self.owner == "enemy":
@@ -374,94 +349,42 @@ class Blaster(Projectile):
     def _is_target_valid(self, target, game):
         """Prüft ob das Ziel noch gültig ist"""
         if self.owner == "player":
-            # Prüfe alle Enemy-Listen
-            all_enemies = []
-            if hasattr(game, 'enemies'):
-                all_enemies.extend(game.enemies)
-            if hasattr(game, 'fly_in_enemies'):
-                all_enemies.extend(game.fly_in_enemies)
-            if hasattr(game, 'boss') and game.boss:
-                all_enemies.append(game.boss)
-            return target in all_enemies
+            # O(1): lebende Gegner stehen im Ziel-Index
+            if target is None:
+                return False
+            return target in game.enemy_grid or target is getattr(game, 'boss', None)
         elif self.owner == "enemy":
             return target == getattr(game, 'player', None) and not getattr(game, 'player_dead', False)
         return False
 
+    def homing_target(self, game, now):
+        """Ziel für diesen Frame oder None (geradeaus: Startverzögerung, Lenkzeit/Korrekturen aufgebraucht, kein Ziel)"""
+        time_since_launch = now - self.launch_time
+        # Kurze Verzögerung vor Lenkbeginn, Lenkung nur für begrenzte Zeit und begrenzte Korrekturen
+        if (time_since_launch < self.homing_delay or
+                time_since_launch >= self.homing_delay + self.homing_duration or
+                self.course_corrections >= self.max_course_corrections):
+            return None
+        # Aktuelles Ziel prüfen, sonst neues suchen
+        if self._is_target_valid(self.current_target, game):
+            return self.current_target
+        target = self._find_nearest_target(game)
+        if target:
+            self.current_target = target
+        return target or None
+
     def update(self, game=None):
         # Normale Beschleunigung
         if self.accel != 1.0:
             self._speed *= self.accel
 
-        # Lenkung für alle Blaster (Player und Enemy)
-        if self.homing and game:
-            now = pygame.time.get_ticks()
-
-            # Prüfe ob Lenkung noch aktiv sein soll
-            time_since_launch = now - self.launch_time
-
-            # Kurze Verzögerung vor Lenkbeginn
-            if time_since_launch < self.homing_delay:
-                self.vx = self._dir[0] * self._speed
-                self.vy = self._dir[1] * self._speed
-            # Lenkung nur für begrenzte Zeit und begrenzte Korrekturen
-            elif (time_since_launch < self.homing_delay + self.homing_duration and
-                  self.course_corrections < self.max_course_corrections):
-
-                target = None
-
-                # Aktuelles Ziel prüfen
-                if self._is_target_valid(self.current_target, game):
-                    target = self.current_target
-                else:
-                    # Neues Ziel suchen
-                    target = self._find_nearest_target(game)
-                    if target:
-                        self.current_target = target
-
-                if target:
-                    # Richtung zum Player berechnen
-                    tx, ty = target.rect.center
-                    mx, my = self.rect.center
-                    target_dx = tx - mx
-                    target_dy = ty - my
-                    target_dist = math.hypot(target_dx, target_dy)
-
-                    if target_dist > 0:
-                        # Normalisierte Zielrichtung
-                        target_dir_x = target_dx / target_dist
-                        target_dir_y = target_dy / target_dist
-
-                        # Prüfe ob eine Richtungsänderung nötig ist
-                        angle_diff = abs(math.atan2(target_dir_y, target_dir_x) - math.atan2(self._dir[1], self._dir[0]))
-                        if angle_diff > 0.1:  # Nur bei signifikantem Richtungsunterschied
-                            # Sanfte Lenkung - sehr schwach
-                            blend_factor = min(self.homing_strength, self.max_turn_rate)
-                            new_dir_x = self._dir[0] + (target_dir_x - self._dir[0]) * blend_factor
-                            new_dir_y = self._dir[1] + (target_dir_y - self._dir[1]) * blend_factor
-
-                            # Richtung normalisieren
-                            new_dir_len = math.hypot(new_dir_x, new_dir_y)
-                            if new_dir_len > 0:
-                                self._dir = (new_dir_x / new_dir_len, new_dir_y / new_dir_len)
-                                self.vx = self._dir[0] * self._speed
-                                self.vy = self._dir[1] * self._speed
-                                self.course_corrections += 1  # Korrekturen zählen
-                        else:
-                            # Geradeaus wenn Richtung passt
-                            self.vx = self._dir[0] * self._speed
-                            self.vy = self._dir[1] * self._speed
-                else:
-                    # Kein Ziel -> geradeaus
-                    self.vx = self._dir[0] * self._speed
-                    self.vy = self._dir[1] * self._speed
-            else:
-                # Nach Homing-Zeit oder max Korrekturen -> geradeaus
-                self.vx = self._dir[0] * self._speed
-                self.vy = self._dir[1] * self._speed
-        else:
-            # Kein Game-Context -> geradeaus
+        # Lenkung für alle Blaster (Player und Enemy), nur bei deutlicher Richtungsabweichung
+        target = self.homing_target(game, pygame.time.get_ticks()) if self.homing and game else None
+        if target is None:
             self.vx = self._dir[0] * self._speed
             self.vy = self._dir[1] * self._speed
+        elif _steer(self, *target.rect.center, min_angle=self.min_steer_angle):
+            self.course_corrections += 1  # Korrekturen zählen
 
         # Bewegung ausführen (von Basisklasse)
         self.rect.x += int(self.vx)
@@ -482,10 +405,17 @@ class Blaster(Projectile):
         game.explosion_manager.add_explosion(cx, cy, frames, fps=fps*1.2, scale=1.2, weapon_type="blaster")  # Schnellere, größere Explosion
 
 class HomingRocket(Projectile):
-    kind = "homing_rocket"
+    __slots__ = ("homing", "homing_strength", "max_turn_rate", "launch_time", "homing_delay",
+                 "current_target", "target_lost_time")
+
+    weapon          = "homing_rocket"
+    min_steer_angle = None  # Lenkt in jedem Frame
 
     def __init__(self, x, y, vx, vy, img, dmg, owner="player", radius=0, kind="homing_rocket", accel=1.0):
         super().__init__(x, y, vx, vy, img, dmg, owner, radius, kind, accel)
+
+    def reset(self, x, y, vx, vy, img, dmg, owner="player", radius=0, kind="homing_rocket", accel=1.0):
+        super().reset(x, y, vx, vy, img, dmg, owner, radius, kind, accel)
         self.homing = True
         self.homing_strength  = 0.3                     # Stärkere      Lenkung              als normale Raketen
         self.max_turn_rate    = 0.25                    # Maximale      Wendegeschwindigkeit pro Frame
@@ -494,50 +424,13 @@ class HomingRocket(Projectile):
         self.current_target   = None                    # Aktuelles     Ziel
         self.target_lost_time = 0                       # Wann          das                  letzte Ziel verloren wurde
 
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg    = PROJECTILES_CONFIG.get("homing_rocket", PROJECTILES_CONFIG["rocket"])
-        speed  = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel  = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base   = -1 if owner=="player" else +1
-        rad    = math.radians(angle_deg)
-        vx     =  speed * math.sin(rad)
-        vy     =  base  * speed * math.cos(rad)
-        img    = assets["homing_rocket_img"]  # Verwendet das spezielle HomingRocket-Bild
-        if owner=="player" and assets.get("rocket_sound_start"):
-            assets["rocket_sound_start"].set_volume(MASTER_VOLUME * SFX_VOLUME)
-            assets["rocket_sound_start"].play()
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, radius=cfg.get("radius",0), kind="homing_rocket", accel=accel)
-
     def _find_nearest_target(self, game, exclude_current=False):
         """Findet das nächste Ziel basierend auf dem Owner"""
         if self.owner == "player":
-            # Player-Raketen zielen auf Enemies
-            all_enemies = []
-            if hasattr(game, 'enemies') and game.enemies:
-                all_enemies.extend(game.enemies)
-            if hasattr(game, 'fly_in_enemies') and game.fly_in_enemies:
-                all_enemies.extend(game.fly_in_enemies)
-
-            if not all_enemies:
-                return None
-
-            my_center = self.rect.center
-            nearest_target = None
-            min_distance = float('inf')
-
-            for enemy in all_enemies:
-                # Aktuelles Ziel ausschließen wenn gewünscht
-                if exclude_current and enemy == self.current_target:
-                    continue
-
-                enemy_center = enemy.rect.center
-                distance = math.hypot(enemy_center[0] - my_center[0], enemy_center[1] - my_center[1])
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_target = enemy
-
-            return nearest_target
+            # Player-Raketen zielen auf Enemies - über den Ziel-Index des Games
+            mx, my  = self.rect.center
+            exclude = self.current_target if exclude_current else None
+            return game.enemy_grid.nearest(mx, my, exclude=exclude)
 
         elif self.owner == "enemy":
             # Enemy-Raketen zielen auf Player
@@ -551,111 +444,55 @@ class HomingRocket(Projectile):
             return False
 
         if self.owner == "player":
-            # Prüfe sowohl normale Enemies als auch Fly-In Enemies
-            if hasattr(game, 'enemies') and target in game.enemies:
-                return True
-            if hasattr(game, 'fly_in_enemies') and target in game.fly_in_enemies:
-                return True
-            return False
+            # O(1): normale und Fly-In Enemies stehen im Ziel-Index
+            return target in game.enemy_grid
 
         elif self.owner == "enemy":
             # Prüfe ob Player noch lebt
             return target == getattr(game, 'player', None) and not getattr(game, 'player_dead', False)
 
+    def homing_target(self, game, now):
+        """Ziel für diesen Frame oder None (geradeaus: Startverzögerung oder kein Ziel)"""
+        # Erst nach Verzögerung mit der Suche beginnen
+        if now - self.launch_time < self.homing_delay:
+            return None
+        # Aktuelles Ziel prüfen
+        if self._is_target_valid(self.current_target, game):
+            return self.current_target
+        # Ziel verloren oder noch keins -> neues suchen
+        if self.current_target is not None:
+            self.target_lost_time = now
+            self.current_target = None
+        target = self._find_nearest_target(game)
+        if target:
+            self.current_target = target
+        return target or None
+
     def update(self, game=None):
         # Normale Beschleunigung
         if self.accel != 1.0:
             self._speed *= self.accel
 
         # Wärmelenkung für beide Player- und Enemy-Raketen
-        if self.homing and game:
-            now = pygame.time.get_ticks()
-
-            # Erst nach Verzögerung mit der Suche beginnen
-            if now - self.launch_time < self.homing_delay:
-                # Geradeaus fliegen während der Startverzögerung
-                self.vx = self._dir[0] * self._speed
-                self.vy = self._dir[1] * self._speed
-            else:
-                # Zielsuche und -verfolgung
-                target = None
-
-                # Aktuelles Ziel prüfen
-                if self._is_target_valid(self.current_target, game):
-                    target = self.current_target
-                else:
-                    # Ziel verloren oder noch keins -> neues suchen
-                    if self.current_target is not None:
-                        self.target_lost_time = now
-                        self.current_target = None
-
-                    # Neues Ziel suchen
-                    target = self._find_nearest_target(game)
-                    if target:
-                        self.current_target = target
-
-                if target:
-                    # Richtung zum Ziel berechnen
-                    tx, ty = target.rect.center
-                    mx, my = self.rect.center
-                    target_dx = tx - mx
-                    target_dy = ty - my
-                    target_dist = math.hypot(target_dx, target_dy)
-
-                    if target_dist > 0:
-                        # Normalisierte Zielrichtung
-                        target_dir_x = target_dx / target_dist
-                        target_dir_y = target_dy / target_dist
-
-                        # Aktuelle Richtung mit Zielrichtung mischen
-                        blend_factor = min(self.homing_strength, self.max_turn_rate)
-                        new_dir_x = self._dir[0] + (target_dir_x - self._dir[0]) * blend_factor
-                        new_dir_y = self._dir[1] + (target_dir_y - self._dir[1]) * blend_factor
-
-                        # Richtung normalisieren
-                        new_dir_len = math.hypot(new_dir_x, new_dir_y)
-                        if new_dir_len > 0:
-                            self._dir = (new_dir_x / new_dir_len, new_dir_y / new_dir_len)
-                            self.vx = self._dir[0] * self._speed
-                            self.vy = self._dir[1] * self._speed
-                else:
-                    # Kein Ziel gefunden -> weiterfliegen in aktueller Richtung
-                    self.vx = self._dir[0] * self._speed
-                    self.vy = self._dir[1] * self._speed
-        else:
-            # Normale Bewegung ohne Lenkung
+        target = self.homing_target(game, pygame.time.get_ticks()) if self.homing and game else None
+        if target is None:
             self.vx = self._dir[0] * self._speed
             self.vy = self._dir[1] * self._speed
+        else:
+            _steer(self, *target.rect.center)
 
         # Position aktualisieren
         self.rect.x += int(self.vx)
         self.rect.y += int(self.vy)
 
-    def offscreen(self):
-        # Wärmelenkraketen bleiben länger aktiv als normale Projektile
-        margin = 100  # Zusätzlicher Rand
-        # Verwende aktuelle Bildschirmgröße statt Konstanten
-        screen = pygame.display.get_surface()
-        if screen:
-            current_width, current_height = screen.get_size()
-            return (self.rect.right < -margin or self.rect.left > current_width + margin or
-                    self.rect.bottom < -margin or self.rect.top > current_height + margin)
-        else:
-            # Fallback zu Konstanten falls kein Screen verfügbar
-            return (self.rect.right < -margin or self.rect.left > WIDTH + margin or
-                    self.rect.bottom < -margin or self.rect.top > HEIGHT + margin)
-
     def draw(self, screen):
         # Einfache und direkte Winkelberechnung
         # Berechne den Winkel basierend auf der Bewegungsrichtung
         angle_rad = math.atan2(-self.vx, -self.vy)  # Beide negativ für korrekte Orientierung
         angle_deg = math.degrees(angle_rad)
 
-        # Rakete rotieren
-        rotated_img = pygame.transform.rotate(self.img, angle_deg)
-        rotated_rect = rotated_img.get_rect(center=self.rect.center)
-
-        screen.blit(rotated_img, rotated_rect)
+        # Vorgedrehtes Sprite zum nächstgelegenen Rasterwinkel
+        rotation_cache.blit(screen, self.img, angle_deg, self.rect.center)
 
     def on_hit(self, game, hit_pos):
         cx, cy = hit_pos
@@ -676,23 +513,12 @@ class HomingRocket(Projectile):
             x = cx + radius * math.cos(angle)
             y = cy + radius * math.sin(angle)
             game.explosion_manager.add_explosion(x, y, frames, fps=fps*1.2, scale=0.6, weapon_type="homing_rocket")  # Schnellere, kleinere Explosionen
+        _particles(game, "spark", cx, cy)
+        _particles(game, "debris", cx, cy)
 
 class Nuke(Projectile):
-    kind = "nuke"
-    @classmethod
-    def create(cls, x, y, assets, owner="player", angle_deg=0):
-        cfg    = PROJECTILES_CONFIG["nuke"]
-        speed  = cfg.get("enemy_speed", cfg["speed"]) if owner=="enemy" else cfg["speed"]
-        accel  = cfg.get("enemy_accel", cfg.get("accel",1.0)) if owner=="enemy" else cfg.get("accel",1.0)
-        base   = -1 if owner=="player" else +1
-        rad    = math.radians(angle_deg)
-        vx     =  speed * math.sin(rad)
-        vy     =  base  * speed * math.cos(rad)
-        img    = assets["nuke_img"]
-        if owner=="player" and assets.get("nuke_sound_start"):
-            assets["nuke_sound_start"].set_volume(MASTER_VOLUME * SFX_VOLUME)
-            assets["nuke_sound_start"].play()
-        return cls(x, y, vx, vy, img, cfg["dmg"], owner, radius=cfg.get("radius",0), kind="nuke", accel=accel)
+    __slots__ = ()
+    weapon = "nuke"
 
     def on_hit(self, game, hit_pos):
         cx, cy = hit_pos
@@ -719,6 +545,8 @@ class Nuke(Projectile):
             y = cy + radius * math.sin(angle)
             game.explosion_manager.add_explosion(x, y, frames, fps=fps*1.2, scale=1.2, weapon_type="nuke")
         print(f"NUKE: Added {num_explosions} ring explosions!")  # Debug
+        _particles(game, "nuke_debris", cx, cy)
+        _particles(game, "spark", cx, cy)
         
         # AoE Schaden INKLUSIVE Explosionen
         enemies_hit = _apply_aoe(game, cx, cy, self.radius, self.dmg, "expl_nuke", expl_scale=1.0, weapon_type="nuke")
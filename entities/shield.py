@@ -1,10 +1,11 @@
 # entities/shield.py
 import pygame
+from system.mask_bank import mask_bank
 
 class Shield:
     __slots__ = (
         "frames","center","fps","_t_last","_i","loop","done",
-        "alpha","blend_add","radius_px","mask","mask_center","_last_hit_sound",
+        "alpha","blend_add","radius_px","masks","mask_center","_last_hit_sound",
         "max_health","current_health","damaged_until","_last_regen_time","is_powerup_shield",
         "damage_reduction","regen_rate","min_health_percentage"
     )
@@ -14,23 +15,11 @@ class Shield:
             blank  = pygame.Surface((1,1), pygame.SRCALPHA)
             frames = [blank]
 
-        # einheitlich skalieren
-        if scale != 1.0:
-            w, h   = frames[0].get_width(), frames[0].get_height()
-            tw, th = int(w*scale), int(h*scale)
-            frames = [pygame.transform.smoothscale(f, (tw, th)) for f in frames]
-
-        # alle Frames exakt gleiche Größe → kein Wobble
-        fw, fh = frames[0].get_width(), frames[0].get_height()
-        eq = []
-        for f in frames:
-            if f.get_size() != (fw, fh):
-                pad = pygame.Surface((fw, fh), pygame.SRCALPHA)
-                pad.blit(f, f.get_rect(center=(fw//2, fh//2)))
-                eq.append(pad)
-            else:
-                eq.append(f)
-        self.frames = eq
+        # einheitlich skalieren, alle Frames exakt gleiche Größe (kein Wobble);
+        # Frames + Masken pro Frame kommen fertig aus der MaskBank
+        fset = mask_bank.frame_set(frames, Shield.frame_size(frames, scale))
+        self.frames = fset.frames
+        fw, fh = self.frames[0].get_width(), self.frames[0].get_height()
 
         # Referenz
         self.center = (int(x), int(y))
@@ -47,16 +36,12 @@ class Shield:
         self.alpha     = max(0, min(255, int(alpha)))
         self.blend_add = bool(blend_add)
 
-        # optionale Maske (nur für Kollision)
+        # optionale Masken (nur für Kollision), eine pro Animations-Frame
         if use_mask:
-            self.mask = pygame.mask.from_surface(self.frames[0])
-            try:
-                cx, cy = self.mask.centroid()
-            except AttributeError:
-                cx, cy = self.mask.get_bounding_rect().center
-            self.mask_center = (cx, cy)
+            self.masks       = fset.masks
+            self.mask_center = fset.mask_center
         else:
-            self.mask = None
+            self.masks       = None
             self.mask_center = None
 
         # Sound-Cooldown initialisieren
@@ -90,6 +75,17 @@ class Shield:
             # Gelb färben für Power-Up Shield
             self._apply_yellow_tint()
 
+    @staticmethod
+    def frame_size(frames, scale):
+        """Zielgröße der Frames bei gegebener Skalierung"""
+        w, h = frames[0].get_width(), frames[0].get_height()
+        return (int(w*scale), int(h*scale)) if scale != 1.0 else (w, h)
+
+    @staticmethod
+    def scale_for_player(player_rect, base_frames, base_scale_factor):
+        """Skalierung des Schilds für die Spielergröße"""
+        return max(player_rect[2], player_rect[3]) / base_frames[0].get_width() * base_scale_factor
+
     def _apply_yellow_tint(self):
         """Färbt das Shield gelb für Power-Up Shields"""
         yellow_tinted = []
@@ -109,39 +105,21 @@ class Shield:
     def rescale_for_player(self, player_rect, base_frames, base_scale_factor):
         """Skaliert das Schild basierend auf der Spielergröße neu"""
         # Neue Skalierung basierend auf Spielergröße berechnen
-        new_scale = max(player_rect.w, player_rect.h) / base_frames[0].get_width() * base_scale_factor
+        new_scale = Shield.scale_for_player(player_rect, base_frames, base_scale_factor)
 
-        # Frames neu skalieren
-        if new_scale != 1.0:
-            w, h = base_frames[0].get_width(), base_frames[0].get_height()
-            tw, th = int(w * new_scale), int(h * new_scale)
-            new_frames = [pygame.transform.smoothscale(f, (tw, th)) for f in base_frames]
-        else:
-            new_frames = base_frames.copy()
-
-        # Alle Frames auf einheitliche Größe bringen
-        fw, fh = new_frames[0].get_width(), new_frames[0].get_height()
-        eq_frames = []
-        for f in new_frames:
-            if f.get_size() != (fw, fh):
-                pad = pygame.Surface((fw, fh), pygame.SRCALPHA)
-                pad.blit(f, f.get_rect(center=(fw//2, fh//2)))
-                eq_frames.append(pad)
-            else:
-                eq_frames.append(f)
+        # Frames + Masken aus der MaskBank (pro Größe nur einmal gebaut)
+        fset = mask_bank.frame_set(base_frames, Shield.frame_size(base_frames, new_scale))
 
         # Frames und Radius aktualisieren
-        self.frames = eq_frames
+        self.frames = fset.frames
+        fw, fh = self.frames[0].get_width(), self.frames[0].get_height()
         self.radius_px = min(fw, fh) // 2
+        if self._i >= len(self.frames):
+            self._i = 0
 
-        # Maske neu erstellen falls verwendet
-        if self.mask is not None:
-            self.mask = pygame.mask.from_surface(self.frames[0])
-            try:
-                cx, cy = self.mask.centroid()
-            except AttributeError:
-                cx, cy = self.mask.get_bounding_rect().center
-            self.mask_center = (cx, cy)
+        if self.masks is not None:
+            self.masks       = fset.masks
+            self.mask_center = fset.mask_center
 
     def update(self):
         if self.done: return
@@ -222,15 +200,15 @@ class Shield:
         px, py = point; cx, cy = self.center
         return (px - cx)**2 + (py - cy)**2 <= self.radius_px**2
 
-    # optionale Pixelmaske
+    # optionale Pixelmaske (Maske des aktuellen Frames)
     def hit_mask(self, point):
-        if not self.mask:
+        if not self.masks:
             return self.hit_circle(point)
         r = self._current_rect()
         lx = int(point[0] - r.left); ly = int(point[1] - r.top)
         if lx < 0 or ly < 0 or lx >= r.width or ly >= r.height:
             return False
-        return self.mask.get_at((lx, ly)) != 0
+        return self.masks[self._i].get_at((lx, ly)) != 0
 
     def hit_by_projectile(self, projectile_rect):
         """Prüft ob ein Projektil das Schild trifft (sowohl Circle als auch Mask)"""
@@ -239,7 +217,7 @@ class Shield:
             return False
 
         # Dann präziseren Mask-Check falls verfügbar
-        if self.mask:
+        if self.masks:
             return self.hit_mask(projectile_rect.center)
 
         return True
@@ -0,0 +1,160 @@
+# entities/weapon_spec.py
+"""
+WeaponSpec - Waffen-Config einmal kompiliert, danach nur noch nachgeschlagen.
+
+Pro (Waffe, Owner, Stage) liegen Schaden, Cooldown, Bild, Start-Sound (Lautstärke gesetzt)
+und die Läufe als (dx, dy, Winkel, vx, vy) bereit. Stage ist die Schiffs-Stage (Player),
+der Gegner-Typ (Enemy) oder None (einzelner Schuss über Projectile.create).
+Schießen = Cooldown-Vergleich + ein spawn() pro Lauf, ohne Config-Zugriff oder sin/cos.
+"""
+import math
+from config import MASTER_VOLUME, SFX_VOLUME
+from config.weapon import PROJECTILES_CONFIG
+from config.ship import SHIP_CONFIG
+from config.enemy import ENEMY_CONFIG
+
+# Waffe -> (Config-Eintrag, Bild Player, Bild Enemy, Start-Sound nur für Player)
+_SOURCES = {
+    "laser":         ("laser",         "laser_img",         "laser_yellow_img",  "laser_sound_start"),
+    "double_laser":  ("laser",         "double_laser_img",  "double_laser_img",  "laser_sound_start"),
+    "rocket":        ("rocket",        "rocket_img",        "rocket_img",        "rocket_sound_start"),
+    "homing_rocket": ("homing_rocket", "homing_rocket_img", "homing_rocket_img", "rocket_sound_start"),
+    "blaster":       ("blaster",       "blaster_img",       "blaster_img",       None),
+    "nuke":          ("nuke",          "nuke_img",          "nuke_img",          "nuke_sound_start"),
+}
+
+
+def _cycle(items, amount):
+    """items zyklisch auf amount Einträge auffüllen (wie die alten _muzzles/_angles)"""
+    return [items[i % len(items)] for i in range(amount)]
+
+
+class WeaponSpec:
+    """Unveränderliche, vorberechnete Schuss-Daten einer Waffe"""
+
+    __slots__ = ("weapon", "owner", "stage", "kind", "dmg", "cooldown", "radius", "speed", "accel",
+                 "img", "sound", "amount", "barrels", "_offsets", "_angles", "_vel", "_by_amount")
+
+    def __init__(self, weapon, owner, stage, assets, offsets=((0, 0),), angles=(0,), amount=1):
+        cfg_key, img_player, img_enemy, sound_key = _SOURCES[weapon]
+        cfg   = PROJECTILES_CONFIG.get(cfg_key, PROJECTILES_CONFIG["rocket"])
+        enemy = owner == "enemy"
+        img   = assets.get(img_enemy if enemy else img_player)
+        if img is None and weapon == "double_laser":
+            img = assets.get("laser_img")  # Fallback auf normalen Laser
+        sound = None if enemy or sound_key is None else assets.get(sound_key)
+        if sound:
+            sound.set_volume(MASTER_VOLUME * SFX_VOLUME)
+
+        s = object.__setattr__
+        s(self, "weapon",   weapon)
+        s(self, "owner",    owner)
+        s(self, "stage",    stage)
+        s(self, "kind",     weapon)
+        s(self, "dmg",      cfg["dmg"])
+        s(self, "cooldown", cfg["cooldown"])
+        s(self, "radius",   cfg.get("radius", 0) if weapon not in ("laser", "double_laser", "blaster") else 0)
+        s(self, "speed",    cfg.get("enemy_speed", cfg["speed"]) if enemy else cfg["speed"])
+        s(self, "accel",    cfg.get("enemy_accel", cfg.get("accel", 1.0)) if enemy else cfg.get("accel", 1.0))
+        s(self, "img",      img)
+        s(self, "sound",    sound or None)
+        s(self, "_offsets", tuple(offsets) or ((0, 0),))
+        s(self, "_angles",  tuple(angles) or (0,))
+        s(self, "_vel",     {})  # Winkel -> (vx, vy), Cache für create()/barrels_for()
+        s(self, "_by_amount", {})  # abweichende Schusszahl -> Läufe
+        s(self, "amount",   max(1, int(amount)))
+        s(self, "barrels",  self._make_barrels(self.amount))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("WeaponSpec ist unveränderlich")
+
+    def velocity(self, angle_deg):
+        """(vx, vy) für einen Schusswinkel (0 = geradeaus, Player nach oben, Enemy nach unten)"""
+        v = self._vel.get(angle_deg)
+        if v is None:
+            rad  = math.radians(angle_deg)
+            base = -1 if self.owner == "player" else +1
+            v = self._vel[angle_deg] = (self.speed * math.sin(rad), base * self.speed * math.cos(rad))
+        return v
+
+    def _make_barrels(self, amount):
+        return tuple((dx, dy, ang) + self.velocity(ang)
+                     for (dx, dy), ang in zip(_cycle(self._offsets, amount), _cycle(self._angles, amount)))
+
+    def barrels_for(self, amount):
+        """Läufe (dx, dy, Winkel, vx, vy) für amount Schüsse (Offsets und Winkel zyklisch)"""
+        if amount == self.amount:
+            return self.barrels
+        barrels = self._by_amount.get(amount)
+        if barrels is None:
+            barrels = self._by_amount[amount] = self._make_barrels(amount)
+        return barrels
+
+    def shoot(self, cls, x, y, angle_deg=0):
+        """Ein Schuss von (x, y) im Winkel angle_deg (Projectile.create)"""
+        vx, vy = self.velocity(angle_deg)
+        if self.sound:
+            self.sound.play()
+        return cls.spawn(x, y, vx, vy, self.img, self.dmg, self.owner,
+                         radius=self.radius, kind=self.kind, accel=self.accel)
+
+    def fire(self, cls, x, y, amount=None):
+        """Alle Läufe relativ zu (x, y) abfeuern (Cooldown prüft der Aufrufer)"""
+        barrels = self.barrels if amount is None else self.barrels_for(max(1, int(amount)))
+        shots, sound = [], self.sound
+        for dx, dy, _, vx, vy in barrels:
+            if sound:
+                sound.play()
+            shots.append(cls.spawn(x + dx, y + dy, vx, vy, self.img, self.dmg, self.owner,
+                                   radius=self.radius, kind=self.kind, accel=self.accel))
+        return shots
+
+
+# (id(assets), Waffe, Owner, Stage) -> (assets, WeaponSpec)
+_SPECS = {}
+
+
+def weapon_spec(weapon, owner, stage, assets) -> WeaponSpec:
+    """Kompilierte Spec (einmal gebaut, danach nachgeschlagen); stage None = einzelner Lauf"""
+    key   = (id(assets), weapon, owner, stage)
+    entry = _SPECS.get(key)
+    if entry is not None and entry[0] is assets:
+        return entry[1]
+    if stage is None:
+        spec = WeaponSpec(weapon, owner, None, assets)
+    elif owner == "player":
+        cfg    = SHIP_CONFIG[stage]
+        amount = stage_weapons(stage).get(weapon, 0)
+        spec   = WeaponSpec(weapon, owner, stage, assets,
+                            offsets=cfg.get("muzzles", {}).get(weapon, []) or [(0, 6)],
+                            angles=cfg.get("angle", {}).get(weapon, []) or [0],
+                            amount=amount)
+    else:
+        cfg  = ENEMY_CONFIG[stage]
+        spec = WeaponSpec(weapon, owner, stage, assets,
+                          angles=cfg.get("angle", {}).get(weapon, []) or [0])
+    # Assets mit ablegen: hält die id() fest und erkennt wiederverwendete ids
+    _SPECS[key] = (assets, spec)
+    return spec
+
+
+def stage_weapons(stage) -> dict:
+    """Waffe -> Anzahl Läufe einer Schiffs-Stage"""
+    w = SHIP_CONFIG[stage]["weapons"]
+    return {k: 1 for k in w} if isinstance(w, list) else dict(w)
+
+
+def compile_weapon_specs(assets):
+    """Alle Specs beim Start bauen (Player-Stages, Gegner-Typen, Einzelschüsse)"""
+    for stage in SHIP_CONFIG:
+        for weapon, amount in stage_weapons(stage).items():
+            if amount > 0 and weapon in _SOURCES:
+                weapon_spec(weapon, "player", stage, assets)
+    for etype, ecfg in ENEMY_CONFIG.items():
+        weapons = ecfg.get("weapons") or ()
+        for weapon in ((weapons,) if isinstance(weapons, str) else weapons):
+            if isinstance(weapon, str) and weapon in _SOURCES:
+                weapon_spec(weapon, "enemy", etype, assets)
+    for weapon in _SOURCES:
+        for owner in ("player", "enemy"):
+            weapon_spec(weapon, owner, None, assets)
@@ -1,5 +1,7 @@
 import pygame
 import random
+import itertools
+import time
 from assets.load_assets import load_assets
 from system.utils       import load_highscore, save_highscore, scale
 from system.hud         import HUD
@@ -8,8 +10,15 @@ from config             import *
 from config.powerup     import POWERUP_CONFIG
 from config.shield      import SHIELD_CONFIG
 from entities           import *
-from manager import ExplosionManager, PowerUpManager, ProjectileManager
+from manager import ExplosionManager, PowerUpManager, ProjectileManager, EmitterManager, ParticleManager
+from config.particles import PARTICLE_TRAILS
+from manager.emitter_manager import PatternBullet
 from system.menu import GameMenu
+from system.spatial_hash import SpatialHash
+from system.collision import player_hit_candidates, sweep_rect, swept_entry, ray_rect_entry, intercept_pairs
+from system.registry import EntityRegistry
+from system.mask_bank import mask_bank
+from system.telemetry import telemetry
 
 class Game:
     def __init__(self):
@@ -55,17 +64,40 @@ class Game:
             except pygame.error:
                 pass
 
-        # Fixed timestep
-        self.fixed_timestep      = 1.0 / 60.0
+        # Fixed timestep (Bewegungswerte sind auf 60 Hz normiert)
+        self.fixed_timestep      = 1.0 / PHYSICS_HZ
+        self.physics_step_scale  = 60.0 / PHYSICS_HZ
+        self.collision_mode      = COLLISION_MODE
         self.accumulated_time    = 0.0
         self.max_steps_per_frame = 2
 
         # Gameplay Container
-        self.enemies = []
+        self.enemies = EntityRegistry()
         self.enemy_dir   = 1
         self.enemy_speed = 0.0
         self.wave_num    = 0
 
+        # Broadphase/Ziel-Index für Gegner (einmal pro Tick neu aufgebaut);
+        # use_spatial_hash schaltet nur die Kollisions-/AoE-Abfragen auf Brute-Force
+        self.enemy_grid       = SpatialHash(SPATIAL_CELL_SIZE)
+        self.use_spatial_hash = USE_SPATIAL_HASH
+
+        # Treffer-Events eines Ticks (Kollisions-Stufe -> Auflösungs-Stufe) und deren Kosten
+        self._hits_on_player  = []  # (Schuss, Schild, PowerUp-Schild, Spieler)
+        self._hits_on_enemies = []  # (Schuss, Gegner)
+        self._intercepts      = []  # (Spieler-Schuss, abgeschossener Gegner-Schuss)
+        self.collision_stats  = {"detect_ms": 0.0, "resolve_ms": 0.0, "events": 0}
+
+        # Abfangen von Gegner-Projektilen: Matrix Spieler-Kind -> abfangbare Gegner-Kinds
+        self.interception      = INTERCEPTION_CONFIG.get("enabled", False)
+        self._intercept_matrix = {k: frozenset(v) for k, v in INTERCEPTION_CONFIG.get("matrix", {}).items()}
+        self._intercept_kinds  = frozenset().union(*self._intercept_matrix.values())
+
+        # Laser-Modus: "projectile" (Laser-Objekte) oder "beam" (Hitscan, ein Raycast pro Lauf und Tick)
+        self.laser_mode   = PROJECTILES_CONFIG["laser"].get("mode", "projectile")
+        self.beams        = []
+        self._beam_double = False
+
         self.shield           = None
         self.shield_until     = 0
         self._shield_ready_at = 0
@@ -80,7 +112,10 @@ class Game:
         # Manager
         self.powerup_manager    = PowerUpManager(self.assets)
         self.explosion_manager  = ExplosionManager(max_explosions=10000)
-        self.projectile_manager = ProjectileManager(max_projectiles=10000)  # Sehr hoch für extreme Situationen
+        self.projectile_manager = ProjectileManager(max_projectiles=10000, backend=PROJECTILE_BACKEND)  # Sehr hoch für extreme Situationen
+        Projectile.pool = self.projectile_manager  # create() nimmt freie Objekte aus den Free-Listen
+        self.emitter_manager    = EmitterManager(self.assets, self.projectile_manager)  # Bullet-Patterns der Gegner
+        self.particle_manager   = ParticleManager()  # Funken, Trümmer, Raketen-Trails (NumPy-Ring-Buffer)
 
         # Pausen-Zeitmessung
         self.total_pause_time = 0
@@ -96,7 +131,7 @@ class Game:
         }
 
         # Fly-In/Spawn Status
-        self.fly_in_enemies         = []
+        self.fly_in_enemies         = EntityRegistry()
         self._last_fly_in_spawn     = 0
         self._fly_in_spawn_interval = 1000
         self._fly_in_spawn_count    = 0
@@ -153,6 +188,7 @@ class Game:
     def _physics_update(self):
         """Nur Physik, keine Neu-Initialisierung."""
         self.projectile_manager.physics_update(self)
+        self.emitter_manager.physics_update(self)
 
     def _show_kill_counter(self):
         if self._total_kills < 50:
@@ -240,6 +276,8 @@ class Game:
 
         import system.utils
         system.utils.update_screen_size(cw, ch)
+        self.projectile_manager.set_viewport(cw, ch)
+        self.emitter_manager.set_viewport(cw, ch)
 
         self.hud = HUD(cw, ch)
         self.hud.load_icons(self.assets)
@@ -301,9 +339,10 @@ class Game:
         dt = self.clock.get_time() / 1000.0
         self.powerup_manager.update(dt, HEIGHT)
         
-        # Kollisionserkennung mit Player
-        for powerup in self.powerup_manager.powerups[:]:
-            if powerup.rect.colliderect(self.player.rect):
+        # Kollisionserkennung mit Player: erst einsammeln, dann anwenden und in einem Durchgang entfernen
+        picked = [p for p in self.powerup_manager.powerups if p.rect.colliderect(self.player.rect)]
+        if picked:
+            for powerup in picked:
                 effect_result = powerup.apply_effect(self.player)
                 if isinstance(effect_result, dict) and effect_result.get("type") == "shield":
                     self._activate_powerup_shield(effect_result["duration"], effect_result["config"])
@@ -315,7 +354,8 @@ class Game:
                     self.emp_powerup.add_charge()
                 self.score += powerup.get_points()
                 self.highscore = max(self.highscore, self.score)
-                self.powerup_manager.powerups.remove(powerup)
+            picked_ids = {id(p) for p in picked}
+            self.powerup_manager.powerups = [p for p in self.powerup_manager.powerups if id(p) not in picked_ids]
 
     def _activate_powerup_shield(self, duration, shield_config):
         now = self.get_game_time()
@@ -368,7 +408,7 @@ class Game:
                 for en in enemies: en.update(dx)
 
     def _update_fly_in_enemies(self):
-        for enemy in self.enemies[:]:
+        for enemy in self.enemies:
             if getattr(enemy, 'movement_type', None) == "fly_in":
                 enemy.update()
                 if enemy.rect.right < 0 or enemy.rect.left > WIDTH:
@@ -385,7 +425,7 @@ class Game:
                 enemy = Enemy(enemy_type, self.assets, x, y)
                 enemy.wave_id = wave_id
                 enemy.movement_type = "wave"
-                self.enemies.append(enemy)
+                self.enemies.add(enemy)
         if not hasattr(self, 'wave_movements'):
             self.wave_movements = {}
         base = ENEMY_CONFIG[enemy_type]["move"]["speed_start"]
@@ -413,7 +453,7 @@ class Game:
         elif path == "straight":
             enemy._phase = random.choice([-1, 1]) * random.uniform(0.5, 2.0)
         enemy.move_cfg["target_y"] = random.randint(80, 150)
-        self.fly_in_enemies.append(enemy)
+        self.fly_in_enemies.add(enemy)
         self._fly_in_spawn_count += 1
 
     def _spawn_boss_group(self):
@@ -428,7 +468,7 @@ class Game:
             boss.move_cfg["speed"] = 1.5
             boss.move_cfg["amplitude"] = 30
             boss.move_cfg["frequency"] = 0.5
-            self.fly_in_enemies.append(boss)
+            self.fly_in_enemies.add(boss)
             self._fly_in_spawn_count += 1
         self._boss_spawned = True
         self._max_fly_in_enemies = len(self.fly_in_enemies)
@@ -499,8 +539,8 @@ class Game:
                 elif e.key == pygame.K_F5:
                     self._build_wave('boss')
                 elif e.key == pygame.K_F12 and not (pygame.key.get_pressed()[pygame.K_LALT] or pygame.key.get_pressed()[pygame.K_RALT]):
-                    self.enemies = []
-                elif e.key == pygame.K_SPACE and not self.paused and not self.player_dead:
+                    self.remove_enemies(self.enemies.snapshot())
+                elif e.key == pygame.K_SPACE and not self.paused and not self.player_dead and self.laser_mode != "beam":
                     shots = self.player.shoot_weapon("laser")
                     if self.double_laser_active and shots:
                         enhanced = []
@@ -588,7 +628,10 @@ class Game:
             cw, ch = self.screen.get_size()
             self.player.handle_input(keys, cw, ch)
 
-        if keys[pygame.K_SPACE] and not self.paused and not self.player_dead:
+        firing = keys[pygame.K_SPACE] and not self.paused and not self.player_dead
+        if self.laser_mode == "beam":
+            self._aim_beams(firing)
+        elif firing:
             shots = self.player.shoot_weapon("laser")
             if self.double_laser_active and shots:
                 enhanced = []
@@ -605,27 +648,21 @@ class Game:
 
         self.projectile_manager.update(self.clock.get_time() / 1000.0, HEIGHT)
 
-        for shot in self.projectile_manager.get_player_shots():
-            if getattr(shot, 'homing', False): shot.update(self)
-        for shot in self.projectile_manager.get_enemy_shots():
-            if getattr(shot, 'homing', False): shot.update(self)
-
         dt = self.clock.get_time() / 1000.0
         for enemy in self.enemies:
             if hasattr(enemy, 'update_emp_effects'): enemy.update_emp_effects(dt)
 
-        for e in self.enemies[:]:
-            if e.offscreen(): self.enemies.remove(e)
+        for e in self.enemies:
+            if e.offscreen():
+                self.remove_enemies((e,))
 
-        for emp_wave in self.emp_waves[:]:
-            if not emp_wave.update(dt, self): self.emp_waves.remove(emp_wave)
+        self.emp_waves = [w for w in self.emp_waves if w.update(dt, self)]
 
-        for enemy in self.fly_in_enemies[:]:
+        for enemy in self.fly_in_enemies:
             enemy.update()
             if hasattr(enemy, 'update_emp_effects'): enemy.update_emp_effects(dt)
             if (enemy.rect.y > HEIGHT + 50 or enemy.rect.x < -100 or enemy.rect.x > WIDTH + 100):
-                self.fly_in_enemies.remove(enemy)
-                self._fly_in_spawn_count = max(0, self._fly_in_spawn_count - 1)
+                self.remove_enemies((enemy,))
 
         self._update_powerups()
 
@@ -653,6 +690,12 @@ class Game:
         self._update_wave_enemies()
         self._update_fly_in_enemies()
 
+        # Gegner-Index für diesen Tick (Kollisionen, AoE-Abfragen, Homing-Ziele)
+        self.enemy_grid.rebuild(self.enemies, self.fly_in_enemies)
+
+        # Homing-Projektile lenken (nach der Gegner-Bewegung, gegen den aktuellen Index)
+        self.projectile_manager.steer_homing(self)
+
         for en in self.enemies:
             for w, amt in en.weapons.items():
                 if amt > 0:
@@ -664,91 +707,303 @@ class Game:
                     for s in en.shoot_weapon(w, amt):
                         self.projectile_manager.add_enemy_shot(s)
 
+        # Bullet-Patterns: Auslösen pro Gegner, die Salven feuert der EmitterManager als Batches
+        emitters = self.emitter_manager
+        for en in itertools.chain(self.enemies, self.fly_in_enemies):
+            for name in en.patterns:
+                if en.trigger_pattern(name):
+                    emitters.start(name, en, now)
+        emitters.update(self, now)
+
+        # Swept nur, wenn seit dem letzten Durchgang ein Physik-Schritt lief (sonst Pfadlänge 0)
+        swept = self.collision_mode == "swept" and self.projectile_manager.has_sweep
+
+        # Kollisions-Stufe schreibt nur Events, die Auflösung ändert danach die Listen
+        t0 = time.perf_counter()
+        self._detect_hits(swept)
+        t1 = time.perf_counter()
+        self._resolve_hits(now, dt)
+        t2 = time.perf_counter()
+        stats = self.collision_stats
+        stats["detect_ms"]  = (t1 - t0) * 1000.0
+        stats["resolve_ms"] = (t2 - t1) * 1000.0
+        stats["events"]     = len(self._hits_on_player) + len(self._hits_on_enemies) + len(self._intercepts)
+
+        # Tombstones entfernter Gegner/Projektile einmal pro Tick schließen
+        self.enemies.compact()
+        self.fly_in_enemies.compact()
+        self.projectile_manager.compact()
+        self.projectile_manager.end_collision_pass()
+        self.emitter_manager.end_collision_pass()
+
+        self.explosion_manager.update()
+        self.particle_manager.emit_trails(self.projectile_manager.live_of_kind(PARTICLE_TRAILS))
+        self.particle_manager.update(now)
+        telemetry.tick(now)  # Snapshot periodisch an den Writer-Thread
+
+    def _detect_hits(self, swept):
+        """Kollisions-Stufe: nur Geometrie-Tests, schreibt Treffer-Events (ändert keine Listen)"""
+        on_player  = self._hits_on_player
+        on_enemies = self._hits_on_enemies
+        on_player.clear()
+        on_enemies.clear()
+        self._intercepts.clear()
+
+        # Spieler-Schüsse gegen abfangbare Gegner-Schüsse (nur Kinds aus der Matrix)
+        if self.interception:
+            self._detect_intercepts()
+
         # Enemy->Player
         if not self.player_dead:
-            for p in self.projectile_manager.get_enemy_shots():
-                hit_shield = False
-                hit_powerup_shield = False
-                if self.shield and not self.shield.is_broken() and self.shield.hit_by_projectile(p.rect):
-                    dmg = getattr(p, "dmg", 100)
-                    shield_cfg = SHIELD_CONFIG[1]["shield"]
-                    absorbed = min(dmg * shield_cfg.get("damage_reduction", 0.9), self.shield.current_health)
-                    active = self.shield.take_damage(absorbed)
-                    self.shield.play_hit_sound(self.assets)
-                    hit_shield = True
-                    if not active:
-                        self._last_shield_destroyed = now
-                        self.shield = None
-                if self.powerup_shield and not self.powerup_shield.is_broken() and self.powerup_shield.hit_by_projectile(p.rect):
-                    dmg = getattr(p, "dmg", 100)
-                    absorbed = min(dmg, self.powerup_shield.current_health)
-                    active = self.powerup_shield.take_damage(absorbed)
-                    self.powerup_shield.play_hit_sound(self.assets)
-                    hit_powerup_shield = True
-                    if not active:
-                        self.powerup_shield = None
-                    self.projectile_manager.remove_shot(p)
-                    continue
-                if p.rect.colliderect(self.player.rect):
-                    if now < getattr(self.player, "invincible_until", 0):
-                        self.projectile_manager.remove_shot(p)
-                        continue
-                    self.projectile_manager.remove_shot(p)
-                    dmg = getattr(p, "dmg", 100)
-                    has_power = hit_powerup_shield or (self.powerup_shield and not self.powerup_shield.is_broken())
-                    has_norm  = hit_shield or (self.shield and not self.shield.is_broken())
-                    destroyed = False if has_power else self.player.take_damage(dmg, has_norm)
-                    if hasattr(p, "on_hit"): p.on_hit(self, self.player.rect.center)
-                    if destroyed:
-                        frames = self.assets.get("expl_laser", [])
-                        fps    = self.assets.get("expl_laser_fps", 24)
-                        self.explosion_manager.add_explosion(self.player.rect.centerx, self.player.rect.centery, frames, fps=fps, scale=2.5)
-                        self.player_dead       = True
-                        self._respawn_ready_at = now + self.lives_cooldown
-                    break
+            shield  = self.shield if self.shield and not self.shield.is_broken() else None
+            pshield = self.powerup_shield if self.powerup_shield and not self.powerup_shield.is_broken() else None
+            prect   = self.player.rect
+            # Broadphase im Batch: nur Schüsse, die Schild-Kreis oder Spieler berühren
+            circles = [(sh.center, sh.radius_px) for sh in (shield, pshield) if sh]
+            candidates = itertools.chain(
+                player_hit_candidates(self.projectile_manager.get_enemy_shots(), prect, circles, swept),
+                self.emitter_manager.player_hit_candidates(prect, circles, swept))
+            for p in candidates:
+                hit_shield  = shield is not None and shield.hit_by_projectile(p.rect)
+                hit_pshield = pshield is not None and pshield.hit_by_projectile(p.rect)
+                hit_body    = p.rect.colliderect(prect) or (swept and swept_entry(p, prect) is not None)
+                if hit_shield or hit_pshield or hit_body:
+                    on_player.append((p, hit_shield, hit_pshield, hit_body))
 
         # Player->Enemy
         for p in self.projectile_manager.get_player_shots():
-            hit_enemy = None
-            for en in self.enemies:
-                if p.rect.colliderect(en.rect):
-                    hit_enemy = en; break
-            if not hit_enemy:
-                for en in self.fly_in_enemies:
-                    if p.rect.colliderect(en.rect):
-                        hit_enemy = en; break
-            if not hit_enemy: continue
+            hit_enemy = self._find_hit_enemy(p, swept)
+            if hit_enemy:
+                on_enemies.append((p, hit_enemy))
+
+        # Beams: ein Raycast pro Strahl gegen den Gegner-Index
+        for beam in self.beams:
+            beam.cast(self._raycast_enemy)
+
+    def _detect_intercepts(self):
+        """Sort-and-Sweep zwischen Spieler- und Gegner-Schüssen; jeder Schuss höchstens ein Paar"""
+        pm     = self.projectile_manager
+        matrix = self._intercept_matrix
+        kinds  = self._intercept_kinds
+        attackers = [s for s in pm.get_player_shots() if s.kind in matrix]
+        if not attackers:
+            return
+        targets = [s for s in pm.get_enemy_shots() if s.kind in kinds]
+        if not targets:
+            return
+        used_a, used_t = set(), set()
+        for a, t in intercept_pairs(attackers, targets):
+            if id(a) in used_a or id(t) in used_t or t.kind not in matrix[a.kind]:
+                continue
+            used_a.add(id(a))
+            used_t.add(id(t))
+            self._intercepts.append((a, t))
+
+    def _resolve_hits(self, now, dt):
+        """Auflösungs-Stufe: Schaden, Score, Drops, Explosionen und Entfernen, ein Durchgang je Event-Liste"""
+        pm = self.projectile_manager
+
+        # Abfangen zuerst: beide Schüsse sind danach für die anderen Events verbraucht
+        if self._intercepts:
+            frames = self.assets.get("expl_rocket", [])
+            fps    = self.assets.get("expl_rocket_fps", 28)
+            scale_i = INTERCEPTION_CONFIG.get("explosion_scale", 0.6)
+            for a, t in self._intercepts:
+                pm.remove_shot(a)
+                pm.remove_shot(t)
+                self.explosion_manager.add_explosion(t.rect.centerx, t.rect.centery, frames, fps=fps, scale=scale_i)
+
+        # Enemy->Player (Schild-Zustand kann sich durch frühere Events geändert haben)
+        remove_enemy_shot = self._remove_enemy_shot
+        for p, hs, hp, hb in self._hits_on_player:
+            # Kugeln der Bullet-Patterns werden nie abgefangen
+            if self._intercepts and p.__class__ is not PatternBullet and not pm.is_alive(p):
+                continue
+            hit_shield = False
+            hit_powerup_shield = False
+            if hs and self.shield and not self.shield.is_broken():
+                dmg = getattr(p, "dmg", 100)
+                shield_cfg = SHIELD_CONFIG[1]["shield"]
+                absorbed = min(dmg * shield_cfg.get("damage_reduction", 0.9), self.shield.current_health)
+                active = self.shield.take_damage(absorbed)
+                self.shield.play_hit_sound(self.assets)
+                hit_shield = True
+                if not active:
+                    self._last_shield_destroyed = now
+                    self.shield = None
+            if hp and self.powerup_shield and not self.powerup_shield.is_broken():
+                dmg = getattr(p, "dmg", 100)
+                absorbed = min(dmg, self.powerup_shield.current_health)
+                active = self.powerup_shield.take_damage(absorbed)
+                self.powerup_shield.play_hit_sound(self.assets)
+                hit_powerup_shield = True
+                if not active:
+                    self.powerup_shield = None
+                remove_enemy_shot(p)
+                continue
+            if hb:
+                remove_enemy_shot(p)
+                if now < getattr(self.player, "invincible_until", 0):
+                    continue
+                dmg = getattr(p, "dmg", 100)
+                has_power = hit_powerup_shield or (self.powerup_shield and not self.powerup_shield.is_broken())
+                has_norm  = hit_shield or (self.shield and not self.shield.is_broken())
+                destroyed = False if has_power else self.player.take_damage(dmg, has_norm)
+                if hasattr(p, "on_hit"): p.on_hit(self, self.player.rect.center)
+                if destroyed:
+                    frames = self.assets.get("expl_laser", [])
+                    fps    = self.assets.get("expl_laser_fps", 24)
+                    self.explosion_manager.add_explosion(self.player.rect.centerx, self.player.rect.centery, frames, fps=fps, scale=2.5)
+                    self.player_dead       = True
+                    self._respawn_ready_at = now + self.lives_cooldown
+                break
+
+        # Player->Enemy: Tote werden gesammelt und am Ende in einem Aufruf entfernt
+        dead = []
+        for p, hit_enemy in self._hits_on_enemies:
+            if self._intercepts and not pm.is_alive(p):
+                continue
+            # Ziel schon tot (AoE/früheres Event): Schuss fliegt weiter und prüft nächsten Tick neu
+            if not self._enemy_alive(hit_enemy):
+                continue
             if hasattr(p, "on_hit"):
                 p.on_hit(self, hit_enemy.rect.center)
                 self.explosion_manager.log_weapon_explosion(p.__class__.__name__)
+            pm.remove_shot(p)
+            # Gegner evtl. durch AoE aus on_hit schon zerstört
+            if not self._enemy_alive(hit_enemy):
+                continue
+            if not hit_enemy.take_damage(getattr(p, "dmg", 10)):
+                continue
+            dead.append(hit_enemy)
+            self._kill_enemy(hit_enemy, p.__class__.__name__, getattr(p, "weapon_type", "default"))
+
+        # Beams: Schaden dieses Ticks auf das erste Ziel jedes Strahls
+        for beam in self.beams:
+            en = beam.target
+            if en is None or not self._enemy_alive(en):
+                continue
+            if beam.want_hit_fx(now):
+                beam.on_hit(self)
+            dmg = beam.tick_damage(dt)
+            if dmg > 0 and en.take_damage(dmg):
+                dead.append(en)
+                self._kill_enemy(en, "LaserBeam", "laser")
+
+        if dead:
+            self.remove_enemies(dead)
+
+    def _remove_enemy_shot(self, p):
+        """Gegner-Schuss nach Treffer entfernen: Projektil oder Kugel eines Bullet-Patterns"""
+        if p.__class__ is PatternBullet:
+            self.emitter_manager.remove_bullet(p)
+        else:
             self.projectile_manager.remove_shot(p)
-            if hit_enemy not in self.enemies and hit_enemy not in self.fly_in_enemies:
+
+    def _kill_enemy(self, en, weapon_name, wtype):
+        """Score, Kill-Zähler, Drop und Explosion für einen zerstörten Gegner (Entfernen macht der Aufrufer)"""
+        self.explosion_manager.register_enemy_death(weapon_name)
+        self.score += en.points
+        self.highscore = max(self.highscore, self.score)
+        self._total_kills += 1
+        self._show_kill_counter()
+        self._try_drop_powerup(en.rect.centerx, en.rect.centery)
+        if wtype in ("nuke", "rocket", "homing_rocket"):
+            frames = self.assets.get("expl_rocket", [])
+            fps = self.assets.get("expl_rocket_fps", 30 if wtype=="nuke" else 28)
+            scale_e = 5.0 if wtype=="nuke" else 3.5
+        else:
+            frames = self.assets.get("expl_laser", [])
+            fps    = self.assets.get("expl_laser_fps", 26)
+            scale_e = 2.0
+        self.explosion_manager.add_explosion(en.rect.centerx, en.rect.centery, frames, fps=fps, scale=scale_e)
+
+    def _aim_beams(self, firing):
+        """Beam-Modus: ein LaserBeam pro Laser-Lauf, folgt dem Schiff solange SPACE gehalten wird"""
+        aims = self.player.aim_points("laser") if firing else []
+        if not aims:
+            self.beams.clear()
+            return
+        double = self.double_laser_active
+        if len(self.beams) != len(aims) or self._beam_double != double:
+            if not self.beams:
+                LaserBeam.play_start_sound(self.assets)
+            self.beams = [LaserBeam.create(mx, my, self.assets, ang, double) for (mx, my), ang in aims]
+            self._beam_double = double
+        else:
+            for beam, ((mx, my), ang) in zip(self.beams, aims):
+                beam.aim(mx, my, ang)
+
+    def _raycast_enemy(self, x, y, dx, dy, max_dist):
+        """Erster lebender Gegner entlang des Strahls -> (Gegner, Abstand)"""
+        if self.use_spatial_hash:
+            return self.enemy_grid.raycast(x, y, dx, dy, max_dist, accept=lambda en: en.hp > 0)
+        # Brute-Force-Pfad (Vergleichsmodus)
+        best, best_t = None, max_dist
+        for en in itertools.chain(self.enemies, self.fly_in_enemies):
+            if en.hp <= 0:  # wie accept im Spatial-Hash-Pfad
                 continue
-            dead = hit_enemy.take_damage(getattr(p, "dmg", 10))
-            if dead:
-                self.explosion_manager.register_enemy_death(p.__class__.__name__)
-                self.score += hit_enemy.points
-                self.highscore = max(self.highscore, self.score)
-                self._total_kills += 1
-                self._show_kill_counter()
-                self._try_drop_powerup(hit_enemy.rect.centerx, hit_enemy.rect.centery)
-                wtype = getattr(p, "weapon_type", "default")
-                if wtype in ("nuke", "rocket", "homing_rocket"):
-                    frames = self.assets.get("expl_rocket", [])
-                    fps = self.assets.get("expl_rocket_fps", 30 if wtype=="nuke" else 28)
-                    scale_e = 5.0 if wtype=="nuke" else 3.5
-                else:
-                    frames = self.assets.get("expl_laser", [])
-                    fps    = self.assets.get("expl_laser_fps", 26)
-                    scale_e = 2.0
-                self.explosion_manager.add_explosion(hit_enemy.rect.centerx, hit_enemy.rect.centery, frames, fps=fps, scale=scale_e)
-                if hit_enemy in self.enemies:
-                    self.enemies.remove(hit_enemy)
-                elif hit_enemy in self.fly_in_enemies:
-                    self.fly_in_enemies.remove(hit_enemy)
-                    self._fly_in_spawn_count = max(0, self._fly_in_spawn_count - 1)
+            t = ray_rect_entry(x, y, dx, dy, en.rect)
+            if t is not None and t < best_t:
+                best, best_t = en, t
+        return best, best_t
+
+    def _enemy_alive(self, en):
+        """O(1): Gegner noch registriert und nicht zerstört"""
+        return en.hp > 0 and (en in self.enemies or en in self.fly_in_enemies)
+
+    def remove_enemies(self, dead):
+        """Entfernt Gegner in O(1) je Gegner (Kompaktierung einmal pro Tick in _update)"""
+        removed_fly = 0
+        for en in dead:
+            self.enemy_grid.remove(en)
+            if not self.enemies.remove(en) and self.fly_in_enemies.remove(en):
+                removed_fly += 1
+        if removed_fly:
+            self._fly_in_spawn_count = max(0, self._fly_in_spawn_count - removed_fly)
+
+    def _find_hit_enemy(self, p, swept=False):
+        """
+        Erster Gegner (normale vor Fly-In, Listen-Reihenfolge), den das Projektil berührt.
+        swept: Gegner, den der Pfad seit dem letzten Durchgang zuerst erreicht.
+        """
+        rect = p.rect
+        if swept and (p.prev_x != rect.x or p.prev_y != rect.y):
+            if self.use_spatial_hash:
+                targets = [en for en in self.enemy_grid.query_rect(sweep_rect(p)) if en.hp > 0]
+            else:
+                targets = itertools.chain(self.enemies, self.fly_in_enemies)
+            hits = []
+            for en in targets:
+                t = swept_entry(p, en.rect)
+                if t is not None:
+                    hits.append((t, len(hits), en))
+            # Frühester Eintritt zuerst; Maske entlang des Pfads ab dem AABB-Eintritt
+            for t, _, en in sorted(hits):
+                mask = getattr(en, "mask", None)
+                if mask is None or mask_bank.path_hits(mask, en.rect, rect, (p.prev_x, p.prev_y), t):
+                    return en
+            return None
+        # Pixelgenau: Maske erst nach bestandenem AABB-Test
+        if self.use_spatial_hash:
+            # Nur Gegner aus den überlappten Zellen prüfen; tote (per AoE entfernte) überspringen
+            for en in self.enemy_grid.query_rect(rect):
+                if en.hp > 0 and rect.colliderect(en.rect) and self._mask_hit(en, rect):
+                    return en
+            return None
+        # Brute-Force-Pfad (Vergleichsmodus)
+        for en in self.enemies:
+            if rect.colliderect(en.rect) and self._mask_hit(en, rect):
+                return en
+        for en in self.fly_in_enemies:
+            if rect.colliderect(en.rect) and self._mask_hit(en, rect):
+                return en
+        return None
 
-        self.explosion_manager.update()
+    @staticmethod
+    def _mask_hit(en, rect):
+        mask = getattr(en, "mask", None)
+        return mask is None or mask_bank.rect_hits(mask, en.rect, rect)
 
     # ---------------- Draw ----------------
     def _draw(self):
@@ -757,7 +1012,10 @@ class Game:
         else:
             self.screen.fill((0, 0, 0))
 
+        self.particle_manager.draw(self.screen)
         self.projectile_manager.draw(self.screen)
+        self.emitter_manager.draw(self.screen)
+        for beam in self.beams: beam.draw(self.screen)
         for en in self.enemies: en.draw(self.screen)
         for en in self.fly_in_enemies: en.draw(self.screen)
         self.powerup_manager.draw(self.screen)
@@ -848,6 +1106,7 @@ class Game:
                 self._last_stats_log = current_time
 
         self.explosion_manager.print_stats()
+        telemetry.close()
         save_highscore(self.highscore)
         pygame.quit()
 
@@ -925,11 +1184,15 @@ class Game:
 
         self.enemies.clear()
         self.fly_in_enemies.clear()
+        self.enemy_grid.clear()
+        self.beams.clear()
         self.boss = None
 
         self.explosion_manager.clear_all()
         self.powerup_manager.clear_all()
         self.projectile_manager.clear_all()
+        self.emitter_manager.clear_all()
+        self.particle_manager.clear_all()
 
         # Reset Laufzeit-Status
         self.weapon_cooldowns.update({
@@ -960,11 +1223,15 @@ class Game:
         self.player = None
         self.enemies.clear()
         self.fly_in_enemies.clear()
+        self.enemy_grid.clear()
+        self.beams.clear()
         self.boss = None
 
         self.explosion_manager.clear_all()
         self.powerup_manager.clear_all()
         self.projectile_manager.clear_all()
+        self.emitter_manager.clear_all()
+        self.particle_manager.clear_all()
 
     def _update_shield_scale(self):
         if self.shield:
@@ -1,13 +1,17 @@
 from .explosion_manager import ExplosionManager
 from .powerup_manager import PowerUpManager
 from .projectile_manager import ProjectileManager
+from .emitter_manager import EmitterManager
+from .particle_manager import ParticleManager
 from .asset_manager import AssetManager
 
 __all__ = [
     'ExplosionManager',
     'PowerUpManager', 
     'ProjectileManager',
+    'EmitterManager',
+    'ParticleManager',
     'AssetManager'
 ]
 
-__all__ = ['ExplosionManager', 'PowerUpManager', 'ProjectileManager', 'AssetManager']
+__all__ = ['ExplosionManager', 'PowerUpManager', 'ProjectileManager', 'EmitterManager', 'ParticleManager', 'AssetManager']
@@ -0,0 +1,317 @@
+# manager/emitter_manager.py
+"""
+EmitterManager - datengetriebene Bullet-Patterns der Gegner (config/patterns.py).
+
+Ein laufendes Pattern (Emitter) feuert Salven; jede Salve ist ein BulletBatch mit
+gemeinsamem Ursprung, Start-Tick, Tempo und accel plus Winkel-Array. Alle Kugeln eines Batches
+haben nach n Ticks denselben Weg s(n) (geschlossene Form wie ProjectileTrajectories),
+die Positionen sind also ox + sin * s, oy + cos * s.
+
+- Physik-Tick: nur ein Zähler; ein Batch verschwindet über das TimerWheel, sobald s(n) die
+  weiteste Viewport-Ecke überschreitet (bzw. nach der Lebensdauer aus CULL_CONFIG)
+- Kollision: Ring-Test pro Batch (Abstand Ursprung -> Spieler/Schild gegen [s_prev, s]),
+  erst dann vektorisiert pro Kugel; Treffer kommen als PatternBullet-Views in die Event-Liste
+- Draw: ein screen.blits pro Batch
+
+Ohne numpy werden die Salven als normale Projektile über den ProjectileManager gefeuert.
+"""
+import math
+from itertools import repeat
+import pygame
+from config import WIDTH, HEIGHT, PHYSICS_HZ, CULL_CONFIG
+from config.patterns import PATTERN_CONFIG
+from system.timer_wheel import TimerWheel
+from manager.projectile_soa import np
+from manager.projectile_trajectory import travel, ticks_until
+from entities.projectile import Projectile
+
+
+class PatternSpec:
+    """Kompiliertes Pattern: Winkel-Offsets, Salven, Bild und Schaden"""
+
+    __slots__ = ("name", "offsets", "spin", "aimed", "volleys", "interval", "speed", "accel",
+                 "img", "dmg", "size")
+
+    def __init__(self, name, assets):
+        cfg   = PATTERN_CONFIG[name]
+        ptype = cfg.get("type", "ring")
+        if ptype in ("ring", "spiral"):
+            count = max(1, int(cfg.get("arms" if ptype == "spiral" else "count", 1)))
+            self.offsets = tuple(i * 360.0 / count for i in range(count))
+            self.spin    = float(cfg.get("step_deg" if ptype == "spiral" else "spin_deg", 0.0))
+        else:
+            count  = max(1, int(cfg.get("count", 1)))
+            spread = float(cfg.get("spread_deg", 0.0))
+            self.offsets = (0.0,) if count == 1 else tuple(
+                -spread / 2 + spread * i / (count - 1) for i in range(count))
+            self.spin = float(cfg.get("spin_deg", 0.0))
+        self.name     = name
+        self.aimed    = bool(cfg.get("aimed", ptype == "burst"))
+        self.volleys  = max(1, int(cfg.get("volleys", 1)))
+        self.interval = float(cfg.get("interval_ms", 0))
+        self.speed    = float(cfg.get("speed", 4.0))
+        self.accel    = float(cfg.get("accel", 1.0))
+
+        bullet = cfg.get("bullet", {})
+        self.dmg  = bullet.get("dmg", 10)
+        size      = tuple(bullet.get("size", (8, 8)))
+        img       = assets.get(bullet.get("img", "blaster_img"))
+        if img is None:
+            img = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.circle(img, (255, 140, 40), (size[0] // 2, size[1] // 2), min(size) // 2)
+        elif img.get_size() != size:
+            img = pygame.transform.smoothscale(img, size)
+        self.img  = img
+        self.size = size
+
+    def angles(self, volley, aim_deg=0.0):
+        """Winkel (Grad) aller Kugeln einer Salve"""
+        base = volley * self.spin + (aim_deg if self.aimed else 0.0)
+        return [base + off for off in self.offsets]
+
+
+class BulletBatch:
+    """Eine Salve: gemeinsamer Ursprung/Start-Tick/Tempo, pro Kugel nur Richtung und alive"""
+
+    __slots__ = ("spec", "ox", "oy", "t0", "sin", "cos", "alive", "live", "step", "b", "w", "h")
+
+    def __init__(self, spec, ox, oy, t0, angles_deg, k):
+        rad = np.radians(np.asarray(angles_deg, dtype=np.float64))
+        self.spec  = spec
+        self.ox    = float(ox)
+        self.oy    = float(oy)
+        self.t0    = t0
+        self.sin   = np.sin(rad)
+        self.cos   = np.cos(rad)
+        self.alive = np.ones(rad.size, dtype=bool)
+        self.live  = int(rad.size)
+        self.step  = k * spec.speed
+        self.b     = spec.accel ** k
+        self.w, self.h = spec.size
+
+    def travel(self, tick):
+        return travel(tick - self.t0, self.step, self.b)
+
+    def topleft(self, s, idx):
+        """Rect-Ecken (int) der Kugeln idx bei Weg s"""
+        x = np.floor(self.ox + self.sin[idx] * s - self.w / 2).astype(np.int64)
+        y = np.floor(self.oy + self.cos[idx] * s - self.h / 2).astype(np.int64)
+        return x, y
+
+
+class PatternBullet:
+    """View einer getroffenen Kugel: rect/prev/dmg wie ein Gegner-Projektil in den Treffer-Events"""
+
+    __slots__ = ("batch", "index", "rect", "prev_x", "prev_y", "dmg", "kind", "owner")
+
+    def __init__(self, batch, index, x, y, px, py):
+        self.batch  = batch
+        self.index  = index
+        self.rect   = pygame.Rect(x, y, batch.w, batch.h)
+        self.prev_x = px
+        self.prev_y = py
+        self.dmg    = batch.spec.dmg
+        self.kind   = "pattern"
+        self.owner  = "enemy"
+
+
+class EmitterManager:
+    """Startet Patterns, feuert ihre Salven und verwaltet die Kugel-Batches"""
+
+    def __init__(self, assets, projectile_manager=None):
+        self.assets  = assets
+        self.projectile_manager = projectile_manager  # Fallback ohne numpy
+        self.batches = []   # aktive BulletBatches
+        self._running = []  # [PatternSpec, Gegner, nächste Salve, nächste Zeit in ms]
+        self._specs  = {}
+        self._despawn = TimerWheel()
+        self._dead   = False  # Batch ohne lebende Kugeln -> beim nächsten Tick aufräumen
+        self.tick      = 0
+        self.prev_tick = 0   # Tick des letzten Kollisionsdurchgangs (Swept-Pfad)
+        self.k         = 60.0 / PHYSICS_HZ
+        self.viewport  = (WIDTH, HEIGHT)
+        ttl = CULL_CONFIG.get("ttl_ms")
+        self._ttl_ticks = None if ttl is None else int(ttl * PHYSICS_HZ / 1000.0) + 1
+        self.fired = 0       # Kugeln insgesamt (Statistik)
+
+    def spec(self, name) -> PatternSpec:
+        spec = self._specs.get(name)
+        if spec is None:
+            spec = self._specs[name] = PatternSpec(name, self.assets)
+        return spec
+
+    def set_viewport(self, width, height):
+        self.viewport = (int(width), int(height))
+        self._despawn.clear()
+        for batch in self.batches:
+            self._schedule(batch)
+
+    # --- Emitter ---
+    def start(self, name, enemy, now=None):
+        """Pattern für einen Gegner starten; die erste Salve fällt beim nächsten update()"""
+        now = pygame.time.get_ticks() if now is None else now
+        self._running.append([self.spec(name), enemy, 0, now])
+
+    def update(self, game, now):
+        """Fällige Salven aller laufenden Patterns feuern (höchstens eine pro Pattern und Frame)"""
+        if not self._running:
+            return
+        alive   = game._enemy_alive
+        player  = None if game.player_dead else game.player.rect.center
+        running = []
+        for em in self._running:
+            spec, enemy, volley, next_ms = em
+            if not alive(enemy) or not enemy.can_shoot:
+                continue  # Gegner tot oder per EMP gestört: Pattern bricht ab
+            if now >= next_ms:
+                ox, oy = enemy.rect.centerx, enemy.rect.bottom
+                aim = 0.0
+                if spec.aimed and player is not None:
+                    aim = math.degrees(math.atan2(player[0] - ox, player[1] - oy))
+                self.emit(spec, ox, oy, spec.angles(volley, aim))
+                em[2] = volley = volley + 1
+                em[3] = now + spec.interval
+            if volley < spec.volleys:
+                running.append(em)
+        self._running = running
+
+    def emit(self, spec, ox, oy, angles_deg):
+        """Eine Salve als Batch (ohne numpy: einzelne Projektile)"""
+        self.fired += len(angles_deg)
+        if np is None:
+            pm = self.projectile_manager
+            if pm is None:
+                return
+            for a in angles_deg:
+                rad = math.radians(a)
+                pm.add_enemy_shot(Projectile.spawn(ox, oy, spec.speed * math.sin(rad), spec.speed * math.cos(rad),
+                                                   spec.img, spec.dmg, owner="enemy", kind="pattern",
+                                                   accel=spec.accel))
+            return
+        batch = BulletBatch(spec, ox, oy, self.tick, angles_deg, self.k)
+        self.batches.append(batch)
+        self._schedule(batch)
+
+    def _schedule(self, batch):
+        """Austritt des ganzen Batches: Weg bis zur weitesten Viewport-Ecke (+ Kugelgröße)"""
+        w, h = self.viewport
+        reach = max(math.hypot(cx - batch.ox, cy - batch.oy) for cx in (0, w) for cy in (0, h))
+        n = ticks_until(reach + max(batch.w, batch.h), batch.step, batch.b)
+        if self._ttl_ticks is not None and (n is None or n > self._ttl_ticks):
+            n = self._ttl_ticks
+        if n is not None:
+            self._despawn.schedule(batch.t0 + n, batch)
+
+    # --- Physik ---
+    def physics_update(self, game):
+        """Ein Physik-Tick: Zähler weiter, fällige Batches entfernen (keine Integration)"""
+        self.k = game.physics_step_scale
+        self.tick += 1
+        for batch in self._despawn.advance(self.tick):
+            batch.live = 0
+            self._dead = True
+        if self._dead:
+            self.batches = [b for b in self.batches if b.live]
+            self._dead = False
+
+    def end_collision_pass(self):
+        self.prev_tick = self.tick
+
+    # --- Kollision ---
+    def player_hit_candidates(self, player_rect, circles=(), swept=False) -> list:
+        """
+        PatternBullet-Views aller Kugeln, deren Pfad (swept) bzw. Rect das Player-Rect berührt
+        oder deren Mittelpunkt in einem Kreis (center, radius) liegt (wie collision.player_hit_candidates)
+        """
+        out = []
+        if not self.batches:
+            return out
+        px, py, pw, ph = player_rect
+        center = (px + pw / 2, py + ph / 2)
+        prev = self.prev_tick if swept else self.tick
+        for batch in self.batches:
+            if not batch.live:
+                continue
+            s1 = batch.travel(self.tick)
+            s0 = batch.travel(prev)
+            # Kugel-Mittelpunkte liegen auf dem Ring [s0, s1] um den Ursprung:
+            # Spieler (Umkreis inkl. Kugelgröße) und Schild-Kreise müssen den Ring schneiden
+            zones = [(center, math.hypot((pw + batch.w) / 2, (ph + batch.h) / 2))]
+            zones.extend(circles)
+            for (cx, cy), r in zones:
+                d = math.hypot(cx - batch.ox, cy - batch.oy)
+                if d - r <= s1 and d + r >= s0:
+                    break
+            else:
+                continue
+
+            idx = np.flatnonzero(batch.alive)
+            x, y   = batch.topleft(s1, idx)
+            x0, y0 = batch.topleft(s0, idx) if swept else (x, y)
+            w, h = batch.w, batch.h
+            hit = ((np.minimum(x, x0) < px + pw) & (px < np.maximum(x, x0) + w) &
+                   (np.minimum(y, y0) < py + ph) & (py < np.maximum(y, y0) + h))
+            if circles:
+                cx, cy = x + w // 2, y + h // 2
+                for (ccx, ccy), rad in circles:
+                    hit |= (cx - ccx) ** 2 + (cy - ccy) ** 2 <= rad * rad
+            for j in np.flatnonzero(hit).tolist():
+                out.append(PatternBullet(batch, int(idx[j]), int(x[j]), int(y[j]), int(x0[j]), int(y0[j])))
+        return out
+
+    def remove_bullet(self, bullet) -> bool:
+        """Kugel hinter einem PatternBullet-View entfernen (Treffer)"""
+        batch, i = bullet.batch, bullet.index
+        if not batch.live or not batch.alive[i]:
+            return False
+        batch.alive[i] = False
+        batch.live -= 1
+        if not batch.live:
+            self._dead = True
+        return True
+
+    def clear_circle(self, center, r2) -> int:
+        """Alle Kugeln mit Mittelpunkt im Kreis (Radius²) entfernen (EMP)"""
+        removed = 0
+        cx, cy = center
+        for batch in self.batches:
+            if not batch.live:
+                continue
+            s = batch.travel(self.tick)
+            d = np.hypot(batch.ox - cx, batch.oy - cy)
+            if d - s > math.sqrt(r2) or s - d > math.sqrt(r2):
+                continue  # Ring liegt komplett außerhalb
+            x = batch.ox + batch.sin * s
+            y = batch.oy + batch.cos * s
+            inside = batch.alive & ((x - cx) ** 2 + (y - cy) ** 2 <= r2)
+            cnt = int(inside.sum())
+            if cnt:
+                batch.alive &= ~inside
+                batch.live -= cnt
+                removed += cnt
+                if not batch.live:
+                    self._dead = True
+        return removed
+
+    # --- Draw/Verwaltung ---
+    def draw(self, screen):
+        for batch in self.batches:
+            if not batch.live:
+                continue
+            idx = np.flatnonzero(batch.alive)
+            x, y = batch.topleft(batch.travel(self.tick), idx)
+            screen.blits(zip(repeat(batch.spec.img), zip(x.tolist(), y.tolist())), doreturn=False)
+
+    def clear_all(self):
+        self.batches.clear()
+        self._running.clear()
+        self._despawn.clear()
+        self._dead = False
+
+    def __len__(self):
+        """Anzahl lebender Kugeln"""
+        return sum(b.live for b in self.batches)
+
+    def stats(self) -> dict:
+        return {"batches": len(self.batches), "bullets": len(self), "running": len(self._running),
+                "fired": self.fired}
@@ -1,9 +1,15 @@
 # manager/explosion_manager.py
 import pygame
-import logging
-import time
-import os
+import math
+from config import EXPLOSION_LOD, EXPLOSION_QUALITY
 from entities.explosion import Explosion
+from manager.explosion_soa import ExplosionSoA, np, SET, NFR, X, Y, CX, CY, SCALE, SRC
+from system.frame_cache import frame_cache as shared_frame_cache
+from system.telemetry import telemetry
+
+# Histogramme (feste Buckets) für die Telemetrie
+LIVE_BUCKETS  = (1, 10, 50, 100, 250, 500, 1000, 2500, 5000)
+SCALE_BUCKETS = (0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0)
 
 class ExplosionManager:
     """Optimierter Explosion-Manager mit Pooling und Performance-Limits"""
@@ -13,15 +19,33 @@ class ExplosionManager:
         self.explosions.clear()
         self.inactive_pool.clear()
         self._explosion_queue.clear()
+        if self.soa is not None:
+            self.soa.clear()
 
-    def __init__(self, max_explosions=5000):  # MASSIV erhöht für garantiert genug Explosionen!
-        self.explosions               = []
+    def __init__(self, max_explosions=5000, frame_cache=None, quality=EXPLOSION_QUALITY):  # MASSIV erhöht für garantiert genug Explosionen!
+        # Mit numpy laufen Explosionen als Structure-of-Arrays (ExplosionSoA), sonst als Objekte
+        self.soa                      = ExplosionSoA() if np is not None else None
+        self.explosions               = [] # Explosion-Objekte (nur ohne numpy)
         self.inactive_pool            = [] # Pool für inaktive Explosionen
         self.max_explosions           = max_explosions
-        self.frame_cache              = {} # Cache für skalierte Frames
+        # Skalierte Frames: gemeinsamer FrameCache (Byte-Budget, LRU, beim Laden vorgewärmt)
+        self.frame_cache              = frame_cache if frame_cache is not None else shared_frame_cache
+        self._frame_sets              = {} # Cache-Key -> Index in _sets
+        self._sets                    = [] # Frame-Listen der laufenden Explosionen (SoA: SET + Frame-Index)
+        self._free_sets               = [] # freie Indizes in _sets
+        self._retired                 = [] # vom Cache verdrängt, evtl. noch von laufenden Explosionen benutzt
+        self._seen_evictions          = self.frame_cache.evictions
+        # LOD (nur SoA): nahe Explosionen zusammenfassen, Obergrenze pro Bildschirm-Zelle
+        self._sources                 = {} # (id(frames[0]), len) -> (Index, frames[0])
+        self._source_count            = 0
+        self._lod                     = None
+        self.quality                  = None
+        self.merged                   = 0  # zusammengefasste Explosionen
+        self.replaced                 = 0  # wegen voller Zelle ersetzte Explosionen
+        self.set_quality(quality)
+        self._now                     = pygame.time.get_ticks()
+        self._empty_frames            = None
         self._last_cleanup            = pygame.time.get_ticks()
-        self._last_log                = time.time()
-        self._explosion_count         = 0 # Zähler für Explosionen seit letztem Log
         self._last_add_time           = 0 # Zeitpunkt der letzten Explosion
         self._min_explosion_interval  = 0 # KEINE Verzögerung zwischen Explosionen!
         self._performance_mode        = False # Performance-Modi deaktiviert
@@ -36,128 +60,174 @@ class ExplosionManager:
         self._queue_next_at = 0
         self._queue_interval_ms = 10
 
-        # Setup Logging
-        self.weapon_stats = {}  # Dictionary für Waffen-Statistiken
-        self.enemy_death_count = 0
-        self.explosion_calls = 0
-        self.skipped_explosions = 0
-
-        # Logging konfigurieren
-        log_path = os.path.join(os.path.dirname(__file__), '..', 'explosion_stats.log')
-
-        # Stelle sicher, dass der Logger noch nicht existiert
-        if not logging.getLogger().handlers:
-            logging.basicConfig(level=logging.INFO,
-                            format='%(asctime)s - %(message)s',
-                            filename=log_path)
+        # Statistiken: Zähler/Histogramme in der Telemetrie statt Log-Zeilen pro Explosion
+        self.telemetry = telemetry
+        telemetry.register_histogram("explosions.live", LIVE_BUCKETS)
+        telemetry.register_histogram("explosions.scale", SCALE_BUCKETS)
 
     def add_explosion(self, x, y, frames, fps=24, scale=1.0, weapon_type=None):
         """Fügt eine Explosion hinzu mit Performance-Optimierungen und Object Pooling"""
         current_tick = pygame.time.get_ticks()
 
-        # Waffen-Explosion protokollieren
+        # Waffen-Explosion zählen (nur Zähler, kein Formatieren im Spiel-Thread)
         if weapon_type:
             self.log_weapon_explosion(weapon_type)
-            logging.info(f"Neue Explosion für {weapon_type} an Position ({x}, {y})")
-
-        # KEINE Größenanpassungen mehr - volle Größe immer!
-        actual_scale = scale * 1.2  # Alles 20% größer!
+        self.telemetry.count("explosions")
+        self.telemetry.observe("explosions.scale", scale)
 
         while self._explosion_queue and current_tick >= self._queue_next_at:
             xq, yq, fr, fpsq, sc = self._explosion_queue.pop(0)
-            self._create_explosion(xq, yq, fr, fpsq, sc)
+            self._spawn(xq, yq, fr, fpsq, sc, current_tick)
             self._queue_next_at = current_tick + self._queue_interval_ms
 
         self._last_add_time = current_tick
-        self._explosion_count += 1
-
-        # Performance Logging
-        current_time = time.time()
-        if current_time - self._last_log >= 1.0:  # Log jede Sekunde
-            active_count = len([exp for exp in self.explosions if not exp.done])
-            pool_size = len(self.inactive_pool)
-            cache_size = len(self.frame_cache)
-
-            logging.info("\n=== Performance-Statistiken ===")
-            logging.info(f"Aktive Explosionen: {active_count}")
-            logging.info(f"Pool-Größe: {pool_size}")
-            logging.info(f"Cache-Größe: {cache_size}")
-            logging.info(f"Explosionen/Sekunde: {self._explosion_count}")
-            logging.info(f"FPS: {self._current_fps}")
-            logging.info(f"Performance-Modus: {'Kritisch' if self._severe_performance_mode else 'Normal' if self._performance_mode else 'Aus'}")
-
-            self._explosion_count = 0
-            self._last_log = current_time
-
-            # Zusätzlich Waffenstatistiken loggen
-            logging.info("\n=== Waffen-Statistiken ===")
-            for weapon, stats in self.weapon_stats.items():
-                logging.info(f"\n{weapon}:")
-                logging.info(f"- Kills: {stats['kills']}")
-                logging.info(f"- Ausgelöste Explosionen: {stats['explosions']}")
-                if stats['kills'] > 0:
-                    ratio = stats['explosions'] / stats['kills'] * 100
-                    logging.info(f"- Explosionen/Kill Ratio: {ratio:.1f}%")
-
-        # Versuche zuerst, eine inaktive Explosion wiederzuverwenden
-        explosion = None
+        self._spawn(x, y, frames, fps, scale, current_tick)
+
+    def set_quality(self, quality):
+        """LOD-Stufe aus EXPLOSION_LOD setzen (unbekannte Stufe = kein LOD)"""
+        self.quality = quality
+        self._lod    = EXPLOSION_LOD.get(quality)
+
+    def _spawn(self, x, y, frames, fps, scale, now):
+        """Neue Explosion: eine Zeile im SoA (oder ohne numpy ein Explosion-Objekt aus dem Pool)"""
+        if self.soa is not None:
+            self._spawn_soa(x, y, frames, fps, scale, now)
+            return
+        key, cached_frames = self._get_cached_frames(frames, scale)
+
         if self.inactive_pool:
             explosion = self.inactive_pool.pop()
-            # Setze die Explosion zurück
-            cached_frames = self._get_cached_frames(frames, scale)
             explosion.frames = cached_frames
             explosion.rect = cached_frames[0].get_rect(center=(x, y))
             explosion.fps = max(1, int(fps))
-            explosion._t_last = pygame.time.get_ticks()
+            explosion._t_last = now
             explosion._i = 0
             explosion.done = False
-
-        if explosion is None:
-            # Wenn kein Pool-Objekt verfügbar, erstelle neue Explosion
-            if len(self.explosions) >= self.max_explosions:
-                # Finde die älteste Explosion
-                oldest_idx = next((i for i, exp in enumerate(self.explosions) if exp.done), 0)
-                # Recycling: Verschiebe die älteste in den Pool
-                self.inactive_pool.append(self.explosions[oldest_idx])
-                # Erstelle neue an dieser Position
-                explosion = self._create_explosion(x, y, frames, fps, scale)
-                self.explosions[oldest_idx] = explosion
-            else:
-                explosion = self._create_explosion(x, y, frames, fps, scale)
-                self.explosions.append(explosion)
+            explosion._current_frame = cached_frames[0]
+        else:
+            explosion = Explosion(x, y, cached_frames, fps)
+        if len(self.explosions) >= self.max_explosions:
+            self.explosions.pop(0)  # älteste ersetzen
+        self.explosions.append(explosion)
+
+    def _spawn_soa(self, x, y, frames, fps, scale, now):
+        """
+        SoA-Zeile anlegen. Mit LOD wird eine frische Explosion derselben Frames in der Nähe
+        vergrößert statt eine neue anzulegen; in einer vollen Zelle ersetzt sie die älteste.
+        """
+        frames = self._source(frames)
+        src    = self._source_index(frames)
+        soa    = self.soa
+        lod    = self._lod
+        slot   = -1
+        if lod is not None and soa.n:
+            i = soa.nearest(src, x, y, lod["merge_px"], now - lod["merge_ms"])
+            if i >= 0:
+                self._merge(i, x, y, frames, scale)
+                return
+            slot = soa.oldest_in_cell(x, y, lod["region_px"], lod["per_region"])
+
+        key, cached_frames = self.frame_cache.get(frames, scale)
+        w, h = cached_frames[0].get_size()
+        # Blit-Position wie Explosion.rect (Frame 0 zentriert), ms pro Frame wie Explosion.update
+        bx, by = int(x) - w // 2, int(y) - h // 2
+        sid, nfr, step = self._set_index(key, cached_frames), len(cached_frames), 1000 // max(1, int(fps))
+        if slot >= 0:
+            soa.data[:, slot] = (now, step, sid, nfr, bx, by, x, y, scale, src)
+            self.replaced += 1
+        else:
+            soa.add(bx, by, sid, nfr, step, now, limit=self.max_explosions,
+                    center=(x, y), scale=scale, src=src)
+
+    def _merge(self, i, x, y, frames, scale):
+        """Explosion i und die neue zu einer größeren zusammenfassen (Start und Tempo bleiben)"""
+        d     = self.soa.data
+        old   = d[SCALE, i]
+        wa    = old * old
+        wb    = scale * scale
+        cx    = (d[CX, i] * wa + x * wb) / (wa + wb)
+        cy    = (d[CY, i] * wa + y * wb) / (wa + wb)
+        target = min(math.sqrt(wa + wb), self._lod["max_scale"])
+        # auf eine gecachte Skalierung runden (größte vorgewärmte ist die Obergrenze), nie kleiner
+        cached = self.frame_cache.scales(frames)
+        if cached:
+            target = min(target, cached[-1])
+            target = next((s for s in cached if s >= target), target)
+        target = max(target, old)
+
+        key, merged = self.frame_cache.get(frames, target)
+        w, h = merged[0].get_size()
+        d[X, i]     = int(cx) - w // 2
+        d[Y, i]     = int(cy) - h // 2
+        d[SET, i]   = self._set_index(key, merged)
+        d[NFR, i]   = len(merged)
+        d[CX, i]    = cx
+        d[CY, i]    = cy
+        d[SCALE, i] = target
+        self.merged += 1
+
+    def lod_stats(self) -> dict:
+        live = len(self.soa) if self.soa is not None else len(self.explosions)
+        return {"quality": self.quality, "live": live, "merged": self.merged, "replaced": self.replaced}
+
+    def _source(self, frames):
+        if not frames:
+            # Platzhalter einmal bauen, damit der Cache-Key (und das Frame-Set) stabil bleibt
+            if self._empty_frames is None:
+                self._empty_frames = [pygame.Surface((1, 1), pygame.SRCALPHA)]
+            return self._empty_frames
+        return frames
+
+    def _source_index(self, frames):
+        """Stabiler Index der Quell-Frames (Zusammenfassen nur bei gleicher Quelle)"""
+        skey  = (id(frames[0]), len(frames))
+        entry = self._sources.get(skey)
+        if entry is None or entry[1] is not frames[0]:
+            entry = self._sources[skey] = (self._source_count, frames[0])
+            self._source_count += 1
+        return entry[0]
 
     def _get_cached_frames(self, frames, scale):
-        """Holt oder erstellt gecachte Frames"""
-        if not frames:
-            return [pygame.Surface((1, 1), pygame.SRCALPHA)]
-
-        # Cache-Key für skalierte Frames
-        cache_key = (id(frames[0]), scale, len(frames))
-
-        if cache_key not in self.frame_cache:
-            if scale != 1.0:
-                # Skalierung nur einmal berechnen und cachen
-                scaled_frames = []
-                for frame in frames:
-                    new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-                    scaled_frame = pygame.transform.smoothscale(frame, new_size)
-                    scaled_frames.append(scaled_frame)
-                self.frame_cache[cache_key] = scaled_frames
+        """(Cache-Key, Frames) aus dem FrameCache; fehlende Skalierungen kommen als Platzhalter"""
+        return self.frame_cache.get(self._source(frames), scale)
+
+    def _set_index(self, key, frames):
+        """Index des Frame-Sets in _sets (neu belegt, wenn der Cache die Frames neu gebaut hat)"""
+        sid = self._frame_sets.get(key)
+        if sid is not None:
+            if self._sets[sid] is frames:
+                return sid
+            self._retired.append(sid)
+        sid = self._free_sets.pop() if self._free_sets else len(self._sets)
+        if sid == len(self._sets):
+            self._sets.append(frames)
+        else:
+            self._sets[sid] = frames
+        self._frame_sets[key] = sid
+        return sid
+
+    def _release_sets(self):
+        """Vom Cache verdrängte Frame-Sets freigeben, sobald keine Explosion sie mehr zeigt"""
+        cache = self.frame_cache
+        if cache.evictions != self._seen_evictions:
+            self._seen_evictions = cache.evictions
+            for key, sid in list(self._frame_sets.items()):
+                if cache.frames_for(key) is not self._sets[sid]:
+                    del self._frame_sets[key]
+                    self._retired.append(sid)
+        if not self._retired:
+            return
+        live = self.soa.live_sets()
+        retired, self._retired = self._retired, []
+        for sid in retired:
+            if sid in live:
+                self._retired.append(sid)
             else:
-                self.frame_cache[cache_key] = frames
-
-        return self.frame_cache[cache_key]
-
-    def _create_explosion(self, x, y, frames, fps, scale):
-        """Erstellt Explosion mit gecachten Frames"""
-        cached_frames = self._get_cached_frames(frames, scale)
-        explosion = Explosion(x, y, cached_frames, fps)
-        logging.info(f"Explosion erstellt bei ({x}, {y}) mit {len(cached_frames)} Frames bei {fps} FPS")
-        return explosion
+                self._sets[sid] = None
+                self._free_sets.append(sid)
 
     def update(self):
         """Effizientes Update mit Object Pooling und Performance Monitoring"""
-        update_start = time.time()
         current_time = pygame.time.get_ticks()
 
         # FPS Berechnung (nur für Statistiken, keine Performance-Anpassungen mehr)
@@ -182,87 +252,85 @@ class ExplosionManager:
             #     self._severe_performance_mode = False
             #     self._consecutive_low_fps = 0
 
-        # Update alle Explosionen und verschiebe fertige in den Pool
-        active_count = len([exp for exp in self.explosions if not exp.done])
-        update_interval = 1  # IMMER jede Explosion updaten - keine Performance-Modi!
+        self._record_gauges()
 
-        # Performance-Modi komplett deaktiviert für volle Sichtbarkeit aller Explosionen
-        # if self._severe_performance_mode:
-        #     update_interval = 4  # Nur jede vierte Explosion updaten
-        # elif self._performance_mode:
-        #     update_interval = 2  # Nur jede zweite Explosion updaten
+        # Fertige Skalierungen aus dem Hintergrund übernehmen
+        self.frame_cache.poll()
 
+        # SoA: Frame-Indizes aller Explosionen in einer Rechnung, fertige per Swap-Remove raus
+        self._now = current_time
+        if self.soa is not None:
+            self.soa.update(current_time)
+            self._release_sets()
+            return
+
+        # Ohne numpy: alle Explosionen updaten, fertige sofort aus der Liste in den Pool
+        # (sonst könnte ein wiederverwendetes Objekt doppelt in der Liste stehen)
+        alive = []
         for explosion in self.explosions:
-            if not explosion.done:
-                # IMMER updaten - keine Interval-Checks mehr!
-                explosion.update()
-                if explosion.done:
-                    self.inactive_pool.append(explosion)
+            explosion.update()
+            if explosion.done:
+                self.inactive_pool.append(explosion)
+            else:
+                alive.append(explosion)
+        self.explosions = alive
 
-        # Cleanup nur alle 3000ms durchführen - mehr Zeit für Explosionen
+        # Pool-Größe nur alle 3000ms begrenzen
         if current_time - self._last_cleanup >= 3000:
-            cleanup_start = time.time()
             self._last_cleanup = current_time
-
-            # Entferne fertige Explosionen aus der aktiven Liste
-            old_count = len(self.explosions)
-            self.explosions = [exp for exp in self.explosions if not exp.done]
-            removed_count = old_count - len(self.explosions)
-
-            # Begrenze Pool-Größe
-            old_pool_size = len(self.inactive_pool)
             max_pool_size = self.max_explosions * 2
             if len(self.inactive_pool) > max_pool_size:
                 self.inactive_pool = self.inactive_pool[:max_pool_size]
 
-            cleanup_time = (time.time() - cleanup_start) * 1000
-            if removed_count > 0 or old_pool_size != len(self.inactive_pool):
-                logging.info(f"Cleanup: Entfernt {removed_count} Explosionen, "
-                           f"Pool: {len(self.inactive_pool)}/{max_pool_size}, "
-                           f"Zeit: {cleanup_time:.2f}ms")
+    def _record_gauges(self):
+        """Live-Anzahl, Pool und Cache einmal pro Frame in die Telemetrie"""
+        t = self.telemetry
+        live = len(self.soa) if self.soa is not None else len(self.explosions)
+        t.gauge("explosions.live", live)
+        t.gauge("explosions.pool", len(self.inactive_pool))
+        t.gauge("explosions.cache_sets", len(self.frame_cache))
+        t.gauge("explosions.cache_bytes", self.frame_cache.bytes)
+        t.gauge("fps", self._current_fps)
+        t.observe("explosions.live", live)
 
     def register_enemy_death(self, weapon_type=None):
         """Registriert den Tod eines Gegners mit der verwendeten Waffe"""
-        self.enemy_death_count += 1
+        self.telemetry.count("kills")
         if weapon_type:
-            if weapon_type not in self.weapon_stats:
-                self.weapon_stats[weapon_type] = {
-                    'kills': 0,
-                    'explosions': 0,
-                    'skipped': 0
-                }
-            self.weapon_stats[weapon_type]['kills'] += 1
+            self.telemetry.count("kills", weapon_type)
 
     def log_weapon_explosion(self, weapon_type):
         """Registriert eine Explosion für eine bestimmte Waffe"""
-        if weapon_type in self.weapon_stats:
-            self.weapon_stats[weapon_type]['explosions'] += 1
-        self.explosion_calls += 1
+        self.telemetry.count("explosions", weapon_type)
+
+    @property
+    def weapon_stats(self) -> dict:
+        """Waffe -> {"kills", "explosions"} aus den Telemetrie-Zählern"""
+        t = self.telemetry
+        weapons = set(t.counters.get("kills", ())) | set(t.counters.get("explosions", ()))
+        weapons.discard(None)
+        return {w: {"kills": t.get("kills", w), "explosions": t.get("explosions", w)} for w in weapons}
 
     def print_stats(self):
-        """Gibt die gesammelten Statistiken aus"""
-        logging.info("\n=== Explosions-Statistiken ===")
-        logging.info(f"Getötete Gegner insgesamt: {self.enemy_death_count}")
-        logging.info(f"Explosions-Aufrufe insgesamt: {self.explosion_calls}")
-        logging.info(f"Übersprungene Explosionen: {self.skipped_explosions}")
-
-        logging.info("\nStatistiken pro Waffe:")
-        for weapon, stats in self.weapon_stats.items():
-            logging.info(f"\n{weapon}:")
-            logging.info(f"- Kills: {stats['kills']}")
-            logging.info(f"- Ausgelöste Explosionen: {stats['explosions']}")
-            if stats['kills'] > 0:
-                ratio = stats['explosions'] / stats['kills'] * 100
-                logging.info(f"- Explosionen/Kill Ratio: {ratio:.1f}%")
+        """Snapshot der Statistiken sofort an den Telemetrie-Writer geben"""
+        self.telemetry.flush()
 
     def draw(self, screen):
         """Zeichnet alle aktiven Explosionen"""
+        if self.soa is not None:
+            self.soa.draw(screen, self._sets, self._now)
+            return
         for explosion in self.explosions:
             if not explosion.done:
                 explosion.draw(screen)
 
     def clear(self):
-        """Leert alle Explosionen und den Pool"""
+        """Leert alle Explosionen und den Pool (der gemeinsame FrameCache bleibt vorgewärmt)"""
         self.explosions.clear()
         self.inactive_pool.clear()
-        self.frame_cache.clear()
+        self._frame_sets.clear()
+        self._sets.clear()
+        self._free_sets.clear()
+        self._retired.clear()
+        if self.soa is not None:
+            self.soa.clear()
@@ -0,0 +1,118 @@
+# manager/explosion_soa.py
+"""
+ExplosionSoA - Structure-of-Arrays-Speicher für laufende Explosionen.
+
+Pro Explosion nur Start-Tick, ms pro Frame, Frame-Set (Index in eine Liste von Frame-Listen),
+Frame-Anzahl und Blit-Position. Der Frame-Index aller Explosionen ist eine NumPy-Rechnung
+pro Frame: (now - start) // step. Fertige Einträge werden vektorisiert per Swap-Remove entfernt,
+gezeichnet wird mit einem einzigen Surface.blits.
+
+Für das LOD im ExplosionManager stehen Mittelpunkt, Skalierung und Quell-Frames mit im Array:
+nearest() sucht eine frische Explosion derselben Frames zum Zusammenfassen, oldest_in_cell()
+die älteste in einer vollen Bildschirm-Zelle.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy ist optional
+    np = None
+
+# Zeilen des Daten-Arrays
+START, STEP, SET, NFR, X, Y, CX, CY, SCALE, SRC = range(10)
+FIELDS = 10
+
+
+class ExplosionSoA:
+    """Vorallokierte Explosions-Arrays mit Live-Count"""
+
+    __slots__ = ("data", "n")
+
+    def __init__(self, capacity=256):
+        if np is None:
+            raise RuntimeError("ExplosionSoA benötigt numpy")
+        self.data = np.zeros((FIELDS, max(16, int(capacity))), dtype=np.float64)
+        self.n    = 0
+
+    @property
+    def capacity(self):
+        return self.data.shape[1]
+
+    def __len__(self):
+        return self.n
+
+    def add(self, x, y, sid, nfr, step_ms, now, limit=None, center=(0.0, 0.0), scale=1.0, src=-1) -> int:
+        """Neue Explosion (x, y = Blit-Position); bei limit voll ersetzt sie die älteste"""
+        i = self.n
+        if limit is not None and i >= limit:
+            i = int(np.argmin(self.data[START, :i]))
+        else:
+            if i >= self.capacity:
+                data = np.zeros((FIELDS, self.capacity * 2), dtype=np.float64)
+                data[:, :i] = self.data[:, :i]
+                self.data = data
+            self.n = i + 1
+        self.data[:, i] = (now, step_ms, sid, nfr, x, y, center[0], center[1], scale, src)
+        return i
+
+    def nearest(self, src, cx, cy, radius, since) -> int:
+        """Nächste Explosion derselben Quelle mit Start >= since im Radius um (cx, cy), sonst -1"""
+        n, d = self.n, self.data
+        dx = d[CX, :n] - cx
+        dy = d[CY, :n] - cy
+        d2 = dx * dx + dy * dy
+        ok = (d2 <= radius * radius) & (d[SRC, :n] == src) & (d[START, :n] >= since)
+        if not ok.any():
+            return -1
+        return int(np.argmin(np.where(ok, d2, np.inf)))
+
+    def oldest_in_cell(self, cx, cy, cell, cap) -> int:
+        """Älteste Explosion in der Raster-Zelle von (cx, cy), wenn dort schon cap laufen, sonst -1"""
+        n, d = self.n, self.data
+        same = ((np.floor_divide(d[CX, :n], cell) == cx // cell)
+                & (np.floor_divide(d[CY, :n], cell) == cy // cell))
+        if int(same.sum()) < cap:
+            return -1
+        return int(np.argmin(np.where(same, d[START, :n], np.inf)))
+
+    def _frames(self, now):
+        d, n = self.data, self.n
+        return np.floor_divide(now - d[START, :n], d[STEP, :n])
+
+    def update(self, now) -> int:
+        """Entfernt abgelaufene Explosionen (Swap-Remove, vektorisiert); Rückgabe = Anzahl"""
+        n = self.n
+        if not n:
+            return 0
+        done = self._frames(now) >= self.data[NFR, :n]
+        removed = int(done.sum())
+        if not removed:
+            return 0
+        keep = n - removed
+        # Lücken vorne mit Überlebenden aus dem hinteren Teil füllen
+        holes  = np.flatnonzero(done[:keep])
+        movers = np.flatnonzero(~done[keep:]) + keep
+        if holes.size:
+            self.data[:, holes] = self.data[:, movers]
+        self.n = keep
+        return removed
+
+    def live_sets(self) -> set:
+        """Frame-Set-Indizes, die laufende Explosionen noch benutzen"""
+        return set(np.unique(self.data[SET, :self.n]).astype(np.int64).tolist())
+
+    def draw(self, screen, sets, now):
+        """Alle laufenden Explosionen mit einem blits-Aufruf; sets[SET] = Frame-Liste"""
+        n = self.n
+        if not n:
+            return
+        d   = self.data
+        idx = self._frames(now)
+        ok  = (idx >= 0) & (idx < d[NFR, :n])  # Start nach now: noch nichts zeigen (kein frames[-1])
+        sid = d[SET, :n][ok].astype(np.int64).tolist()
+        fid = idx[ok].astype(np.int64).tolist()
+        xs  = d[X, :n][ok].astype(np.int64).tolist()
+        ys  = d[Y, :n][ok].astype(np.int64).tolist()
+        frames = map(list.__getitem__, map(sets.__getitem__, sid), fid)
+        screen.blits(zip(frames, zip(xs, ys)), doreturn=False)
+
+    def clear(self):
+        self.n = 0
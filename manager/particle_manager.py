@@ -0,0 +1,252 @@
+# manager/particle_manager.py
+"""
+ParticleManager - Funken, Trümmer und Raketen-Trails als NumPy-Ring-Buffer.
+
+Alle Partikel liegen in Arrays fester Kapazität (Position, Tempo, Lebensdauer, Farbe); neue
+Partikel überschreiben ab head die ältesten. Ein Frame sind wenige vektorisierte Rechnungen
+über den belegten Teil des Buffers:
+
+- update(): Position += Tempo, Schwerkraft, Dämpfung, Lebensdauer -= dt (auf 60 Hz normiert)
+- draw(): lebende Partikel im Bild als Pixel (Größe 1 oder 2) direkt über surfarray.pixels2d;
+  die Farbe kommt aus einer Tabelle (Farbe x Helligkeitsstufe) im Pixelformat des Screens
+- emit()/emit_many(): Effekte aus config/particles.py, emit_many für viele Ursprünge auf einmal
+  (z.B. emit_trails() hinter allen Raketen)
+
+Ohne numpy gibt es keine Partikel (emit gibt 0 zurück, update/draw tun nichts).
+"""
+import math
+import pygame
+from config import PARTICLE_CAPACITY
+from config.particles import PARTICLE_CONFIG, PARTICLE_TRAILS
+from manager.projectile_soa import np
+
+# Helligkeitsstufen der Farbtabelle (Abdunkeln über die Lebensdauer)
+FADE_LEVELS = 16
+
+
+class ParticleEffect:
+    """Kompilierter Effekt aus PARTICLE_CONFIG (Farben als Indizes in die Palette des Managers)"""
+
+    __slots__ = ("name", "count", "life", "speed", "spread", "damp", "gravity", "size", "colors")
+
+    def __init__(self, name, palette):
+        cfg = PARTICLE_CONFIG[name]
+        self.name    = name
+        self.count   = max(1, int(cfg.get("count", 1)))
+        self.life    = tuple(float(v) for v in cfg.get("life_ms", (300, 300)))
+        self.speed   = tuple(float(v) for v in cfg.get("speed", (1.0, 1.0)))
+        self.spread  = math.radians(float(cfg.get("spread_deg", 360)))
+        self.damp    = 1.0 - float(cfg.get("drag", 1.0))
+        self.gravity = float(cfg.get("gravity", 0.0))
+        self.size    = 2 if int(cfg.get("size", 1)) >= 2 else 1
+        colors = []
+        for c in cfg.get("colors", [(255, 255, 255)]):
+            c = tuple(int(v) for v in c[:3])
+            if c not in palette:
+                palette.append(c)
+            colors.append(palette.index(c))
+        self.colors = np.array(colors, dtype=np.uint16)
+
+
+class ParticleManager:
+    """Ring-Buffer aller Partikel mit vektorisiertem Update und Pixel-Draw"""
+
+    __slots__ = ("capacity", "head", "count", "x", "y", "vx", "vy", "life", "ttl", "damp", "grav",
+                 "color", "size", "_tmp", "_palette", "_effects", "_lut", "_lut_format", "rng",
+                 "_last", "emitted")
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, seed=None):
+        self.capacity  = int(capacity)
+        self.head      = 0  # nächster Schreib-Index
+        self.count     = 0  # belegter Teil [0, count)
+        self._palette  = []
+        self._effects  = {}
+        self._lut      = None
+        self._lut_format = None
+        self._last     = None
+        self.emitted   = 0
+        if np is None:
+            return
+        cap = self.capacity
+        f32 = np.float32
+        self.x, self.y   = np.zeros(cap, f32), np.zeros(cap, f32)
+        self.vx, self.vy = np.zeros(cap, f32), np.zeros(cap, f32)
+        self.life        = np.zeros(cap, f32)  # Rest-Lebensdauer in ms (<= 0: tot)
+        self.ttl         = np.ones(cap, f32)   # Gesamt-Lebensdauer (für die Helligkeit)
+        self.damp        = np.zeros(cap, f32)  # 1 - drag
+        self.grav        = np.zeros(cap, f32)
+        self.color       = np.zeros(cap, np.uint16)
+        self.size        = np.zeros(cap, np.uint8)
+        self._tmp        = np.zeros(cap, f32)
+        self.rng         = np.random.default_rng(seed)
+
+    def __len__(self):
+        """Lebende Partikel"""
+        if np is None or not self.count:
+            return 0
+        return int(np.count_nonzero(self.life[:self.count] > 0))
+
+    def effect(self, name) -> ParticleEffect:
+        fx = self._effects.get(name)
+        if fx is None:
+            fx = self._effects[name] = ParticleEffect(name, self._palette)
+            self._lut = None  # Palette kann gewachsen sein
+        return fx
+
+    # --- Emission ---------------------------------------------------------------------------
+
+    def emit(self, name, x, y, direction=None, count=None) -> int:
+        """Ein Effekt an (x, y); direction = (dx, dy) für gerichtete Effekte"""
+        return self.emit_many(name, (x,), (y,), None if direction is None else (direction,), count)
+
+    def emit_many(self, name, xs, ys, dirs=None, count=None) -> int:
+        """Effekt an vielen Ursprüngen auf einmal; Rückgabe = Anzahl neuer Partikel"""
+        if np is None:
+            return 0
+        fx  = self.effect(name)
+        per = fx.count if count is None else max(0, int(count))
+        m   = len(xs)
+        total = m * per
+        if not total:
+            return 0
+        rng = self.rng
+        src = np.repeat(np.arange(m), per)
+        if dirs is None or fx.spread >= 2 * math.pi:
+            ang = rng.uniform(0.0, 2 * math.pi, total)
+        else:
+            d    = np.asarray(dirs, dtype=np.float64).reshape(m, 2)
+            base = np.arctan2(d[:, 1], d[:, 0])
+            ang  = base[src] + rng.uniform(-0.5 * fx.spread, 0.5 * fx.spread, total)
+        sp   = rng.uniform(fx.speed[0], fx.speed[1], total)
+        life = rng.uniform(fx.life[0], fx.life[1], total)
+        col  = fx.colors[rng.integers(0, len(fx.colors), total)]
+        px   = np.asarray(xs, dtype=np.float32)[src]
+        py   = np.asarray(ys, dtype=np.float32)[src]
+
+        cap = self.capacity
+        if total > cap:  # mehr als der Buffer: nur die letzten cap zählen
+            cut = total - cap
+            ang, sp, life, col, px, py = ang[cut:], sp[cut:], life[cut:], col[cut:], px[cut:], py[cut:]
+            total = cap
+        idx = (self.head + np.arange(total)) % cap
+        self.x[idx]     = px
+        self.y[idx]     = py
+        self.vx[idx]    = np.cos(ang) * sp
+        self.vy[idx]    = np.sin(ang) * sp
+        self.life[idx]  = life
+        self.ttl[idx]   = life
+        self.damp[idx]  = fx.damp
+        self.grav[idx]  = fx.gravity
+        self.color[idx] = col
+        self.size[idx]  = fx.size
+        self.head  = int((self.head + total) % cap)
+        self.count = min(cap, self.count + total)
+        self.emitted += total
+        return total
+
+    def emit_trails(self, shots) -> int:
+        """Trail hinter jedem Schuss mit Eintrag in PARTICLE_TRAILS (pro Effekt ein emit_many)"""
+        if np is None:
+            return 0
+        groups = {}
+        for shot in shots:
+            name = PARTICLE_TRAILS.get(shot.kind)
+            if name is None:
+                continue
+            g = groups.get(name)
+            if g is None:
+                g = groups[name] = ([], [], [])
+            cx, cy = shot.rect.center
+            dx, dy = shot._dir
+            g[0].append(cx - dx * 0.5 * shot.rect.height)  # am Heck
+            g[1].append(cy - dy * 0.5 * shot.rect.height)
+            g[2].append((-dx, -dy))
+        return sum(self.emit_many(name, xs, ys, dirs) for name, (xs, ys, dirs) in groups.items())
+
+    # --- Frame ------------------------------------------------------------------------------
+
+    def update(self, now):
+        """Ein Frame: Bewegung, Schwerkraft, Dämpfung und Lebensdauer (dt aus now in ms)"""
+        last, self._last = self._last, now
+        n = self.count
+        if np is None or last is None or not n:
+            return
+        dt = min(max(now - last, 0), 100)  # Ruckler nicht als Riesen-Schritt
+        if not dt:
+            return
+        k   = dt * 0.06  # 60-Hz-Frames
+        tmp = self._tmp[:n]
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        np.multiply(vx, k, out=tmp); x += tmp
+        np.multiply(vy, k, out=tmp); y += tmp
+        np.multiply(self.grav[:n], k, out=tmp); vy += tmp
+        # drag^k linear genähert: 1 - (1 - drag) * k
+        np.multiply(self.damp[:n], -k, out=tmp); tmp += 1.0
+        np.maximum(tmp, 0.0, out=tmp)
+        vx *= tmp
+        vy *= tmp
+        self.life[:n] -= dt
+
+    def _color_lut(self, screen):
+        """Farbtabelle (Palette x FADE_LEVELS) als gemappte Pixelwerte des Screens"""
+        fmt = (screen.get_shifts(), screen.get_losses(), screen.get_masks()[3])
+        if self._lut is None or self._lut_format != fmt or len(self._lut) != len(self._palette):
+            (rs, gs, bs, _), (rl, gl, bl, _), amask = fmt
+            pal   = np.array(self._palette or [(0, 0, 0)], dtype=np.float64)
+            fade  = (np.arange(FADE_LEVELS) + 1.0) / FADE_LEVELS
+            rgb   = (pal[:, None, :] * fade[None, :, None]).astype(np.uint32)
+            self._lut = (((rgb[..., 0] >> rl) << rs) | ((rgb[..., 1] >> gl) << gs)
+                         | ((rgb[..., 2] >> bl) << bs) | np.uint32(amask)).astype(np.uint32)
+            self._lut_format = fmt
+        return self._lut
+
+    def draw(self, screen):
+        """Lebende Partikel im Bild als Pixel; Größe 2 = 2x2 Block"""
+        n = self.count
+        if np is None or not n:
+            return
+        w, h = screen.get_size()
+        x, y, life = self.x[:n], self.y[:n], self.life[:n]
+        ok  = (life > 0) & (x >= 0) & (y >= 0) & (x < w - 1) & (y < h - 1)
+        idx = np.flatnonzero(ok)
+        if not idx.size:
+            return
+        xi = x[idx].astype(np.intp)
+        yi = y[idx].astype(np.intp)
+        level = (life[idx] * (FADE_LEVELS / self.ttl[idx])).astype(np.intp)
+        np.minimum(level, FADE_LEVELS - 1, out=level)
+        big = self.size[idx] == 2
+
+        if screen.get_bytesize() != 4:
+            # Nur 32-Bit-Surfaces direkt; sonst (selten) einzeln füllen
+            pal = self._palette
+            for px_, py_, c, lv, b in zip(xi.tolist(), yi.tolist(), self.color[idx].tolist(),
+                                          level.tolist(), big.tolist()):
+                f = (lv + 1) / FADE_LEVELS
+                r, g, bl = pal[c]
+                screen.fill((int(r * f), int(g * f), int(bl * f)), (px_, py_, 1 + b, 1 + b))
+            return
+
+        pixel = self._color_lut(screen)[self.color[idx], level]
+        px = pygame.surfarray.pixels2d(screen)
+        try:
+            px[xi, yi] = pixel
+            if big.any():
+                bx, by, bp = xi[big], yi[big], pixel[big]
+                px[bx + 1, by] = bp
+                px[bx, by + 1] = bp
+                px[bx + 1, by + 1] = bp
+        finally:
+            del px  # Surface-Lock freigeben
+
+    def clear(self):
+        if np is not None and self.count:
+            self.life[:self.count] = 0.0
+        self.head = self.count = 0
+
+    def clear_all(self):
+        self.clear()
+
+    def stats(self) -> dict:
+        return {"alive": len(self), "capacity": self.capacity, "emitted": self.emitted,
+                "effects": len(self._effects)}
@@ -1,72 +1,339 @@
 from typing import List, Optional
+from collections import deque
 import pygame
 import logging
+from config import WIDTH, HEIGHT, CULL_CONFIG, PHYSICS_HZ, PROJECTILE_BUDGETS
+from system.registry import EntityRegistry
+from system.timer_wheel import TimerWheel
+from manager.projectile_soa import ProjectileSoA, np
+from manager.projectile_trajectory import ProjectileTrajectories
+from system.collision import NUMPY_MIN_BATCH
+from system.homing import steer_batch
 
 class ProjectileManager:
     """Zentraler Manager für alle Projektile im Spiel"""
 
-    def clear_all(self):
-        """Entfernt alle Projektile."""
-        self.player_shots.clear()
-        self.enemy_shots.clear()
-
-    def __init__(self, max_projectiles=2000):  # Deutlich erhöht für mehr sichtbare Schüsse
-        self.player_shots: List = []
-        self.enemy_shots: List = []
+    def __init__(self, max_projectiles=2000, backend="objects", pool_limit=1024, budgets=None):  # Deutlich erhöht für mehr sichtbare Schüsse
+        self.player_shots = EntityRegistry()
+        self.enemy_shots  = EntityRegistry()
+        # Admission Control: Live-Zähler pro Owner und (Owner, Kind), Budgets aus PROJECTILE_BUDGETS.
+        # Pro (Owner, Kind) eine FIFO-Queue (eid, Schuss) für die Verdrängung des ältesten
+        budgets = PROJECTILE_BUDGETS if budgets is None else budgets
+        owners  = budgets.get("owners", {})
+        self._owner_caps = {o: None if c.get("max") is None else int(c["max"] * max_projectiles)
+                            for o, c in owners.items()}
+        self._reserve    = {o: int(c.get("reserve", 0) * max_projectiles) for o, c in owners.items()}
+        self._kind_caps  = budgets.get("kinds", {})
+        self._priority   = budgets.get("priority", {})
+        self._evicting   = budgets.get("evict", True)
+        self.live        = {"player": 0, "enemy": 0}
+        self.kind_live   = {}   # (owner, kind) -> Anzahl
+        self.total_live  = 0
+        self._queues     = {}   # (owner, kind) -> deque[(eid, Schuss)], entfernte Einträge lazy
+        self.evicted     = {}   # kind -> Anzahl verdrängt
+        self.rejected    = {}   # kind -> Anzahl abgelehnt
+        # backend="numpy": nicht lenkende Projektile laufen als Structure-of-Arrays,
+        # backend="analytic": dito, aber mit geschlossenen Bahnen statt Integration;
+        # lenkende (homing) behalten ihre Objekt-Physik
+        if np is None or backend not in ("numpy", "analytic"):
+            self.soa = None
+        elif backend == "analytic":
+            self.soa = ProjectileTrajectories(max_projectiles)
+        else:
+            self.soa = ProjectileSoA(max_projectiles)
+        # analytic: Austritt/Ablauf wird beim Spawn vorausberechnet und hier eingeplant
+        self._despawn = TimerWheel() if isinstance(self.soa, ProjectileTrajectories) else None
+        self._tick_ms = 1000.0 / PHYSICS_HZ
+        self._homing = {}  # eid -> lenkendes Projektil (steer_homing; im numpy-Backend mit Objekt-Physik)
+        # Free-Listen pro Kind (Klasse): entfernte Projektile werden per reset() wiederverwendet.
+        # Freigaben landen erst in _released und werden bei compact() frei (Events des Ticks sind dann durch)
+        self._free      = {}
+        self._released  = []
+        self.pool_limit = pool_limit
+        self.pool_hits   = 0
+        self.pool_misses = 0
         self.max_projectiles = max_projectiles
-        self._last_cleanup = pygame.time.get_ticks()
+        # Culling jeden Tick gegen den Viewport (set_viewport bei Resize) und nach Lebensdauer
+        self.viewport  = (WIDTH, HEIGHT)
+        self._limits   = {}   # kind -> ((left, top, right, bottom), margin, ttl_ms)
+        self.clock_ms  = 0.0  # Physik-Zeit (läuft während der Pause nicht weiter)
+        self.culled    = {}   # kind -> Anzahl außerhalb des Viewports entfernt
+        self.expired   = {}   # kind -> Anzahl nach Ablauf der Lebensdauer entfernt
         self._last_limit_warning = 0  # Für Limit-Warnungen
+        # Swept-Kollision: der erste Physik-Schritt nach einem Kollisionsdurchgang merkt sich die Startpositionen
+        self._record_sweep = True
 
     def add_player_shot(self, shot) -> bool:
-        """Fügt einen Spielerschuss hinzu, wenn Limit nicht überschritten"""
-        total = len(self.player_shots) + len(self.enemy_shots)
-        if total < self.max_projectiles:
-            self.player_shots.append(shot)
-            return True
-        # Warnung nur alle 5 Sekunden
-        now = pygame.time.get_ticks()
-        if now - self._last_limit_warning > 5000:
-            self._last_limit_warning = now
-            logging.warning(f"⚠️ Projektil-Limit erreicht! {total}/{self.max_projectiles} - Player-Schuss blockiert")
-        return False
+        """Fügt einen Spielerschuss hinzu (Admission Control: Budgets, ggf. Verdrängung)"""
+        return self._add(shot, "player", self.player_shots)
 
     def add_enemy_shot(self, shot) -> bool:
-        """Fügt einen Gegnerschuss hinzu, wenn Limit nicht überschritten"""
-        total = len(self.player_shots) + len(self.enemy_shots)
-        if total < self.max_projectiles:
-            self.enemy_shots.append(shot)
-            return True
-        # Warnung nur alle 5 Sekunden
-        now = pygame.time.get_ticks()
-        if now - self._last_limit_warning > 5000:
-            self._last_limit_warning = now
-            logging.warning(f"⚠️ Projektil-Limit erreicht! {total}/{self.max_projectiles} - Enemy-Schuss blockiert")
-        return False
+        """Fügt einen Gegnerschuss hinzu (Admission Control: Budgets, ggf. Verdrängung)"""
+        return self._add(shot, "enemy", self.enemy_shots)
+
+    def _add(self, shot, owner, registry) -> bool:
+        if not self._admit(shot, owner):
+            kind = shot.kind
+            self.rejected[kind] = self.rejected.get(kind, 0) + 1
+            # Warnung nur alle 5 Sekunden
+            now = pygame.time.get_ticks()
+            if now - self._last_limit_warning > 5000:
+                self._last_limit_warning = now
+                logging.warning(f"⚠️ Projektil-Budget erschöpft! {self.total_live}/{self.max_projectiles} - "
+                                f"{owner}-Schuss ({kind}) blockiert")
+            return False
+        registry.add(shot)
+        key = (owner, shot.kind)
+        self.live[owner] = self.live.get(owner, 0) + 1
+        self.kind_live[key] = self.kind_live.get(key, 0) + 1
+        self.total_live += 1
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+        queue.append((shot.eid, shot))
+        self._attach(shot)
+        return True
+
+    def _admit(self, shot, owner) -> bool:
+        """Budget von (Owner, Kind), Owner und Gesamtlimit prüfen; volle Budgets verdrängen oder lehnen ab"""
+        kind = shot.kind
+        prio = self._priority.get(kind, 0)
+        cap = self._kind_caps.get(owner, {}).get(kind)
+        if cap is not None and self.kind_live.get((owner, kind), 0) >= cap:
+            if not self._evict(((owner, kind),), prio):
+                return False
+        cap = self._owner_caps.get(owner)
+        if cap is not None and self.live.get(owner, 0) >= cap:
+            if not self._evict([k for k in self._queues if k[0] == owner], prio):
+                return False
+        if self.total_live >= self._total_limit(owner):
+            # Nur Owner über ihrer Reserve (oder der eigene) geben Plätze ab
+            live, reserve = self.live, self._reserve
+            keys = [k for k in self._queues if k[0] == owner or live.get(k[0], 0) > reserve.get(k[0], 0)]
+            if not self._evict(keys, prio):
+                return False
+        return True
+
+    def _total_limit(self, owner) -> int:
+        """Gesamtlimit für owner: max_projectiles abzüglich der noch freien Reserven anderer Owner"""
+        limit = self.max_projectiles
+        for other, reserve in self._reserve.items():
+            if other != owner and reserve:
+                limit -= max(0, reserve - self.live.get(other, 0))
+        return limit
+
+    def _oldest(self, key):
+        """Ältester lebender Schuss von (Owner, Kind); entfernte Einträge fallen dabei aus der Queue"""
+        queue = self._queues.get(key)
+        while queue:
+            eid, shot = queue[0]
+            if shot.eid == eid and self.is_alive(shot):
+                return shot
+            queue.popleft()
+        return None
+
+    def _evict(self, keys, prio) -> bool:
+        """Verdrängt den Schuss mit niedrigster Priorität (<= prio), darin den ältesten"""
+        if not self._evicting:
+            return False
+        best = None
+        for key in keys:
+            p = self._priority.get(key[1], 0)
+            if p > prio:
+                continue
+            shot = self._oldest(key)
+            if shot is not None and (best is None or (p, shot.born) < best[0]):
+                best = ((p, shot.born), shot)
+        if best is None:
+            return False
+        victim = best[1]
+        self.remove_shot(victim)
+        self.evicted[victim.kind] = self.evicted.get(victim.kind, 0) + 1
+        return True
+
+    def budget_stats(self) -> dict:
+        """Live-Zähler und Budget-Ereignisse (z.B. fürs HUD/Telemetrie)"""
+        return {"total": self.total_live, "limit": self.max_projectiles, "live": dict(self.live),
+                "kinds": {f"{o}:{k}": n for (o, k), n in self.kind_live.items() if n},
+                "evicted": dict(self.evicted), "rejected": dict(self.rejected)}
+
+    def acquire(self, cls, *args, **kwargs):
+        """Projektil der Klasse cls: freies Objekt per reset() oder (Miss) neu gebaut"""
+        free = self._free.get(cls)
+        if free:
+            self.pool_hits += 1
+            shot = free.pop()
+            shot.reset(*args, **kwargs)
+            return shot
+        self.pool_misses += 1
+        return cls(*args, **kwargs)
+
+    def pool_stats(self) -> dict:
+        return {"hits": self.pool_hits, "misses": self.pool_misses,
+                "free": sum(len(f) for f in self._free.values())}
+
+    def set_viewport(self, width, height):
+        """Viewport-Größe für das Culling (beim Start und nach jedem Resize aufrufen)"""
+        self.viewport = (int(width), int(height))
+        self._limits.clear()
+        if self._despawn is not None:
+            # Geplante Austritte gelten für den alten Viewport
+            self._despawn.clear()
+            for shot in self.soa.objs:
+                _, margin, ttl = self._kind_limits(shot.kind)
+                self._schedule_despawn(shot, margin, ttl)
+
+    def _kind_limits(self, kind):
+        """Cull-Grenzen und Lebensdauer eines Kinds aus CULL_CONFIG (pro Viewport gecacht)"""
+        lim = self._limits.get(kind)
+        if lim is None:
+            cfg    = CULL_CONFIG["kinds"].get(kind, {})
+            margin = cfg.get("margin", CULL_CONFIG["margin"])
+            ttl    = cfg.get("ttl_ms", CULL_CONFIG["ttl_ms"])
+            w, h   = self.viewport
+            lim = self._limits[kind] = ((-margin, -margin, w + margin, h + margin),
+                                        float(margin), float("inf") if ttl is None else float(ttl))
+        return lim
+
+    def _cull(self, shot, counter):
+        if self.remove_shot(shot):
+            counter[shot.kind] = counter.get(shot.kind, 0) + 1
+
+    def cull_stats(self) -> dict:
+        return {"culled": dict(self.culled), "expired": dict(self.expired)}
+
+    def _attach(self, shot):
+        shot.born = self.clock_ms
+        if getattr(shot, "homing", False):
+            self._homing[shot.eid] = shot
+        elif self.soa is not None:
+            _, margin, ttl = self._kind_limits(shot.kind)
+            self.soa.add(shot, margin, ttl)
+            if self._despawn is not None:
+                self._schedule_despawn(shot, margin, ttl)
+
+    def _schedule_despawn(self, shot, margin, ttl):
+        """analytic: Tick des Austritts (oder Ablaufs der Lebensdauer) einmal beim Spawn einplanen"""
+        due = self.soa.exit_tick(shot, self.viewport, margin)
+        expired = False
+        if ttl != float("inf"):
+            # wie clock - born > ttl in physics_update
+            ttl_tick = self.soa.spawn_tick(shot) + int(ttl // self._tick_ms) + 1
+            if due is None or ttl_tick < due:
+                due, expired = ttl_tick, True
+        if due is not None:
+            self._despawn.schedule(due, (shot, shot.eid, expired))
+
+    def _detach(self, shot):
+        if self._homing.pop(shot.eid, None) is None and self.soa is not None:
+            self.soa.remove(shot)
+
+    def steer_homing(self, game):
+        """
+        Lenkt alle Homing-Projektile einmal pro Frame (nach der Gegner-Bewegung).
+        Zielwahl pro Projektil, die Lenk-Rechnung ab NUMPY_MIN_BATCH gebündelt in steer_batch.
+        """
+        shots = list(self._homing.values())
+        if np is None or len(shots) < NUMPY_MIN_BATCH:
+            for shot in shots:
+                shot.update(game)
+            return
+
+        now  = pygame.time.get_ticks()
+        n    = len(shots)
+        nan  = float("nan")
+        rows = []
+        for shot in shots:
+            if shot.accel != 1.0:
+                shot._speed *= shot.accel
+            target = shot.homing_target(game, now)
+            tx, ty = target.rect.center if target is not None else (nan, nan)
+            cx, cy = shot.rect.center
+            angle  = shot.min_steer_angle
+            rows.append((shot._dir[0], shot._dir[1], shot.vx, shot.vy, cx, cy, tx, ty, shot._speed,
+                         min(shot.homing_strength, shot.max_turn_rate),
+                         float("-inf") if angle is None else angle))
+        a = np.array(rows, dtype=np.float64).reshape(n, 11)
+        dirs, vel, corrected = steer_batch(a[:, 0:2], a[:, 8], a[:, 2:4], a[:, 4:6], a[:, 6:8],
+                                           a[:, 9], a[:, 10])
+
+        for shot, (dx, dy), (vx, vy), corr in zip(shots, dirs.tolist(), vel.tolist(), corrected.tolist()):
+            shot._dir = (dx, dy)
+            shot.vx, shot.vy = vx, vy
+            if corr and shot.min_steer_angle is not None:
+                shot.course_corrections += 1  # nur Blaster zählen Korrekturen
+            shot.rect.x += int(vx)
+            shot.rect.y += int(vy)
 
     def physics_update(self, game):
-        """Fixed timestep physics update für alle Projektile"""
-        current_time = pygame.time.get_ticks()
-        
-        # Cleanup nur alle 3 Sekunden und mit größerem Bereich
-        if current_time - self._last_cleanup >= 3000:
-            self._last_cleanup = current_time
-            screen_height = game.screen.get_height()
-            # Entferne nur Projektile, die SEHR weit außerhalb des Bildschirms sind
-            self.player_shots = [shot for shot in self.player_shots if 
-                               shot.rect.bottom > -200 and shot.rect.top < screen_height + 200]
-            self.enemy_shots = [shot for shot in self.enemy_shots if 
-                              shot.rect.bottom > -200 and shot.rect.top < screen_height + 200]
-        
-        # Physics-Update für alle Projektile
-        for shot in self.player_shots:
-            shot.physics_update(game)
-                
-        for shot in self.enemy_shots:
+        """Fixed timestep physics update für alle Projektile (inkl. Culling pro Tick)"""
+        self.clock_ms += game.fixed_timestep * 1000.0
+        record = self._record_sweep
+        self._record_sweep = False
+        if self.soa is not None:
+            self._physics_update_soa(game, record)
+            return
+
+        clock, limits = self.clock_ms, self._limits
+        for shots in (self.player_shots, self.enemy_shots):
+            for shot in shots:
+                # Swept-Kollision: der erste Schritt nach einem Kollisionsdurchgang merkt sich den Start
+                if record:
+                    shot.prev_x, shot.prev_y = shot.rect.topleft
+                shot.physics_update(game)
+                bounds, _, ttl = limits.get(shot.kind) or self._kind_limits(shot.kind)
+                if shot.offscreen(bounds):
+                    self._cull(shot, self.culled)
+                elif clock - shot.born > ttl:
+                    self._cull(shot, self.expired)
+
+    def _physics_update_soa(self, game, record):
+        """numpy-Backend: ein Vektor-Schritt für das Array, Objekt-Physik nur für lenkende Projektile"""
+        soa = self.soa
+        soa.step(game.physics_step_scale, record)
+
+        if self._despawn is not None:
+            # analytic: keine Bounds-Prüfung pro Tick, nur die für diesen Tick geplanten Austritte.
+            # Treffer/EMP haben den Schuss evtl. schon entfernt (eid passt dann nicht mehr)
+            for shot, eid, expired in self._despawn.advance(soa.tick):
+                if shot.eid == eid and shot._si >= 0:
+                    self._cull(shot, self.expired if expired else self.culled)
+        else:
+            # Culling jeden Tick (vektorisiert), Rand und Lebensdauer liegen pro Eintrag im Array
+            w, h = self.viewport
+            offscreen, expired = soa.cull_rows(0, 0, w, h, self.clock_ms)
+            for shot in offscreen:
+                self._cull(shot, self.culled)
+            for shot in expired:
+                self._cull(shot, self.expired)
+
+        if not self._homing:
+            return
+        clock, limits = self.clock_ms, self._limits
+        for shot in list(self._homing.values()):
+            if record:
+                shot.prev_x, shot.prev_y = shot.rect.topleft
             shot.physics_update(game)
+            bounds, _, ttl = limits.get(shot.kind) or self._kind_limits(shot.kind)
+            if shot.offscreen(bounds):
+                self._cull(shot, self.culled)
+            elif clock - shot.born > ttl:
+                self._cull(shot, self.expired)
+
+    @property
+    def has_sweep(self) -> bool:
+        """True wenn seit dem letzten Kollisionsdurchgang ein Physik-Schritt lief (prev_x/prev_y gültig)"""
+        return not self._record_sweep
+
+    def end_collision_pass(self):
+        """Nach der Kollisionsprüfung aufrufen: nächster Physik-Schritt startet einen neuen Pfad"""
+        self._record_sweep = True
             
     def update(self, dt: float, screen_height: int):
         """Legacy update - für nicht-physikalische Updates"""
-        pass
+        # numpy-Backend: Positionen einmal pro Frame in die Rects schreiben (vor Kollision/Draw)
+        if self.soa is not None:
+            self.soa.sync_views()
                 
         # Homing-Projektile werden in der Game-Klasse geupdated, damit sie Zugriff auf das Game-Objekt haben
             
@@ -81,18 +348,65 @@ class ProjectileManager:
         """Entfernt alle Projektile"""
         self.player_shots.clear()
         self.enemy_shots.clear()
+        self._released.clear()
+        self.live = {"player": 0, "enemy": 0}
+        self.kind_live.clear()
+        self.total_live = 0
+        self._queues.clear()
+        self._homing.clear()
+        if self.soa is not None:
+            self.soa.clear()
+        if self._despawn is not None:
+            self._despawn.clear()
         
-    def get_player_shots(self) -> List:
-        """Gibt Liste der Spieler-Projektile zurück"""
+    def get_player_shots(self) -> EntityRegistry:
+        """Gibt die Spieler-Projektile zurück (iterierbar, Entfernen währenddessen erlaubt)"""
         return self.player_shots
         
-    def get_enemy_shots(self) -> List:
-        """Gibt Liste der Gegner-Projektile zurück"""
+    def get_enemy_shots(self) -> EntityRegistry:
+        """Gibt die Gegner-Projektile zurück (iterierbar, Entfernen währenddessen erlaubt)"""
         return self.enemy_shots
         
-    def remove_shot(self, shot):
-        """Entfernt ein spezifisches Projektil"""
-        if shot in self.player_shots:
-            self.player_shots.remove(shot)
-        elif shot in self.enemy_shots:
-            self.enemy_shots.remove(shot)
+    def remove_shot(self, shot) -> bool:
+        """Entfernt ein spezifisches Projektil in O(1)"""
+        if self.player_shots.remove(shot):
+            owner = "player"
+        elif self.enemy_shots.remove(shot):
+            owner = "enemy"
+        else:
+            return False
+        self.live[owner] -= 1
+        self.kind_live[(owner, shot.kind)] -= 1
+        self.total_live -= 1
+        self._detach(shot)
+        self._released.append(shot)
+        return True
+
+    def live_of_kind(self, kinds):
+        """Lebende Schüsse der Kinds (beide Owner) aus den Verdrängungs-Queues, ohne Scan aller Schüsse"""
+        queues = self._queues
+        for key in tuple(queues):
+            if key[1] in kinds:
+                for eid, shot in queues[key]:
+                    if shot.eid == eid and self.is_alive(shot):
+                        yield shot
+
+    def is_alive(self, shot) -> bool:
+        """O(1): Ist das Projektil noch aktiv?"""
+        return shot in self.player_shots or shot in self.enemy_shots
+
+    def compact(self):
+        """Schließt die Lücken entfernter Projektile (einmal pro Tick)"""
+        self.player_shots.compact()
+        self.enemy_shots.compact()
+        # Queues der Verdrängung: entfernte Einträge wegräumen, bevor sie die Queue dominieren
+        for key, queue in self._queues.items():
+            if len(queue) > 2 * self.kind_live.get(key, 0) + 64:
+                self._queues[key] = deque(e for e in queue if e[1].eid == e[0] and self.is_alive(e[1]))
+        if self._released:
+            free, limit = self._free, self.pool_limit
+            for shot in self._released:
+                lst = free.setdefault(type(shot), [])
+                if len(lst) < limit:
+                    lst.append(shot)
+            self._released.clear()
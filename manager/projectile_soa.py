@@ -0,0 +1,161 @@
+# manager/projectile_soa.py
+"""
+ProjectileSoA - Structure-of-Arrays-Speicher für nicht lenkende Projektile.
+
+Position, Geschwindigkeit, Richtung, Tempo, accel, dmg, kind, owner sowie Cull-Rand und
+Lebensdauer liegen in einem vorallokierten NumPy-Array (ein Feld pro Zeile, n = Anzahl
+lebender Einträge). Integration, Beschleunigung und Culling laufen als Vektor-Operationen über [:n];
+Entfernen ist Swap-Remove (letzter Eintrag rückt in die Lücke).
+
+Die Projectile-Objekte bleiben als dünne Views (on_hit, draw, Kollision über rect);
+sync_views() schreibt die Positionen einmal pro Frame in ihre Rects zurück.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy ist optional
+    np = None
+
+# Zeilen des Daten-Arrays
+X, Y, PX, PY, W, H, VX, VY, DX, DY, SPEED, ACCEL, DMG, KIND, OWNER, MARGIN, BORN, TTL = range(18)
+X0, Y0, T0 = range(18, 21)  # Startzustand für analytische Bahnen (ProjectileTrajectories)
+FIELDS = 21
+
+OWNER_CODES = {"player": 0, "enemy": 1}
+
+
+class ProjectileSoA:
+    """Vorallokierte Projektil-Arrays mit Live-Count und Swap-Remove"""
+
+    __slots__ = ("data", "n", "objs", "kind_codes", "_tmp", "_dirty")
+
+    def __init__(self, capacity=2000):
+        if np is None:
+            raise RuntimeError("ProjectileSoA benötigt numpy")
+        capacity = max(16, int(capacity))
+        self.data = np.zeros((FIELDS, capacity), dtype=np.float64)
+        self._tmp = np.zeros(capacity, dtype=np.float64)
+        self.n    = 0
+        self.objs = []          # View-Objekte, Index = Spalte im Array
+        self.kind_codes = {}    # kind -> int (wächst bei neuen Kinds)
+        self._dirty = False     # Positionen seit dem letzten sync_views geändert
+
+    @property
+    def capacity(self):
+        return self.data.shape[1]
+
+    def __len__(self):
+        return self.n
+
+    def _grow(self):
+        cap = self.capacity * 2
+        data = np.zeros((FIELDS, cap), dtype=np.float64)
+        data[:, :self.n] = self.data[:, :self.n]
+        self.data = data
+        self._tmp = np.zeros(cap, dtype=np.float64)
+
+    def add(self, shot, margin=0.0, ttl=float("inf")):
+        """Übernimmt den Bewegungszustand des Projektils; shot._si = Spalte"""
+        i = self.n
+        if i >= self.capacity:
+            self._grow()
+        code = self.kind_codes.get(shot.kind)
+        if code is None:
+            code = self.kind_codes[shot.kind] = len(self.kind_codes)
+        r  = shot.rect
+        dx, dy = shot._dir
+        self.data[:, i] = (r.x, r.y, shot.prev_x, shot.prev_y, r.w, r.h,
+                           shot.vx, shot.vy, dx, dy, shot._speed, shot.accel,
+                           shot.dmg, code, OWNER_CODES.get(shot.owner, 1),
+                           margin, shot.born, ttl, r.x, r.y, 0.0)
+        self.objs.append(shot)
+        shot._si = i
+        self.n = i + 1
+
+    def remove(self, shot) -> bool:
+        """Swap-Remove in O(1); False wenn das Projektil nicht im Array liegt"""
+        i = shot._si
+        if i < 0:
+            return False
+        d = self.data
+        # Aktuelle Position in den View übernehmen (z.B. für on_hit nach dem Entfernen)
+        shot.rect.x = int(d[X, i]); shot.rect.y = int(d[Y, i])
+        last = self.n - 1
+        if i != last:
+            d[:, i] = d[:, last]
+            moved = self.objs[last]
+            self.objs[i] = moved
+            moved._si = i
+        self.objs.pop()
+        self.n = last
+        shot._si = -1
+        return True
+
+    def clear(self):
+        for shot in self.objs:
+            shot._si = -1
+        self.objs.clear()
+        self.n = 0
+        self._dirty = False
+
+    def step(self, k=1.0, record_prev=False):
+        """Ein Physik-Schritt für alle Einträge (wie Projectile.physics_update, vektorisiert)"""
+        n = self.n
+        if not n:
+            return
+        d = self.data
+        if record_prev:
+            d[PX, :n] = d[X, :n]
+            d[PY, :n] = d[Y, :n]
+
+        acc = d[ACCEL, :n]
+        idx = np.flatnonzero(acc != 1.0)
+        if idx.size:
+            sp = d[SPEED, idx] * (acc[idx] if k == 1.0 else acc[idx] ** k)
+            d[SPEED, idx] = sp
+            d[VX, idx] = d[DX, idx] * sp
+            d[VY, idx] = d[DY, idx] * sp
+
+        # rect.x += int(vx * k): int() schneidet Richtung 0 ab -> trunc
+        tmp = self._tmp[:n]
+        for pos, vel in ((X, VX), (Y, VY)):
+            if k == 1.0:
+                np.trunc(d[vel, :n], out=tmp)
+            else:
+                np.multiply(d[vel, :n], k, out=tmp)
+                np.trunc(tmp, out=tmp)
+            d[pos, :n] += tmp
+        self._dirty = True
+
+    def cull_rows(self, left, top, right, bottom, clock):
+        """
+        (offscreen, expired): View-Objekte außerhalb des Viewports (+ Rand pro Eintrag),
+        die sich weiter entfernen, und solche mit abgelaufener Lebensdauer (vektorisiert)
+        """
+        n = self.n
+        if not n:
+            return [], []
+        d = self.data
+        x, y, m = d[X, :n], d[Y, :n], d[MARGIN, :n]
+        vx, vy  = d[VX, :n], d[VY, :n]
+        out = (((x + d[W, :n] < left - m) & (vx <= 0)) | ((x > right + m) & (vx >= 0)) |
+               ((y + d[H, :n] < top - m) & (vy <= 0)) | ((y > bottom + m) & (vy >= 0)))
+        old = (clock - d[BORN, :n]) > d[TTL, :n]
+        objs = self.objs
+        return ([objs[i] for i in np.flatnonzero(out).tolist()],
+                [objs[i] for i in np.flatnonzero(old & ~out).tolist()])
+
+    def sync_views(self):
+        """Schreibt Positionen (und Pfad-Start für Swept-Kollision) in die View-Objekte"""
+        if not self._dirty:
+            return
+        n = self.n
+        d = self.data
+        xs  = d[X, :n].astype(np.int64).tolist()
+        ys  = d[Y, :n].astype(np.int64).tolist()
+        pxs = d[PX, :n].astype(np.int64).tolist()
+        pys = d[PY, :n].astype(np.int64).tolist()
+        for shot, x, y, px, py in zip(self.objs, xs, ys, pxs, pys):
+            r = shot.rect
+            r.x = x; r.y = y
+            shot.prev_x = px; shot.prev_y = py
+        self._dirty = False
@@ -0,0 +1,138 @@
+# manager/projectile_trajectory.py
+"""
+ProjectileTrajectories - analytische Bahnen für nicht lenkende Projektile.
+
+Gerade fliegende Schüsse (Laser, Raketen mit konstantem accel, Nuke) brauchen keine
+Integration: gespeichert wird nur der Startzustand (X0, Y0, Richtung, Tempo, accel, Spawn-Tick).
+Pro Tick wird accel^k auf das Tempo angewendet und dann bewegt, nach n Ticks ist der Weg also
+
+    s(n) = k * speed * (b + b^2 + ... + b^n),   b = accel^k
+
+(geometrische Reihe, bei b == 1 einfach k * speed * n). Positionen werden erst bei sync_views()
+berechnet (einmal pro Frame für Kollision und Draw), ein Physik-Tick zählt nur den Tick hoch.
+exit_tick() löst s(n) beim Spawn nach dem Tick auf, an dem der Schuss den Viewport verlässt;
+der Manager plant damit das Entfernen in einem TimerWheel statt jeden Tick zu prüfen.
+
+Abweichung zur Integration: dort schneidet int() jeden Schritt ab, hier wird erst die
+Endposition abgeschnitten (kein Verlust von Sub-Pixel-Bewegung).
+"""
+import math
+from config import PHYSICS_HZ
+from manager.projectile_soa import (ProjectileSoA, np, X, Y, PX, PY, W, H, DX, DY,
+                                    SPEED, ACCEL, X0, Y0, T0)
+
+# Obergrenze für die Austritts-Suche (Schüsse, die so lange fliegen, holt die Lebensdauer)
+MAX_TICKS = 1 << 20
+
+
+def travel(n, step, b):
+    """Zurückgelegter Weg nach n Ticks: step * (b + ... + b^n)"""
+    if n <= 0:
+        return 0.0
+    if b == 1.0:
+        return step * n
+    return step * b * (b ** n - 1.0) / (b - 1.0)
+
+
+def ticks_until(dist, step, b):
+    """Kleinstes n >= 1 mit travel(n, step, b) > dist; None wenn der Weg nie erreicht wird"""
+    if dist < 0:
+        return 1
+    if step <= 0:
+        return None
+    if b == 1.0:
+        n = int(dist // step) + 1
+    elif b > 1.0:
+        n = int(math.log1p(dist * (b - 1.0) / (step * b)) / math.log(b)) + 1
+    else:
+        if dist >= step * b / (1.0 - b):  # Grenzwert der Reihe: bremsende Schüsse kommen nie an
+            return None
+        n = int(math.log1p(-dist * (1.0 - b) / (step * b)) / math.log(b)) + 1
+    # Rundung der Logarithmen ausgleichen
+    while n > 1 and travel(n - 1, step, b) > dist:
+        n -= 1
+    while travel(n, step, b) <= dist:
+        n += 1
+        if n > MAX_TICKS:
+            return None
+    return n
+
+
+class ProjectileTrajectories(ProjectileSoA):
+    """SoA mit Startzustand statt Integration; Positionen pro Frame aus der geschlossenen Form"""
+
+    __slots__ = ("tick", "prev_tick", "k")
+
+    def __init__(self, capacity=2000):
+        super().__init__(capacity)
+        self.tick      = 0  # Physik-Ticks seit Start
+        self.prev_tick = 0  # Tick beim Start des aktuellen Swept-Pfads
+        self.k         = 60.0 / PHYSICS_HZ
+
+    def add(self, shot, margin=0.0, ttl=float("inf")):
+        super().add(shot, margin, ttl)
+        self.data[T0, shot._si] = self.tick
+
+    def spawn_tick(self, shot) -> int:
+        return int(self.data[T0, shot._si])
+
+    def remove(self, shot) -> bool:
+        i = shot._si
+        if i >= 0:
+            d = self.data
+            s = travel(self.tick - int(d[T0, i]), self.k * d[SPEED, i], d[ACCEL, i] ** self.k)
+            d[X, i] = d[X0, i] + d[DX, i] * s
+            d[Y, i] = d[Y0, i] + d[DY, i] * s
+        return super().remove(shot)
+
+    def step(self, k=1.0, record_prev=False):
+        """Ein Physik-Tick: nur der Zähler läuft, gerechnet wird in sync_views()"""
+        self.k = k
+        if record_prev:
+            self.prev_tick = self.tick
+        self.tick += 1
+        self._dirty = self.n > 0
+
+    def exit_tick(self, shot, viewport, margin=0.0):
+        """
+        Tick, an dem der Schuss vollständig außerhalb von Viewport + margin liegt
+        (wie Projectile.offscreen); None wenn er den Viewport nie verlässt
+        """
+        d, i = self.data, shot._si
+        k = self.k
+        step, b = k * d[SPEED, i], d[ACCEL, i] ** k
+        best = None
+        for direction, pos, size, limit in ((d[DX, i], d[X0, i], d[W, i], viewport[0]),
+                                            (d[DY, i], d[Y0, i], d[H, i], viewport[1])):
+            if direction > 0:
+                dist = limit + margin - pos       # linke Kante hinter rechtem Rand
+            elif direction < 0:
+                dist = pos + size + margin        # rechte Kante vor linkem Rand (0)
+            else:
+                continue
+            n = ticks_until(dist / abs(direction), step, b)
+            if n is not None and (best is None or n < best):
+                best = n
+        return None if best is None else int(d[T0, i]) + best
+
+    def _positions(self, tick, xs, ys):
+        n = self.n
+        d = self.data
+        k = self.k
+        ticks = np.maximum(tick - d[T0, :n], 0.0)
+        b     = d[ACCEL, :n] if k == 1.0 else d[ACCEL, :n] ** k
+        lin   = b == 1.0
+        geo   = np.where(lin, ticks, b * (np.power(b, ticks) - 1.0) / np.where(lin, 1.0, b - 1.0))
+        s     = geo * d[SPEED, :n] * k
+        np.multiply(d[DX, :n], s, out=xs); xs += d[X0, :n]
+        np.multiply(d[DY, :n], s, out=ys); ys += d[Y0, :n]
+
+    def sync_views(self):
+        """Positionen (aktueller Tick) und Pfad-Start (prev_tick) berechnen und in die Views schreiben"""
+        if not self._dirty:
+            return
+        n = self.n
+        d = self.data
+        self._positions(self.tick, d[X, :n], d[Y, :n])
+        self._positions(self.prev_tick, d[PX, :n], d[PY, :n])
+        super().sync_views()
@@ -0,0 +1,177 @@
+# system/collision.py
+"""
+Batch-Kollisionstests für viele Projektile gegen wenige Ziele.
+
+Die Tests laufen mit NumPy in einem Durchgang pro Tick (Fallback: reines Python).
+Sie liefern nur Kandidaten; präzise Checks (Maske, Schadenslogik) macht der Aufrufer.
+"""
+import bisect
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # numpy ist optional
+    np = None
+
+# Unterhalb dieser Anzahl ist die Python-Schleife schneller als der Array-Aufbau
+NUMPY_MIN_BATCH = 32
+
+
+def rects_to_array(shots):
+    """(n, 4) int32-Array aus den Rects der Projektile (x, y, w, h)"""
+    # fromiter über die Rect-Komponenten spart die Zwischen-Tupel
+    return np.fromiter(chain.from_iterable(s.rect for s in shots), dtype=np.int32,
+                       count=4 * len(shots)).reshape(-1, 4)
+
+
+def sweep_rect(shot):
+    """Rect, das den Pfad des Projektils seit prev_x/prev_y komplett abdeckt (Broadphase)"""
+    r = shot.rect
+    return r.union((shot.prev_x, shot.prev_y, r.w, r.h))
+
+
+def swept_entry(shot, target_rect):
+    """
+    Eintrittszeitpunkt t in [0, 1] des Projektil-Rects auf seinem Pfad
+    (prev_x/prev_y -> aktuelle Position) in target_rect, None ohne Kontakt.
+
+    Minkowski-Summe: die Rect-Ecke läuft als Segment gegen das um die Projektilgröße
+    erweiterte Ziel (Liang-Barsky). Offene Intervalle wie pygame.Rect.colliderect,
+    bei Pfadlänge 0 also identisch zum diskreten Test.
+    """
+    r = shot.rect
+    x0, y0 = shot.prev_x, shot.prev_y
+    t0, t1 = 0.0, 1.0
+    for p, d, lo, hi in ((x0, r.x - x0, target_rect.x - r.w, target_rect.right),
+                         (y0, r.y - y0, target_rect.y - r.h, target_rect.bottom)):
+        if d == 0:
+            if p <= lo or p >= hi:
+                return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        if a > b:
+            a, b = b, a
+        if a > t0: t0 = a
+        if b < t1: t1 = b
+        if t0 >= t1:
+            return None
+    return t0
+
+
+def ray_rect_entry(x, y, dx, dy, rect):
+    """
+    Abstand t >= 0, ab dem der Strahl (x, y) + t * (dx, dy) das Rect betritt
+    (0 wenn der Start im Rect liegt), None wenn er es verfehlt. Slab-Test.
+    """
+    t0, t1 = 0.0, float('inf')
+    for p, d, lo, hi in ((x, dx, rect.left, rect.right), (y, dy, rect.top, rect.bottom)):
+        if d == 0:
+            if p < lo or p >= hi:
+                return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        if a > b:
+            a, b = b, a
+        if a > t0: t0 = a
+        if b < t1: t1 = b
+        if t0 > t1:
+            return None
+    return t0
+
+
+def player_hit_candidates(shots, player_rect, circles=(), swept=False):
+    """
+    Liefert die Projektile (in Listen-Reihenfolge), deren Mittelpunkt in einem der
+    Kreise (center, radius) liegt oder deren Rect das Player-Rect berührt.
+    Mit swept=True zählt beim Player-Rect der ganze Pfad seit prev_x/prev_y.
+
+    Alle anderen Projektile können weder Schild noch Spieler treffen.
+    """
+    n = len(shots)
+    if n == 0:
+        return []
+
+    px, py, pw, ph = player_rect
+    if np is None or n < NUMPY_MIN_BATCH:
+        out = []
+        for s in shots:
+            r = s.rect
+            if (sweep_rect(s) if swept else r).colliderect(player_rect):
+                out.append(s); continue
+            sx, sy = r.center
+            for (cx, cy), rad in circles:
+                if (sx - cx) ** 2 + (sy - cy) ** 2 <= rad * rad:
+                    out.append(s); break
+        return out
+
+    shots = list(shots)
+    arr = rects_to_array(shots)
+    x, y, w, h = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+
+    # AABB gegen den Spieler (wie pygame.Rect.colliderect), swept: Bounding-Box des Pfads
+    if swept:
+        prev = np.array([(s.prev_x, s.prev_y) for s in shots], dtype=np.int32).reshape(-1, 2)
+        bx0, by0 = np.minimum(x, prev[:, 0]), np.minimum(y, prev[:, 1])
+        bx1, by1 = np.maximum(x, prev[:, 0]) + w, np.maximum(y, prev[:, 1]) + h
+        hit = (bx0 < px + pw) & (px < bx1) & (by0 < py + ph) & (py < by1) & (w > 0) & (h > 0)
+    else:
+        hit = (x < px + pw) & (px < x + w) & (y < py + ph) & (py < y + h) & (w > 0) & (h > 0)
+
+    # Kreis-Test mit dem Rect-Mittelpunkt (wie Shield.hit_circle)
+    if circles:
+        sx = (x + w // 2).astype(np.int64)
+        sy = (y + h // 2).astype(np.int64)
+        for (cx, cy), rad in circles:
+            hit |= (sx - cx) ** 2 + (sy - cy) ** 2 <= rad * rad
+
+    return [shots[i] for i in np.flatnonzero(hit)]
+
+
+def intercept_pairs(attackers, targets):
+    """
+    Alle (attacker, target)-Paare mit überlappenden Rects zwischen zwei Projektil-Gruppen.
+
+    Sort-and-Sweep auf x: targets nach linker Kante sortiert; pro attacker liefert eine
+    Binärsuche das x-Fenster [a.left - max_w, a.right), erst darin folgt der volle Test.
+    Kosten O((n + m) log m + Kandidaten) statt n * m.
+    Reihenfolge: nach attacker (Listen-Reihenfolge), dann target nach linker Kante.
+    """
+    attackers = list(attackers)
+    targets   = list(targets)
+    if not attackers or not targets:
+        return []
+
+    if np is None or len(attackers) + len(targets) < NUMPY_MIN_BATCH:
+        ts    = sorted(targets, key=lambda t: t.rect.x)
+        lefts = [t.rect.x for t in ts]
+        wmax  = max(t.rect.w for t in ts)
+        out = []
+        for a in attackers:
+            r  = a.rect
+            lo = bisect.bisect_right(lefts, r.x - wmax)
+            hi = bisect.bisect_left(lefts, r.right)
+            for j in range(lo, hi):
+                if r.colliderect(ts[j].rect):
+                    out.append((a, ts[j]))
+        return out
+
+    A = rects_to_array(attackers)
+    T = rects_to_array(targets)
+    order = np.argsort(T[:, 0], kind="stable")
+    Ts    = T[order]
+    wmax  = int(Ts[:, 2].max())
+    lo = np.searchsorted(Ts[:, 0], A[:, 0] - wmax, side="right")
+    hi = np.searchsorted(Ts[:, 0], A[:, 0] + A[:, 2], side="left")
+    counts = np.maximum(hi - lo, 0)
+    total  = int(counts.sum())
+    if total == 0:
+        return []
+
+    # Kandidaten-Paare aufklappen: attacker i mit targets lo[i] .. hi[i]-1
+    ai = np.repeat(np.arange(len(A)), counts)
+    ti = lo[ai] + (np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts))
+    a, t = A[ai], Ts[ti]
+    ok = ((t[:, 0] < a[:, 0] + a[:, 2]) & (a[:, 0] < t[:, 0] + t[:, 2]) &
+          (t[:, 1] < a[:, 1] + a[:, 3]) & (a[:, 1] < t[:, 1] + t[:, 3]) &
+          (a[:, 2] > 0) & (a[:, 3] > 0) & (t[:, 2] > 0) & (t[:, 3] > 0))
+    return [(attackers[i], targets[order[j]]) for i, j in zip(ai[ok].tolist(), ti[ok].tolist())]
@@ -0,0 +1,236 @@
+# system/frame_cache.py
+"""
+FrameCache - skalierte Animations-Frames (Explosionen) mit Byte-Budget und LRU.
+
+- get(): (Key, Frames) für Frames + Skalierung; Treffer rücken im LRU nach hinten
+- Fehlende Skalierungen werden im Hintergrund-Thread gebaut (smoothscale gibt den GIL frei);
+  bis dahin liefert get() die nächstgelegene gecachte Skalierung derselben Frames als Platzhalter
+  (ohne gecachte Variante die unskalierten Frames)
+- prewarm(): Skalierungen beim Laden synchron vorbauen
+- poll(): fertige Hintergrund-Jobs übernehmen (einmal pro Frame im Haupt-Thread)
+- Über dem Budget fliegen die am längsten ungenutzten Sets raus; Verwender mit eigenen
+  Referenzen (ExplosionSoA) vergleichen evictions und prüfen ihre Keys mit frames_for()
+
+Schlüssel = (id(frames[0]), len(frames), Skalierung auf 3 Stellen), wie bei der MaskBank wird
+frames[0] mit abgelegt und wiederverwendete ids erkannt. stats() meldet Treffer, Misses und Bytes.
+"""
+import math
+import queue
+import threading
+from collections import OrderedDict
+import pygame
+from config import EXPLOSION_CACHE_MB
+
+
+def scale_frames(frames, scale):
+    """Alle Frames mit smoothscale auf scale (mindestens 1x1)"""
+    return [pygame.transform.smoothscale(f, (max(1, int(f.get_width() * scale)),
+                                             max(1, int(f.get_height() * scale))))
+            for f in frames]
+
+
+def frames_bytes(frames) -> int:
+    return sum(f.get_pitch() * f.get_height() for f in frames)
+
+
+class FrameCache:
+    """LRU-Cache für skalierte Frame-Sets mit Speicher-Budget und asynchronen Misses"""
+
+    __slots__ = ("budget", "threaded", "bytes", "_entries", "_variants", "_pending",
+                 "_jobs", "_done", "_worker", "_gen",
+                 "hits", "misses", "placeholders", "evictions", "built")
+
+    def __init__(self, budget_bytes=EXPLOSION_CACHE_MB << 20, threaded=True):
+        self.budget    = int(budget_bytes)
+        self.threaded  = threaded
+        self.bytes     = 0
+        self._entries  = OrderedDict()  # Key -> (frames[0] der Quelle, skalierte Frames, Bytes)
+        self._variants = {}             # (id, len) -> {Skalierung: Key}
+        self._pending  = set()          # Keys mit laufendem Hintergrund-Job
+        self._jobs     = None           # queue.Queue, erst beim ersten Miss
+        self._done     = queue.Queue()
+        self._worker   = None
+        self._gen      = 0              # clear() verwirft Ergebnisse älterer Jobs
+        self.hits         = 0
+        self.misses       = 0
+        self.placeholders = 0
+        self.evictions    = 0
+        self.built        = 0
+
+    @staticmethod
+    def key(frames, scale):
+        return (id(frames[0]), len(frames), round(float(scale), 3))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _lookup(self, key, src):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] is not src:  # wiederverwendete id: alter Eintrag gehört zu anderen Frames
+            self._drop(key)
+            return None
+        return entry
+
+    def _store(self, key, src, frames):
+        """Eintrag ablegen (ungenutzteste zuerst verdrängen, der neue bleibt immer)"""
+        if key in self._entries:
+            self._drop(key)
+        size = frames_bytes(frames) if key[2] != 1.0 else 0  # unskaliert: Frames gehören den Assets
+        self._entries[key] = (src, frames, size)
+        self._variants.setdefault(key[:2], {})[key[2]] = key
+        self.bytes += size
+        while self.bytes > self.budget:
+            # unskalierte Einträge belegen kein Budget und bleiben
+            old = next((k for k, e in self._entries.items() if e[2] and k != key), None)
+            if old is None:
+                break
+            self._drop(old)
+            self.evictions += 1
+
+    def _drop(self, key):
+        src, frames, size = self._entries.pop(key)
+        self.bytes -= size
+        variants = self._variants.get(key[:2])
+        if variants is not None:
+            variants.pop(key[2], None)
+            if not variants:
+                del self._variants[key[:2]]
+
+    def _placeholder(self, frames, key):
+        """Nächstgelegene gecachte Skalierung (log-Abstand) derselben Frames, sonst die Frames selbst"""
+        variants = self._variants.get(key[:2])
+        if variants:
+            target = math.log(max(key[2], 1e-3))
+            best = min(variants, key=lambda s: abs(math.log(max(s, 1e-3)) - target))
+            entry = self._lookup(variants[best], frames[0])
+            if entry is not None:
+                return variants[best], entry[1]
+        return self._unscaled(frames)
+
+    def _unscaled(self, frames):
+        key = self.key(frames, 1.0)
+        entry = self._lookup(key, frames[0])
+        if entry is None:
+            self._store(key, frames[0], list(frames))
+            entry = self._entries[key]
+        else:
+            self._entries.move_to_end(key)
+        return key, entry[1]
+
+    def get(self, frames, scale=1.0):
+        """(Key, Frames) in Skalierung scale oder bis zum fertigen Job ein Platzhalter"""
+        key = self.key(frames, scale)
+        entry = self._lookup(key, frames[0])
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return key, entry[1]
+        if key[2] == 1.0:
+            self.hits += 1
+            return self._unscaled(frames)
+        self.misses += 1
+        if not self.threaded:
+            self._store(key, frames[0], scale_frames(frames, scale))
+            self.built += 1
+            return key, self._entries[key][1]
+        if key not in self._pending:
+            self._pending.add(key)
+            self._submit(key, frames, scale)
+        self.placeholders += 1
+        return self._placeholder(frames, key)
+
+    def _submit(self, key, frames, scale):
+        if self._worker is None:
+            self._jobs   = queue.Queue()
+            self._worker = threading.Thread(target=self._run, name="FrameCache", daemon=True)
+            self._worker.start()
+        # Kopien: der Worker fasst keine Surfaces an, die der Haupt-Thread gerade blittet
+        self._jobs.put((self._gen, key, frames[0], [f.copy() for f in frames], scale))
+
+    def _run(self):
+        jobs, done = self._jobs, self._done
+        while True:
+            gen, key, src, frames, scale = jobs.get()
+            try:
+                done.put((gen, key, src, scale_frames(frames, scale)))
+            except Exception:  # z.B. pygame beendet - Miss bleibt Platzhalter
+                done.put((gen, key, src, None))
+
+    def poll(self) -> int:
+        """Fertige Hintergrund-Jobs übernehmen (Haupt-Thread); Rückgabe = Anzahl"""
+        n = 0
+        while True:
+            try:
+                gen, key, src, frames = self._done.get_nowait()
+            except queue.Empty:
+                return n
+            if gen != self._gen:
+                continue
+            self._pending.discard(key)
+            if frames is not None:
+                self._store(key, src, frames)
+                self.built += 1
+                n += 1
+
+    def wait(self, timeout=5.0) -> int:
+        """Blockiert bis alle laufenden Jobs fertig sind (Laden, Tests); Rückgabe wie poll()"""
+        n = 0
+        while self._pending:
+            try:
+                item = self._done.get(timeout=timeout)
+            except queue.Empty:
+                break
+            self._done.put(item)
+            n += self.poll()
+        return n
+
+    def prewarm(self, frames, scales) -> int:
+        """Skalierungen synchron vorbauen (beim Laden); Rückgabe = neu gebaute Sets"""
+        if not frames:
+            return 0
+        n = 0
+        for scale in scales:
+            key = self.key(frames, scale)
+            if self._lookup(key, frames[0]) is not None:
+                continue
+            if key[2] == 1.0:
+                self._unscaled(frames)
+                continue
+            self._store(key, frames[0], scale_frames(frames, scale))
+            self.built += 1
+            n += 1
+        return n
+
+    def scales(self, frames):
+        """Gecachte Skalierungen dieser Frames (aufsteigend)"""
+        return sorted(self._variants.get(self.key(frames, 1.0)[:2], ()))
+
+    def frames_for(self, key):
+        """Frames zu einem Key, None wenn er nicht (mehr) im Cache liegt; zählt nicht als Zugriff"""
+        entry = self._entries.get(key)
+        return None if entry is None else entry[1]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"sets": len(self._entries), "bytes": self.bytes, "budget": self.budget,
+                "hits": self.hits, "misses": self.misses, "placeholders": self.placeholders,
+                "pending": len(self._pending), "built": self.built, "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0}
+
+    def clear(self):
+        """Alles verwerfen; laufende Jobs landen nicht mehr im Cache"""
+        self.evictions += len(self._entries)
+        self._entries.clear()
+        self._variants.clear()
+        self._pending.clear()
+        self._gen += 1
+        self.bytes = 0
+
+
+# Gemeinsame Instanz (beim Laden der Assets vorgewärmt, vom ExplosionManager benutzt)
+frame_cache = FrameCache()
@@ -0,0 +1,40 @@
+# system/homing.py
+"""
+Gebündelte Lenkung für Homing-Projektile (Blaster, HomingRocket).
+
+Die Zielwahl bleibt pro Projektil (homing_target, braucht den Game-Zustand),
+die Rechnung - Richtung mischen, Wende-Rate begrenzen, Mindestwinkel, Normalisieren -
+läuft hier einmal pro Frame als Vektor-Operation über alle Projektile.
+Regeln wie entities.projectile._steer.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy ist optional
+    np = None
+
+
+def steer_batch(dirs, speeds, vel, centers, targets, blend, min_angle):
+    """
+    Lenkt n Projektile auf einmal.
+
+    dirs, vel, centers, targets: (n, 2); speeds, blend, min_angle: (n,)
+    targets = NaN -> kein Ziel (geradeaus), min_angle = -inf -> immer lenken.
+    Gibt (dirs, vel, corrected) zurück; bei Abstand 0 oder Länge 0 bleibt vel unverändert.
+    """
+    d    = targets - centers
+    dist = np.hypot(d[:, 0], d[:, 1])
+    has  = ~np.isnan(dist)
+    near = has & (dist > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tdir = d / dist[:, None]
+        diff = np.abs(np.arctan2(tdir[:, 1], tdir[:, 0]) - np.arctan2(dirs[:, 1], dirs[:, 0]))
+        turn = near & (diff > min_angle)
+        new  = dirs + (tdir - dirs) * blend[:, None]
+        length    = np.hypot(new[:, 0], new[:, 1])
+        corrected = turn & (length > 0)
+        out_dirs  = np.where(corrected[:, None], new / length[:, None], dirs)
+
+    # Ohne Ziel oder bei kleinem Winkel geradeaus, sonst nur korrigierte Zeilen neu setzen
+    straight = ~has | (near & ~turn)
+    out_vel  = np.where((corrected | straight)[:, None], out_dirs * speeds[:, None], vel)
+    return out_dirs, out_vel, corrected
@@ -0,0 +1,132 @@
+# system/mask_bank.py
+"""
+MaskBank - Kollisionsmasken, einmal gebaut und danach nur noch nachgeschlagen.
+
+- frame_set(): skalierte + auf gleiche Größe gepaddete Frames mit einer Maske pro Frame
+  (Schild-Animation, Schlüssel = Basis-Frames + Zielgröße)
+- surface_mask(): eine Maske pro Sprite (Gegner-Typen)
+- rect_mask(): volle Maske für Rect-Projektile, pro Größe gecacht
+
+Masken nur nach bestandener AABB-/Kreis-Broadphase benutzen.
+"""
+import math
+import pygame
+
+
+class FrameSet:
+    """Frames gleicher Größe mit je einer Maske (read-only teilen)"""
+
+    __slots__ = ("frames", "masks", "mask_center")
+
+    def __init__(self, frames, masks, mask_center):
+        self.frames      = frames
+        self.masks       = masks
+        self.mask_center = mask_center
+
+
+def _mask_center(mask):
+    try:
+        return mask.centroid()
+    except AttributeError:
+        return mask.get_bounding_rect().center
+
+
+class MaskBank:
+    """Cache für Frame-Sets und Masken mit Treffer-Statistik"""
+
+    __slots__ = ("_sets", "_surface_masks", "_rect_masks", "hits", "misses")
+
+    def __init__(self):
+        self._sets          = {}  # (id(base_frames[0]), len, size) -> (base_frames[0], FrameSet)
+        self._surface_masks = {}  # id(surface) -> (surface, Mask)
+        self._rect_masks    = {}  # (w, h) -> Mask
+        self.hits   = 0
+        self.misses = 0
+
+    def frame_set(self, base_frames, size) -> FrameSet:
+        """
+        Frames auf size skaliert (alle exakt gleich groß, kein Wobble) plus Maske pro Frame.
+        Wird beim ersten Zugriff gebaut, danach nur nachgeschlagen.
+        """
+        size  = (int(size[0]), int(size[1]))
+        key   = (id(base_frames[0]), len(base_frames), size)
+        entry = self._sets.get(key)
+        if entry is not None and entry[0] is base_frames[0]:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+
+        if base_frames[0].get_size() != size:
+            frames = [pygame.transform.smoothscale(f, size) for f in base_frames]
+        else:
+            frames = list(base_frames)
+
+        fw, fh = frames[0].get_size()
+        eq = []
+        for f in frames:
+            if f.get_size() != (fw, fh):
+                pad = pygame.Surface((fw, fh), pygame.SRCALPHA)
+                pad.blit(f, f.get_rect(center=(fw//2, fh//2)))
+                eq.append(pad)
+            else:
+                eq.append(f)
+
+        masks = tuple(pygame.mask.from_surface(f) for f in eq)
+        fs = FrameSet(eq, masks, _mask_center(masks[0]))
+        # Basis-Frame mit ablegen: hält die id() fest und erkennt wiederverwendete ids
+        self._sets[key] = (base_frames[0], fs)
+        return fs
+
+    def surface_mask(self, surface):
+        """Maske eines einzelnen Sprites (einmal pro Surface gebaut)"""
+        entry = self._surface_masks.get(id(surface))
+        if entry is not None and entry[0] is surface:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        mask = pygame.mask.from_surface(surface)
+        self._surface_masks[id(surface)] = (surface, mask)
+        return mask
+
+    def rect_mask(self, w, h):
+        """Voll gesetzte Maske der Größe (w, h) für Rect-Projektile"""
+        mask = self._rect_masks.get((w, h))
+        if mask is None:
+            mask = self._rect_masks[(w, h)] = pygame.Mask((max(1, w), max(1, h)), fill=True)
+        return mask
+
+    def rect_hits(self, mask, mask_rect, rect) -> bool:
+        """Berührt rect ein gesetztes Pixel der Maske an Position mask_rect?"""
+        return mask.overlap(self.rect_mask(rect.w, rect.h),
+                            (rect.x - mask_rect.x, rect.y - mask_rect.y)) is not None
+
+    def path_hits(self, mask, mask_rect, rect, prev, t0=0.0) -> bool:
+        """
+        Wie rect_hits, aber entlang des Pfads prev -> rect.topleft ab t0 abgetastet
+        (Schrittweite höchstens eine halbe Rect-Kante, kein Durchtunneln der Maske).
+        """
+        px, py = prev
+        dx, dy = rect.x - px, rect.y - py
+        step = max(1, min(rect.w, rect.h) // 2)
+        n  = max(1, math.ceil(math.hypot(dx, dy) * (1.0 - t0) / step))
+        rm = self.rect_mask(rect.w, rect.h)
+        mx, my = mask_rect.x, mask_rect.y
+        for i in range(n + 1):
+            t = t0 + (1.0 - t0) * i / n
+            if mask.overlap(rm, (int(px + dx * t) - mx, int(py + dy * t) - my)) is not None:
+                return True
+        return False
+
+    def stats(self) -> dict:
+        return {"sets": len(self._sets), "surface_masks": len(self._surface_masks),
+                "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        self._sets.clear()
+        self._surface_masks.clear()
+        self._rect_masks.clear()
+        self.hits = self.misses = 0
+
+
+# Gemeinsame Instanz (Assets, Schilde und Gegner teilen sich die Masken)
+mask_bank = MaskBank()
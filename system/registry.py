@@ -0,0 +1,90 @@
+# system/registry.py
+"""
+EntityRegistry - dichte Entity-Liste mit stabilen IDs.
+
+- Jede Entity bekommt beim Hinzufügen eine neue, global eindeutige ID (entity.eid)
+- Entfernen ist O(1): der Slot wird zum Tombstone (None)
+- compact() schließt die Lücken in einem Durchgang (einmal pro Tick aufrufen)
+- Iterieren überspringt Tombstones, Entfernen während der Iteration ist daher sicher
+"""
+import itertools
+
+# Globale ID-Quelle, damit IDs auch über mehrere Registries eindeutig bleiben
+_next_eid = itertools.count(1)
+
+
+class EntityRegistry:
+    """Registry mit stabilen Integer-IDs, Tombstone-Entfernen und Kompaktierung"""
+
+    __slots__ = ("_items", "_index", "_holes")
+
+    def __init__(self, entities=()):
+        self._items = []  # dicht gepackt, None = Tombstone
+        self._index = {}  # eid -> Position in _items
+        self._holes = 0
+        for entity in entities:
+            self.add(entity)
+
+    # --- Verwaltung ---
+    def add(self, entity) -> int:
+        """Registriert eine Entity und gibt ihre neue ID zurück."""
+        eid = next(_next_eid)
+        entity.eid = eid
+        self._index[eid] = len(self._items)
+        self._items.append(entity)
+        return eid
+
+    def remove(self, entity) -> bool:
+        """Entfernt eine Entity in O(1). False wenn sie nicht (mehr) registriert ist."""
+        eid = getattr(entity, "eid", None)
+        idx = self._index.get(eid)
+        if idx is None or self._items[idx] is not entity:
+            return False
+        del self._index[eid]
+        self._items[idx] = None
+        self._holes += 1
+        return True
+
+    def compact(self):
+        """Entfernt alle Tombstones und aktualisiert die Positionen (O(n), nur bei Lücken)."""
+        if not self._holes:
+            return
+        items = [e for e in self._items if e is not None]
+        self._items = items
+        self._index = {e.eid: i for i, e in enumerate(items)}
+        self._holes = 0
+
+    def clear(self):
+        """Entfernt alle Entities."""
+        self._items.clear()
+        self._index.clear()
+        self._holes = 0
+
+    # --- Abfragen ---
+    def is_alive(self, eid) -> bool:
+        """O(1): Ist die ID noch registriert?"""
+        return eid in self._index
+
+    def get(self, eid, default=None):
+        """Entity zu einer ID (oder default)."""
+        idx = self._index.get(eid)
+        return default if idx is None else self._items[idx]
+
+    def snapshot(self) -> list:
+        """Kopie der lebenden Entities als Liste."""
+        return [e for e in self._items if e is not None]
+
+    def __contains__(self, entity) -> bool:
+        idx = self._index.get(getattr(entity, "eid", None))
+        return idx is not None and self._items[idx] is entity
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __bool__(self) -> bool:
+        return bool(self._index)
+
+    def __iter__(self):
+        # filter() prüft jeden Slot erst beim Weiterlaufen -> während der Iteration
+        # entfernte Entities (Tombstones) werden übersprungen
+        return filter(None, self._items)
@@ -0,0 +1,75 @@
+# system/rotation_cache.py
+"""
+RotationCache - vorgedrehte Sprites auf einem festen Winkel-Raster.
+
+- prewarm(): alle steps Winkel eines Bildes auf einmal bauen (beim Laden der Assets)
+- get(): nächstgelegener Rasterwinkel -> (Surface, Offset zur Mitte), fehlende Winkel werden nachgebaut
+- blit(): zeichnet zentriert, ohne Rotation und ohne get_rect pro Frame
+
+Ersetzt pygame.transform.rotate pro Rakete und Frame. stats() meldet Speicher und Trefferquote.
+"""
+import pygame
+from config import ROTATION_CACHE_STEPS
+
+
+class RotationCache:
+    """Cache für Sprites in steps quantisierten Winkeln (gegen den Uhrzeigersinn, wie transform.rotate)"""
+
+    __slots__ = ("steps", "_sets", "hits", "misses", "bytes")
+
+    def __init__(self, steps=ROTATION_CACHE_STEPS):
+        self.steps  = max(1, int(steps))
+        self._sets  = {}  # id(img) -> (img, [(Surface, (ox, oy)) oder None] * steps)
+        self.hits   = 0
+        self.misses = 0
+        self.bytes  = 0
+
+    def _slots(self, img):
+        entry = self._sets.get(id(img))
+        if entry is None or entry[0] is not img:
+            # Bild mit ablegen: hält die id() fest und erkennt wiederverwendete ids
+            entry = self._sets[id(img)] = (img, [None] * self.steps)
+        return entry[1]
+
+    def _build(self, img, slots, i):
+        surf = pygame.transform.rotate(img, i * 360.0 / self.steps)
+        w, h = surf.get_size()
+        slots[i] = (surf, (-(w // 2), -(h // 2)))
+        self.bytes += surf.get_pitch() * h
+        return slots[i]
+
+    def prewarm(self, img):
+        """Baut alle Winkel eines Bildes vor"""
+        slots = self._slots(img)
+        for i in range(self.steps):
+            if slots[i] is None:
+                self._build(img, slots, i)
+
+    def get(self, img, angle_deg):
+        """(gedrehtes Surface, (ox, oy)) für den nächstgelegenen Rasterwinkel; Blit-Position = Mitte + Offset"""
+        slots = self._slots(img)
+        i = int(round(angle_deg * self.steps / 360.0)) % self.steps
+        entry = slots[i]
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return self._build(img, slots, i)
+
+    def blit(self, screen, img, angle_deg, center):
+        surf, (ox, oy) = self.get(img, angle_deg)
+        screen.blit(surf, (center[0] + ox, center[1] + oy))
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"images": len(self._sets), "steps": self.steps, "bytes": self.bytes,
+                "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0}
+
+    def clear(self):
+        self._sets.clear()
+        self.hits = self.misses = self.bytes = 0
+
+
+# Gemeinsame Instanz (Assets und Projektile teilen sich die gedrehten Sprites)
+rotation_cache = RotationCache()
@@ -0,0 +1,239 @@
+# system/spatial_hash.py
+"""
+Uniformes Grid (Spatial Hash) als Broadphase für Kollisionen.
+
+Objekte werden mit ihrem Rect in alle überlappten Zellen einsortiert.
+Abfragen liefern nur die Objekte aus den Zellen, die das Such-Rect berührt.
+"""
+import math
+from system.collision import ray_rect_entry
+
+
+class SpatialHash:
+    """Spatial Hash mit fester Zellgröße und stabiler Einfüge-Reihenfolge"""
+
+    __slots__ = ("cell_size", "_cells", "_entries", "_next_order", "_bounds")
+
+    def __init__(self, cell_size=128):
+        self.cell_size   = max(1, int(cell_size))
+        self._cells      = {}  # (cx, cy) -> [entry, ...]
+        self._entries    = {}  # id(obj) -> entry
+        self._next_order = 0
+        self._bounds     = None  # [min_cx, min_cy, max_cx, max_cy] (wächst nur bis clear())
+
+    def clear(self):
+        """Entfernt alle Objekte."""
+        self._cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+        self._bounds     = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs,
+                (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def insert(self, obj, rect):
+        """Fügt ein Objekt mit seinem Rect ein (Reihenfolge = Einfüge-Reihenfolge)."""
+        if id(obj) in self._entries:
+            self.remove(obj)
+        x0, y0, x1, y1 = self._cell_range(rect)
+        # entry: [obj, order, x0, y0, x1, y1]
+        entry = [obj, self._next_order, x0, y0, x1, y1]
+        self._next_order += 1
+        self._entries[id(obj)] = entry
+        b = self._bounds
+        if b is None:
+            self._bounds = [x0, y0, x1, y1]
+        else:
+            if x0 < b[0]: b[0] = x0
+            if y0 < b[1]: b[1] = y0
+            if x1 > b[2]: b[2] = x1
+            if y1 > b[3]: b[3] = y1
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def remove(self, obj):
+        """Entfernt ein Objekt (no-op wenn nicht vorhanden)."""
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return
+        _, _, x0, y0, x1, y1 = entry
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for i, e in enumerate(bucket):
+                    if e is entry:
+                        bucket[i] = bucket[-1]
+                        bucket.pop()
+                        break
+                if not bucket:
+                    del cells[(cx, cy)]
+
+    def rebuild(self, *groups):
+        """Baut das Grid komplett neu aus beliebigen Objekt-Listen (mit .rect) auf."""
+        self.clear()
+        for group in groups:
+            for obj in group:
+                self.insert(obj, obj.rect)
+
+    def _collect(self, x0, y0, x1, y1):
+        """Entries aller Zellen im Bereich, ohne Duplikate, nach Einfüge-Reihenfolge"""
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            if len(bucket) == 1:
+                return [bucket[0]]
+            found = bucket
+        else:
+            seen = {}
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        for e in bucket:
+                            seen[e[1]] = e
+            if not seen:
+                return []
+            found = seen.values()
+        return sorted(found, key=lambda e: e[1])
+
+    def query_rect(self, rect):
+        """Liefert alle Objekte in den Zellen, die rect überlappt (nach Einfüge-Reihenfolge)."""
+        return [e[0] for e in self._collect(*self._cell_range(rect))]
+
+    def query_radius(self, cx, cy, radius):
+        """
+        Liefert (obj, dist) für alle Objekte, deren Rect-Mittelpunkt höchstens
+        radius von (cx, cy) entfernt ist (nach Einfüge-Reihenfolge).
+        """
+        if radius < 0:
+            return []
+        cs = self.cell_size
+        # Der Mittelpunkt liegt im Rect -> das Objekt steckt in einer Zelle der Kreis-Bounding-Box
+        entries = self._collect(int((cx - radius) // cs), int((cy - radius) // cs),
+                                int((cx + radius) // cs), int((cy + radius) // cs))
+        r2  = radius * radius
+        out = []
+        for e in entries:
+            ex, ey = e[0].rect.center
+            d2 = (ex - cx) ** 2 + (ey - cy) ** 2
+            if d2 <= r2:
+                out.append((e[0], math.sqrt(d2)))
+        return out
+
+    def nearest(self, x, y, exclude=None):
+        """
+        Nächstes Objekt (Rect-Mittelpunkt) zu (x, y) per Ring-Suche um die eigene Zelle.
+        Bei gleicher Distanz gewinnt das früher eingefügte Objekt. None wenn leer.
+        """
+        if not self._entries or self._bounds is None:
+            return None
+        cs    = self.cell_size
+        cells = self._cells
+        pcx, pcy = int(x // cs), int(y // cs)
+        bx0, by0, bx1, by1 = self._bounds
+        max_ring = max(abs(pcx - bx0), abs(pcx - bx1), abs(pcy - by0), abs(pcy - by1))
+
+        best, best_key = None, None
+        ring = 0
+        while ring <= max_ring:
+            if ring == 0:
+                ring_cells = ((pcx, pcy),)
+            else:
+                top, bottom = pcy - ring, pcy + ring
+                ring_cells  = [(cx, top) for cx in range(pcx - ring, pcx + ring + 1)]
+                ring_cells += [(cx, bottom) for cx in range(pcx - ring, pcx + ring + 1)]
+                ring_cells += [(pcx - ring, cy) for cy in range(top + 1, bottom)]
+                ring_cells += [(pcx + ring, cy) for cy in range(top + 1, bottom)]
+            for key in ring_cells:
+                bucket = cells.get(key)
+                if not bucket:
+                    continue
+                for e in bucket:
+                    obj = e[0]
+                    if obj is exclude:
+                        continue
+                    ex, ey = obj.rect.center
+                    k = ((ex - x) ** 2 + (ey - y) ** 2, e[1])
+                    if best_key is None or k < best_key:
+                        best, best_key = obj, k
+            # Alles außerhalb dieses Rings ist mindestens ring * cs entfernt
+            if best_key is not None and best_key[0] <= (ring * cs) ** 2:
+                break
+            ring += 1
+        return best
+
+    def raycast(self, x, y, dx, dy, max_dist, accept=None):
+        """
+        Erstes Objekt, dessen Rect der Strahl (x, y) + t * (dx, dy) trifft (0 <= t <= max_dist,
+        (dx, dy) normiert). Läuft per DDA nur durch die Zellen entlang des Strahls und bricht ab,
+        sobald die nächste Zelle hinter dem besten Treffer liegt.
+
+        accept(obj) filtert Objekte (z.B. bereits zerstörte). Gibt (obj, t) zurück,
+        ohne Treffer (None, max_dist).
+        """
+        if not self._entries or self._bounds is None:
+            return None, max_dist
+        cs    = self.cell_size
+        cells = self._cells
+        bx0, by0, bx1, by1 = self._bounds
+        inf = float('inf')
+
+        cx, cy = int(x // cs), int(y // cs)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx != 0:
+            t_max_x   = ((cx + (dx > 0)) * cs - x) / dx
+            t_delta_x = cs / abs(dx)
+        else:
+            t_max_x = t_delta_x = inf
+        if dy != 0:
+            t_max_y   = ((cy + (dy > 0)) * cs - y) / dy
+            t_delta_y = cs / abs(dy)
+        else:
+            t_max_y = t_delta_y = inf
+
+        best, best_t = None, max_dist
+        seen   = set()
+        t_cell = 0.0
+        while t_cell <= best_t:
+            # Strahl hat das belegte Gebiet verlassen (oder läuft daran vorbei)
+            if ((cx > bx1 and dx >= 0) or (cx < bx0 and dx <= 0) or
+                    (cy > by1 and dy >= 0) or (cy < by0 and dy <= 0)):
+                break
+            bucket = cells.get((cx, cy))
+            if bucket:
+                for e in bucket:
+                    if e[1] in seen:
+                        continue
+                    seen.add(e[1])
+                    obj = e[0]
+                    t = ray_rect_entry(x, y, dx, dy, obj.rect)
+                    if t is None or t > best_t or (t == best_t and best is not None):
+                        continue
+                    if accept is not None and not accept(obj):
+                        continue
+                    best, best_t = obj, t
+            if t_max_x < t_max_y:
+                cx += step_x; t_cell = t_max_x; t_max_x += t_delta_x
+            else:
+                cy += step_y; t_cell = t_max_y; t_max_y += t_delta_y
+        return best, best_t
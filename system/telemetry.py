@@ -0,0 +1,183 @@
+# system/telemetry.py
+"""
+Telemetry - Zähler, Gauges und Histogramme im Speicher, geschrieben von einem Hintergrund-Thread.
+
+- count(): Zähler pro Gruppe und Label (z.B. "explosions", "nuke"), höchstens max_labels pro
+  Gruppe, weitere Labels zählen unter "other"
+- gauge(): letzter Wert (Live-Anzahl, Pool-Größe, Cache-Bytes)
+- observe(): Histogramm mit festen Bucket-Grenzen (register_histogram)
+- tick(): einmal pro Frame; nach interval_ms wird ein Snapshot (Kopien, kein Formatieren)
+  an den Writer-Thread übergeben, der ihn als JSON-Zeile an path anhängt
+
+Auf dem Hot-Path nur Dict-Zugriffe und Additionen, Strings baut erst der Writer.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from bisect import bisect_right
+from config import TELEMETRY_FILE, TELEMETRY_INTERVAL_MS
+
+
+class Histogram:
+    """Feste Bucket-Grenzen; counts[i] = Werte < edges[i] (letzter Bucket: alles darüber)"""
+
+    __slots__ = ("edges", "counts", "n", "total")
+
+    def __init__(self, edges):
+        self.edges  = tuple(sorted(edges))
+        self.counts = [0] * (len(self.edges) + 1)
+        self.n      = 0
+        self.total  = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_right(self.edges, value)] += 1
+        self.n     += 1
+        self.total += value
+
+    def snapshot(self) -> dict:
+        return {"edges": self.edges, "counts": list(self.counts), "n": self.n, "sum": self.total}
+
+    def reset(self):
+        self.counts = [0] * (len(self.edges) + 1)
+        self.n      = 0
+        self.total  = 0.0
+
+
+class Telemetry:
+    """Sammelt Metriken im Spiel-Thread, schreibt Snapshots periodisch im Hintergrund"""
+
+    __slots__ = ("path", "interval_ms", "max_labels", "counters", "gauges", "histograms",
+                 "_next_flush", "_queue", "_writer", "flushes", "written")
+
+    def __init__(self, path=None, interval_ms=1000, max_labels=64):
+        self.path        = path
+        self.interval_ms = interval_ms
+        self.max_labels  = max_labels
+        self.counters    = {}  # Gruppe -> {Label: Anzahl}
+        self.gauges      = {}  # Name -> Wert
+        self.histograms  = {}  # Name -> Histogram
+        self._next_flush = None
+        self._queue      = None  # queue.Queue, erst beim ersten Snapshot
+        self._writer     = None
+        self.flushes     = 0
+        self.written     = 0
+
+    # --- Hot-Path ---------------------------------------------------------------------------
+
+    def count(self, group, label=None, n=1):
+        labels = self.counters.get(group)
+        if labels is None:
+            labels = self.counters[group] = {}
+        if label not in labels and len(labels) >= self.max_labels:
+            label = "other"
+        labels[label] = labels.get(label, 0) + n
+
+    def gauge(self, name, value):
+        self.gauges[name] = value
+
+    def observe(self, name, value):
+        hist = self.histograms.get(name)
+        if hist is not None:
+            hist.observe(value)
+
+    def register_histogram(self, name, edges) -> Histogram:
+        hist = self.histograms.get(name)
+        if hist is None or hist.edges != tuple(sorted(edges)):
+            hist = self.histograms[name] = Histogram(edges)
+        return hist
+
+    def get(self, group, label=None) -> int:
+        return self.counters.get(group, {}).get(label, 0)
+
+    # --- Snapshots --------------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """Kopie aller Werte (Zähler kumulativ seit Start bzw. reset)"""
+        return {"counters": {g: dict(labels) for g, labels in self.counters.items()},
+                "gauges": dict(self.gauges),
+                "histograms": {name: h.snapshot() for name, h in self.histograms.items()}}
+
+    def tick(self, now_ms) -> bool:
+        """Einmal pro Frame: nach interval_ms einen Snapshot an den Writer geben"""
+        if self._next_flush is None:
+            self._next_flush = now_ms + self.interval_ms
+            return False
+        if now_ms < self._next_flush:
+            return False
+        self._next_flush = now_ms + self.interval_ms
+        self.flush()
+        return True
+
+    def flush(self):
+        """Snapshot sofort an den Writer geben (ohne path nur zählen)"""
+        self.flushes += 1
+        if not self.path:
+            return
+        if self._writer is None:
+            self._queue  = queue.Queue()
+            self._writer = threading.Thread(target=self._run, name="Telemetry", daemon=True)
+            self._writer.start()
+        self._queue.put((time.time(), self.snapshot()))
+
+    def close(self, timeout=1.0):
+        """Writer beenden, nachdem alle Snapshots geschrieben sind"""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join(timeout)
+        self._writer = None
+        self._queue  = None
+
+    def reset(self):
+        self.counters.clear()
+        self.gauges.clear()
+        for hist in self.histograms.values():
+            hist.reset()
+
+    # --- Writer-Thread ----------------------------------------------------------------------
+
+    @staticmethod
+    def format(stamp, snap) -> str:
+        """Snapshot als JSON-Zeile (Label None = Summe der Gruppe)"""
+        counters = {g: {("total" if k is None else str(k)): v for k, v in labels.items()}
+                    for g, labels in snap["counters"].items()}
+        return json.dumps({"t": round(stamp, 3), "counters": counters, "gauges": snap["gauges"],
+                           "histograms": snap["histograms"]}, separators=(",", ":"))
+
+    def _run(self):
+        q = self._queue
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            lines = [self.format(*item)]
+            while True:  # aufgestaute Snapshots in einem Schreibvorgang
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write(lines)
+                    return
+                lines.append(self.format(*item))
+            self._write(lines)
+
+    def _write(self, lines):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self.written += len(lines)
+        except OSError:
+            pass  # Telemetrie darf das Spiel nie stören
+
+
+def _default_path():
+    if not TELEMETRY_FILE:
+        return None
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), TELEMETRY_FILE)
+
+
+# Gemeinsame Instanz (Manager zählen hinein, Game ruft tick() einmal pro Frame)
+telemetry = Telemetry(_default_path(), TELEMETRY_INTERVAL_MS)
@@ -0,0 +1,55 @@
+# system/timer_wheel.py
+"""
+TimerWheel - Hashed Timing Wheel für Ereignisse in ganzen Ticks.
+
+- schedule(tick, item): O(1), Eintrag landet im Slot tick % size
+- advance(tick): läuft alle Ticks bis tick ab und liefert die fälligen Einträge
+- Einträge mit mehr als size Ticks Abstand bleiben im Slot, bis ihre Runde erreicht ist
+
+Stornieren gibt es nicht: der Aufrufer prüft beim Auslösen, ob der Eintrag noch gilt.
+"""
+
+
+class TimerWheel:
+    """Ringpuffer aus Slots, ein Slot pro Tick modulo size"""
+
+    __slots__ = ("size", "now", "_slots", "_count")
+
+    def __init__(self, size=256, now=0):
+        self.size   = max(1, int(size))
+        self.now    = int(now)
+        self._slots = [[] for _ in range(self.size)]
+        self._count = 0
+
+    def schedule(self, tick, item):
+        """item wird bei advance() über tick fällig (Ticks <= now: beim nächsten Tick)"""
+        tick = max(int(tick), self.now + 1)
+        self._slots[tick % self.size].append((tick, item))
+        self._count += 1
+
+    def advance(self, tick) -> list:
+        """Läuft von now+1 bis tick und gibt alle fälligen Einträge in Tick-Reihenfolge zurück"""
+        due = []
+        if not self._count:
+            self.now = max(self.now, int(tick))
+            return due
+        slots, size = self._slots, self.size
+        for t in range(self.now + 1, int(tick) + 1):
+            slot = slots[t % size]
+            if not slot:
+                continue
+            keep = []
+            for entry in slot:
+                (due if entry[0] <= t else keep).append(entry)
+            slots[t % size] = keep
+        self.now = max(self.now, int(tick))
+        self._count -= len(due)
+        return [item for _, item in due]
+
+    def clear(self):
+        for slot in self._slots:
+            slot.clear()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
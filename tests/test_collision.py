@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Tests für die Batch-/Swept-Kollisionstests
+"""
+import random
+import pygame
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system import collision
+from system.collision import swept_entry, sweep_rect, player_hit_candidates
+
+
+class _Shot:
+    def __init__(self, x, y, w, h, prev=None):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.prev_x, self.prev_y = prev if prev else (x, y)
+
+
+def test_swept_catches_tunneling():
+    """Test: Schneller Schuss springt über ein schmales Ziel, swept erkennt den Treffer"""
+    target = pygame.Rect(100, 200, 40, 20)
+    shot   = _Shot(110, 150, 4, 12, prev=(110, 260))  # 110 px pro Tick nach oben
+    assert not shot.rect.colliderect(target)
+    t = swept_entry(shot, target)
+    assert t is not None and 0.0 < t < 1.0
+    assert sweep_rect(shot).colliderect(target)
+
+    # Daneben vorbei
+    assert swept_entry(_Shot(150, 150, 4, 12, prev=(150, 260)), target) is None
+
+
+def test_swept_without_motion_matches_colliderect():
+    """Test: Pfadlänge 0 verhält sich wie pygame.Rect.colliderect (inkl. Kanten)"""
+    rnd = random.Random(1)
+    target = pygame.Rect(50, 50, 30, 30)
+    for _ in range(500):
+        s = _Shot(rnd.randint(20, 90), rnd.randint(20, 90), rnd.randint(1, 10), rnd.randint(1, 10))
+        assert (swept_entry(s, target) is not None) == s.rect.colliderect(target)
+
+
+def test_player_candidates_swept_numpy_matches_python():
+    """Test: NumPy-Pfad und Python-Fallback liefern dieselben Swept-Kandidaten"""
+    if collision.np is None:
+        return
+    rnd = random.Random(4)
+    shots = []
+    for _ in range(200):
+        x, y = rnd.randint(0, 800), rnd.randint(0, 600)
+        shots.append(_Shot(x, y, 6, 14, prev=(x + rnd.randint(-5, 5), y - rnd.randint(0, 120))))
+    player = pygame.Rect(380, 500, 60, 50)
+    fast = player_hit_candidates(shots, player, swept=True)
+    old  = collision.np
+    try:
+        collision.np = None
+        slow = player_hit_candidates(shots, player, swept=True)
+    finally:
+        collision.np = old
+    assert fast == slow and fast
+
+
+def test_intercept_pairs_match_brute_force():
+    """Test: Sort-and-Sweep liefert dieselben Paare wie der Paar-Vergleich (NumPy und Python)"""
+    rnd = random.Random(8)
+    attackers = [_Shot(rnd.randint(0, 1900), rnd.randint(0, 1000), 5, 18) for _ in range(400)]
+    targets   = [_Shot(rnd.randint(0, 1900), rnd.randint(0, 1000), rnd.randint(8, 14), 24) for _ in range(150)]
+    brute = {(id(a), id(t)) for a in attackers for t in targets if a.rect.colliderect(t.rect)}
+    assert brute
+
+    from system.collision import intercept_pairs
+    fast = intercept_pairs(attackers, targets)
+    assert {(id(a), id(t)) for a, t in fast} == brute
+    old = collision.np
+    try:
+        collision.np = None
+        slow = intercept_pairs(attackers, targets)
+    finally:
+        collision.np = old
+    assert slow == fast
+    assert intercept_pairs([], targets) == []
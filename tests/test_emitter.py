@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Tests für den EmitterManager (Bullet-Patterns als Batches: Salven, Treffer, Austritt)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from manager.emitter_manager import EmitterManager, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy fehlt")
+
+
+class _Enemy:
+    can_shoot = True
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 40, 40)
+        self.rect.midbottom = (x, y)
+
+
+class _Player:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 30, 30)
+        self.rect.center = (x, y)
+
+
+class _Game:
+    physics_step_scale = 1.0
+    player_dead = False
+
+    def __init__(self, enemy, player):
+        self.enemy  = enemy
+        self.player = player
+
+    def _enemy_alive(self, en):
+        return en is self.enemy
+
+
+def test_ring_volleys_rotate_and_hit_player_swept():
+    """Test: Ring-Salven als Batches mit Spin; schnelle Kugel trifft über den Swept-Pfad"""
+    enemy  = _Enemy(400, 100)
+    game   = _Game(enemy, _Player(400, 400))
+    em = EmitterManager({})
+    em.set_viewport(800, 600)
+    em.start("ring_16", enemy, now=0)
+    for now in (0, 100, 250, 500):
+        em.update(game, now)
+    spec = em.spec("ring_16")
+    assert len(em.batches) == spec.volleys and len(em) == spec.volleys * 16
+    assert em.batches[1].sin[0] == pytest.approx(np.sin(np.radians(spec.spin)))
+
+    # 0° zeigt nach unten: erste Kugel der ersten Salve fliegt durch den Spieler (y 385..415)
+    for _ in range(60):
+        em.physics_update(game)
+    em.end_collision_pass()
+    for _ in range(30):  # Kugel-Mitte von y 340 nach 460
+        em.physics_update(game)
+    assert not [h for h in em.player_hit_candidates(game.player.rect) if h.batch is em.batches[0]]
+    hits = em.player_hit_candidates(game.player.rect, swept=True)
+    assert {h.index for h in hits if h.batch is em.batches[0]} == {0}
+    assert em.remove_bullet(hits[0]) and not em.remove_bullet(hits[0])
+    em.end_collision_pass()
+    assert em.player_hit_candidates(pygame.Rect(0, 0, 5, 5)) == []  # Ring-Test verwirft alle Batches
+
+
+def test_batches_despawn_and_emp_clear():
+    """Test: Batch verschwindet nach dem Austritt aus dem Viewport, EMP löscht Kugeln im Radius"""
+    enemy = _Enemy(400, 100)
+    game  = _Game(enemy, _Player(400, 500))
+    em = EmitterManager({})
+    em.set_viewport(800, 600)
+    em.emit(em.spec("fan_aimed"), 400, 100, [0.0, 10.0, -10.0])
+    for _ in range(5):
+        em.physics_update(game)
+    assert em.clear_circle((400, 100), 40 ** 2) == 3 and len(em) == 0
+
+    em.emit(em.spec("fan_aimed"), 400, 100, [0.0])
+    for _ in range(200):  # 6 px/Tick, weiteste Ecke ~ 640 px
+        em.physics_update(game)
+    assert em.batches == []
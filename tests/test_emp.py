@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Tests für die EMP-Welle (Ring-Sweep über Gegner, Löschen der Gegner-Projektile)
+"""
+import pygame
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.registry import EntityRegistry
+from manager.projectile_manager import ProjectileManager
+from entities.emp import EMPPulseWave
+
+
+class _Enemy:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 20, 20)
+        self.rect.center = (x, y)
+        self.emp_hits = 0
+
+    def apply_emp_effect(self):
+        self.emp_hits += 1
+
+
+class _Shot:
+    def __init__(self, x, y, kind):
+        self.rect = pygame.Rect(0, 0, 4, 4)
+        self.rect.center = (x, y)
+        self.kind = kind
+        self.exploded = False
+
+    def on_hit(self, game, pos):
+        self.exploded = True
+
+
+class _Game:
+    def __init__(self):
+        self.enemies            = EntityRegistry()
+        self.fly_in_enemies     = EntityRegistry()
+        self.projectile_manager = ProjectileManager()
+
+
+def test_emp_ring_sweep_hits_each_enemy_once():
+    """Test: Jeder Gegner im Radius genau einmal, Gegner außerhalb nie"""
+    game = _Game()
+    near = [_Enemy(500 + dx, 500) for dx in range(-300, 301, 30)]
+    far  = _Enemy(500, 500 + 2000)
+    for e in near: game.enemies.add(e)
+    game.fly_in_enemies.add(far)
+    dead = near[3]
+    game.enemies.remove(dead)
+
+    wave = EMPPulseWave((500, 500))
+    dt = 1 / 60
+    while wave.update(dt, game):
+        pass
+    wave.update(dt, game)  # nach Ablauf: nichts doppelt
+
+    assert all(e.emp_hits == 1 for e in near if e is not dead)
+    assert dead.emp_hits == 0 and far.emp_hits == 0
+
+
+def test_emp_clears_enemy_shots():
+    """Test: Gegner-Projektile im Radius werden über den ProjectileManager entfernt"""
+    game = _Game()
+    pm = game.projectile_manager
+    laser  = _Shot(510, 500, "laser")
+    rocket = _Shot(490, 500, "rocket")
+    away   = _Shot(5000, 500, "laser")
+    for s in (laser, rocket, away):
+        pm.add_enemy_shot(s)
+
+    wave = EMPPulseWave((500, 500))
+    wave.update(1 / 60, game)
+
+    assert not pm.is_alive(laser) and not pm.is_alive(rocket)
+    assert rocket.exploded and not laser.exploded
+    assert pm.is_alive(away)
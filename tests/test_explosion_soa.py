@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Tests für das ExplosionSoA (Frame-Index pro Zeit, Swap-Remove, blits)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from manager.explosion_soa import ExplosionSoA, np, X
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy fehlt")
+
+
+def test_frames_follow_time_and_finished_are_removed():
+    """Test: Frame = (now - start) // step; fertige fliegen per Swap-Remove raus, Rest bleibt"""
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    frames = []
+    for c in colors:
+        f = pygame.Surface((2, 2)); f.fill(c); frames.append(f)
+    soa = ExplosionSoA(16)
+    soa.add(0, 0, 0, 3, 100, now=0)      # 3 Frames à 100 ms
+    soa.add(10, 0, 0, 1, 100, now=0)     # 1 Frame -> nach 100 ms fertig
+    soa.add(20, 0, 0, 3, 50, now=0)      # 3 Frames à 50 ms -> nach 150 ms fertig
+
+    screen = pygame.Surface((30, 4))
+    soa.draw(screen, [frames], 120)
+    assert screen.get_at((0, 0))[:3] == colors[1] and screen.get_at((20, 0))[:3] == colors[2]
+    assert soa.update(120) == 1 and len(soa) == 2
+    assert sorted(soa.data[X, :2].tolist()) == [0.0, 20.0]
+    assert soa.update(299) == 1 and soa.data[X, 0] == 0.0
+    assert soa.update(300) == 1 and len(soa) == 0
+
+
+def test_draw_skips_explosions_starting_later():
+    """Test: Start nach dem Draw-Zeitpunkt blittet nichts (negativer Index wäre der letzte Frame)"""
+    frames = []
+    for c in ((255, 0, 0), (0, 255, 0)):
+        f = pygame.Surface((2, 2)); f.fill(c); frames.append(f)
+    soa = ExplosionSoA(16)
+    soa.add(0, 0, 0, 2, 100, now=500)
+    screen = pygame.Surface((4, 4))
+    soa.draw(screen, [frames], 400)
+    assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def test_limit_replaces_oldest():
+    """Test: volles Limit ersetzt die älteste Explosion statt zu wachsen"""
+    soa = ExplosionSoA(16)
+    for t in (30, 10, 20):
+        soa.add(t, 0, 0, 5, 100, now=t, limit=3)
+    soa.add(99, 0, 0, 5, 100, now=40, limit=3)
+    assert len(soa) == 3 and sorted(soa.data[X, :3].tolist()) == [20.0, 30.0, 99.0]
+
+
+def _manager(quality):
+    from manager.explosion_manager import ExplosionManager
+    from system.frame_cache import FrameCache
+    return ExplosionManager(frame_cache=FrameCache(threaded=False), quality=quality)
+
+
+def test_lod_merges_close_explosions_into_larger_one():
+    """Test: frische Explosion derselben Frames in der Nähe wird vergrößert statt neu angelegt"""
+    from manager.explosion_soa import CX, SCALE
+    frames = [pygame.Surface((20, 20), pygame.SRCALPHA) for _ in range(4)]
+    em = _manager("high")
+    em.frame_cache.prewarm(frames, (1.0, 1.5, 2.0))
+    em._spawn(100, 100, frames, 24, 1.0, now=0)
+    em._spawn(110, 100, frames, 24, 1.0, now=10)     # sqrt(2) -> nächste gecachte: 1.5
+    assert len(em.soa) == 1 and em.merged == 1
+    assert em.soa.data[SCALE, 0] == 1.5 and em.soa.data[CX, 0] == 105.0
+    em._spawn(300, 100, frames, 24, 1.0, now=20)     # zu weit weg
+    em._spawn(100, 100, frames, 24, 1.0, now=500)    # zu spät
+    assert len(em.soa) == 3
+
+    off = _manager("ultra")
+    off._spawn(100, 100, frames, 24, 1.0, now=0)
+    off._spawn(110, 100, frames, 24, 1.0, now=10)
+    assert len(off.soa) == 2
+
+
+def test_lod_caps_explosions_per_region():
+    """Test: volle Bildschirm-Zelle ersetzt die älteste statt zu wachsen"""
+    from manager.explosion_soa import START
+    frames = [pygame.Surface((8, 8), pygame.SRCALPHA)]
+    em = _manager("low")
+    cap = em._lod["per_region"]
+    for k in range(cap + 3):
+        em._spawn(10 + 30 * (k % 8), 10 + 30 * (k // 8), frames, 24, 1.0, now=k * 1000)
+    assert len(em.soa) == cap and em.replaced == 3
+    assert sorted(em.soa.data[START, :cap].tolist())[0] == 3000.0
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Tests für den FrameCache (Byte-Budget mit LRU, Platzhalter bei asynchronen Misses)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from system.frame_cache import FrameCache, frames_bytes
+
+
+def _frames(n=2, size=16):
+    return [pygame.Surface((size, size), pygame.SRCALPHA) for _ in range(n)]
+
+
+def test_budget_evicts_least_recently_used():
+    """Test: über dem Budget fliegt das am längsten ungenutzte Set raus, Treffer schützen"""
+    frames = _frames()
+    one = frames_bytes(FrameCache(threaded=False).get(frames, 2.0)[1])
+    cache = FrameCache(budget_bytes=2 * one + one // 2, threaded=False)
+    k2 = cache.get(frames, 2.0)[0]
+    k3 = cache.get(frames, 2.01)[0]
+    cache.get(frames, 2.0)                  # 2.0 ist jetzt zuletzt benutzt
+    k4 = cache.get(frames, 1.99)[0]
+    assert k2 in cache and k4 in cache and k3 not in cache
+    assert cache.evictions == 1 and cache.bytes <= cache.budget
+    s = cache.stats()
+    assert s["hits"] == 1 and s["misses"] == 3 and s["built"] == 3
+
+
+def test_async_miss_returns_nearest_scale_as_placeholder():
+    """Test: Miss liefert sofort die nächste gecachte Skalierung, nach poll() die echte"""
+    frames = _frames(size=20)
+    cache = FrameCache()
+    assert cache.prewarm(frames, (0.5, 2.0)) == 2
+    key, placeholder = cache.get(frames, 3.0)
+    assert key == cache.key(frames, 2.0) and placeholder[0].get_width() == 40
+    assert cache.stats()["placeholders"] == 1
+    cache.wait()
+    key, scaled = cache.get(frames, 3.0)
+    assert key == cache.key(frames, 3.0) and scaled[0].get_width() == 60
+
+
+def test_explosion_manager_releases_evicted_sets():
+    """Test: verdrängte Frame-Sets bleiben, bis keine laufende Explosion sie mehr zeigt"""
+    from manager.explosion_manager import ExplosionManager
+    from manager.explosion_soa import np
+    if np is None:
+        return
+    frames = _frames()
+    one = frames_bytes(FrameCache(threaded=False).get(frames, 2.0)[1])
+    em = ExplosionManager(frame_cache=FrameCache(budget_bytes=one, threaded=False))
+    em._spawn(0, 0, frames, 10, 2.0, now=0)      # 2 Frames à 100 ms
+    em._spawn(0, 0, frames, 10, 3.0, now=150)    # verdrängt 2.0
+    first = em._sets[0]
+    em.soa.update(150); em._release_sets()
+    assert em._sets[0] is first                  # Explosion 1 läuft noch
+    em.soa.update(200); em._release_sets()
+    assert em._sets[0] is None and em._free_sets == [0]
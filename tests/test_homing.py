@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Tests für die gebündelte Lenkung (steer_batch entspricht der Lenkung pro Projektil)
+"""
+import sys
+import os
+import random
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from entities.projectile import Blaster, HomingRocket, _steer
+from system.homing import steer_batch, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy nicht installiert")
+
+
+def test_batch_matches_scalar_steering():
+    """Test: Richtung, Geschwindigkeit und Korrekturen wie bei _steer (inkl. Mindestwinkel, Abstand 0)"""
+    rng = random.Random(7)
+    img = pygame.Surface((8, 8))
+    shots, targets = [], []
+    for i in range(200):
+        cls  = Blaster if i % 2 else HomingRocket
+        shot = cls(rng.randint(0, 800), rng.randint(0, 600), rng.uniform(-6, 6), rng.uniform(-9, 9), img, 10)
+        shots.append(shot)
+        if i % 7 == 0:
+            targets.append(None)                  # kein Ziel -> geradeaus
+        elif i % 11 == 0:
+            targets.append(shot.rect.center)      # Abstand 0 -> vx/vy bleiben
+        elif i % 5 == 0:                          # fast gleiche Richtung -> Blaster fliegt geradeaus
+            cx, cy = shot.rect.center
+            targets.append((cx + int(shot._dir[0] * 300), cy + int(shot._dir[1] * 300)))
+        else:
+            targets.append((rng.randint(0, 800), rng.randint(0, 600)))
+
+    nan  = float("nan")
+    rows = [(s._dir[0], s._dir[1], s.vx, s.vy, *s.rect.center, *(t if t else (nan, nan)), s._speed,
+             min(s.homing_strength, s.max_turn_rate),
+             float("-inf") if s.min_steer_angle is None else s.min_steer_angle)
+            for s, t in zip(shots, targets)]
+    a = np.array(rows)
+    dirs, vel, corrected = steer_batch(a[:, 0:2], a[:, 8], a[:, 2:4], a[:, 4:6], a[:, 6:8], a[:, 9], a[:, 10])
+
+    for i, (shot, t) in enumerate(zip(shots, targets)):
+        if t is None:
+            shot.vx, shot.vy = shot._dir[0] * shot._speed, shot._dir[1] * shot._speed
+            corr = False
+        else:
+            corr = _steer(shot, *t, min_angle=shot.min_steer_angle)
+        assert corr == corrected[i]
+        assert shot._dir == pytest.approx(tuple(dirs[i]), abs=1e-12)
+        assert (shot.vx, shot.vy) == pytest.approx(tuple(vel[i]), abs=1e-9)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Tests für die MaskBank (vorab gebaute Kollisionsmasken)
+"""
+import pygame
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.mask_bank import MaskBank
+
+
+def _disc(size, radius):
+    """Transparentes Surface mit deckendem Kreis in der Mitte"""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (255, 255, 255, 255), (size // 2, size // 2), radius)
+    return surf
+
+
+def test_frame_set_built_once_per_size():
+    """Test: Pro (Frames, Größe) wird genau einmal skaliert und maskiert"""
+    bank   = MaskBank()
+    frames = [_disc(64, 10 + i * 5) for i in range(4)]
+    a = bank.frame_set(frames, (32, 32))
+    b = bank.frame_set(frames, (32, 32))
+    assert a is b and bank.misses == 1 and bank.hits == 1
+    assert len(a.masks) == len(a.frames) == 4
+    assert all(f.get_size() == (32, 32) for f in a.frames)
+    # Maske pro Frame: unterschiedlich große Kreise -> unterschiedliche Pixelzahl
+    assert len({m.count() for m in a.masks}) == 4
+    assert bank.frame_set(frames, (48, 48)) is not a
+
+
+def test_rect_hits_ignores_transparent_corner():
+    """Test: Schuss in der transparenten Ecke trifft nicht, in der Mitte schon"""
+    bank   = MaskBank()
+    sprite = _disc(40, 15)
+    mask   = bank.surface_mask(sprite)
+    assert bank.surface_mask(sprite) is mask
+    target = pygame.Rect(100, 100, 40, 40)
+    corner = pygame.Rect(100, 100, 4, 4)
+    center = pygame.Rect(118, 118, 4, 4)
+    assert corner.colliderect(target) and not bank.rect_hits(mask, target, corner)
+    assert bank.rect_hits(mask, target, center)
+
+
+def test_path_hits_samples_whole_path():
+    """Test: Pfad durch den deckenden Bereich trifft, Pfad durch die Ecke nicht"""
+    bank   = MaskBank()
+    mask   = bank.surface_mask(_disc(40, 15))
+    target = pygame.Rect(100, 100, 40, 40)
+    # Mitte: von unten nach oben komplett durch das Ziel
+    assert bank.path_hits(mask, target, pygame.Rect(118, 60, 4, 10), (118, 180))
+    # Linker Rand (x=101): nur transparente Pixel
+    assert not bank.path_hits(mask, target, pygame.Rect(101, 60, 4, 10), (101, 180))
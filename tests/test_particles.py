@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Tests für den ParticleManager (Ring-Buffer, vektorisiertes Update, Pixel-Draw)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from manager.particle_manager import ParticleManager, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy fehlt")
+
+
+def test_ring_buffer_overwrites_oldest_and_life_expires():
+    """Test: voller Buffer überschreibt die ältesten, abgelaufene Partikel zählen nicht mehr"""
+    pm = ParticleManager(capacity=64, seed=1)
+    assert pm.emit("spark", 10, 10, count=40) == 40
+    pm.emit("spark", 10, 10, count=40)
+    assert pm.count == 64 and pm.head == 16 and len(pm) == 64
+    pm.update(0)
+    pm.update(100)                                   # Funken leben 150..400 ms
+    assert 0 < len(pm) <= 64
+    pm.update(200); pm.update(300); pm.update(400); pm.update(500)
+    assert len(pm) == 0
+
+
+def test_directed_emission_and_motion():
+    """Test: gerichteter Trail fliegt entgegen (dx, dy) innerhalb der Streuung, Update bewegt"""
+    pm = ParticleManager(capacity=256, seed=2)
+    pm.emit("rocket_trail", 100, 100, direction=(0.0, 1.0), count=100)
+    n = pm.count
+    assert (pm.vy[:n] > 0).all()                     # spread 40° um "nach unten"
+    pm.update(0); pm.update(50)
+    assert (pm.y[:n] > 100).all()
+
+
+def test_draw_writes_pixels_with_size():
+    """Test: Partikel landen als Pixel (Größe 2 als 2x2) im Screen, außerhalb wird ignoriert"""
+    screen = pygame.Surface((32, 32), depth=32)
+    pm = ParticleManager(capacity=16, seed=3)
+    pm.emit("debris", 5, 5, count=1)
+    pm.emit("spark", 20, 20, count=1)
+    pm.emit("spark", -5, 40, count=1)
+    pm.vx[:] = pm.vy[:] = 0.0
+    pm.draw(screen)
+    assert screen.get_at((5, 5))[:3] != (0, 0, 0) and screen.get_at((6, 6))[:3] != (0, 0, 0)
+    assert screen.get_at((20, 20))[:3] != (0, 0, 0) and screen.get_at((21, 21))[:3] == (0, 0, 0)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Tests für die Admission Control im ProjectileManager (Budgets, Reserve, Verdrängung)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from entities.projectile import Projectile
+from manager.projectile_manager import ProjectileManager
+
+BUDGETS = {
+    "owners":   {"player": {"max": None, "reserve": 0.3}, "enemy": {"max": None, "reserve": 0.0}},
+    "kinds":    {"enemy": {"nuke": 2}},
+    "priority": {"laser": 0, "nuke": 3},
+    "evict":    True,
+}
+
+
+def _shot(kind, owner="enemy"):
+    return Projectile(400, 300, 0, 0, pygame.Surface((4, 4)), 1, owner=owner, kind=kind)
+
+
+def test_kind_budget_evicts_oldest_of_same_kind():
+    """Test: volles Kind-Budget verdrängt den ältesten Schuss desselben Kinds"""
+    pm = ProjectileManager(max_projectiles=10, budgets=BUDGETS)
+    nukes = [_shot("nuke") for _ in range(3)]
+    assert all(pm.add_enemy_shot(n) for n in nukes)
+    assert not pm.is_alive(nukes[0]) and pm.is_alive(nukes[2])
+    assert pm.kind_live[("enemy", "nuke")] == 2 and pm.evicted == {"nuke": 1}
+
+
+def test_player_reserve_and_priority():
+    """Test: Gegner füllen nur bis zur Spieler-Reserve; Laser verdrängen nie Nukes"""
+    pm = ProjectileManager(max_projectiles=10, budgets=BUDGETS)
+    lasers = [_shot("laser") for _ in range(8)]
+    for s in lasers:
+        pm.add_enemy_shot(s)
+    assert pm.live["enemy"] == 7 and not pm.is_alive(lasers[0])  # 3 Plätze Reserve
+
+    player = [_shot("laser", "player") for _ in range(3)]
+    assert all(pm.add_player_shot(s) for s in player) and pm.total_live == 10
+    # Voll: neuer Spieler-Laser verdrängt den ältesten Gegner-Laser, nicht die Reserve
+    assert pm.add_player_shot(_shot("laser", "player"))
+    assert pm.live == {"player": 4, "enemy": 6} and not pm.is_alive(lasers[1])
+
+    strict = ProjectileManager(max_projectiles=2, budgets=dict(BUDGETS, owners={}))
+    strict.add_enemy_shot(_shot("nuke"))
+    strict.add_enemy_shot(_shot("nuke"))
+    assert not strict.add_enemy_shot(_shot("laser")) and strict.rejected == {"laser": 1}
+    assert strict.budget_stats()["kinds"] == {"enemy:nuke": 2}
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Tests für das Culling der Projektile (Viewport pro Tick, Lebensdauer pro Kind)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from entities.projectile import Projectile
+from manager.projectile_manager import ProjectileManager
+from manager.projectile_soa import np
+
+BACKENDS = ["objects"] + (["numpy", "analytic"] if np is not None else [])
+
+
+class _Game:
+    fixed_timestep     = 1.0 / 60
+    physics_step_scale = 1.0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_cull_sideways_incoming_and_ttl(backend):
+    """Test: seitlich entkommene Schüsse fliegen sofort raus, einfliegende bleiben, TTL greift"""
+    pm = ProjectileManager(backend=backend)
+    pm.set_viewport(800, 600)
+    img = pygame.Surface((4, 4))
+    side     = Projectile(790, 300, 12, 0, img, 1, owner="enemy", kind="laser")
+    incoming = Projectile(400, -50, 0, 3, img, 1, owner="enemy", kind="laser")
+    parked   = Projectile(400, 300, 0, 0, img, 1, owner="enemy", kind="laser")
+    for s in (side, incoming, parked):
+        pm.add_enemy_shot(s)
+
+    game = _Game()
+    for _ in range(3):
+        pm.physics_update(game)
+    assert not pm.is_alive(side) and pm.is_alive(incoming)
+    assert pm.culled == {"laser": 1}
+
+    # Standard-TTL (CULL_CONFIG) in Physik-Zeit: 15 s = 900 Ticks
+    for _ in range(900):
+        pm.physics_update(game)
+    assert not pm.is_alive(parked) and pm.expired.get("laser", 0) >= 1
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Tests für die Free-Listen des ProjectileManagers (reset statt Konstruktion)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from entities.projectile import Laser, HomingRocket
+from manager.projectile_manager import ProjectileManager
+
+
+def test_released_shots_are_reused_after_compact():
+    """Test: Freigaben werden erst nach compact() wiederverwendet, pro Klasse getrennt"""
+    pm  = ProjectileManager()
+    img = pygame.Surface((4, 10))
+    a = pm.acquire(Laser, 10, 20, 0, -12, img, 5, kind="laser")
+    pm.add_player_shot(a)
+    assert pm.remove_shot(a)
+
+    # Vor compact(): noch nicht frei (Events dieses Ticks können es noch referenzieren)
+    assert pm.acquire(Laser, 0, 0, 0, -12, img, 5, kind="laser") is not a
+    pm.compact()
+    assert pm.acquire(HomingRocket, 0, 0, 0, -5, img, 5) is not a
+
+    big = pygame.Surface((8, 16))
+    b = pm.acquire(Laser, 50, 60, 0, 8, big, 7, owner="enemy", kind="laser")
+    assert b is a and pm.pool_hits == 1 and pm.pool_misses == 3
+    assert b.rect.size == (8, 16) and b.rect.center == (50, 60)
+    assert (b.prev_x, b.prev_y) == b.rect.topleft and b.vy == 8.0 and b.owner == "enemy"
+
+
+def test_homing_reset_restores_steering_state():
+    """Test: reset() setzt auch den Lenk-Zustand zurück, Unterklassen haben kein __dict__"""
+    img = pygame.Surface((6, 12))
+    r = HomingRocket(0, 0, 0, -5, img, 5)
+    r.current_target = object()
+    r.reset(5, 5, 0, -5, img, 5)
+    assert r.current_target is None and r.homing and r.kind == "homing_rocket"
+    assert not hasattr(r, "__dict__") and not hasattr(Laser(0, 0, 0, -1, img, 1), "__dict__")
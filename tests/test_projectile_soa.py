@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Tests für das SoA-Backend der Projektile (gleiche Bewegung wie Projectile.physics_update)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from entities.projectile import Projectile
+from manager.projectile_soa import ProjectileSoA, np
+
+pytestmark = pytest.mark.skipif(np is None, reason="numpy nicht installiert")
+
+
+class _Game:
+    def __init__(self, k=1.0):
+        self.physics_step_scale = k
+
+
+def _shots():
+    img = pygame.Surface((4, 10))
+    return [Projectile(100 + i, 300, vx, vy, img, 5, kind=kind, accel=accel)
+            for i, (vx, vy, accel, kind) in enumerate([
+                (0, -12, 1.0, "laser"), (3.5, -7.3, 1.0, "blaster"),
+                (-2.2, 5.9, 1.04, "rocket"), (0, 8, 0.97, "enemy_laser")])]
+
+
+@pytest.mark.parametrize("k", [1.0, 2.0])
+def test_step_matches_object_physics(k):
+    """Test: Vektor-Schritt liefert dieselben Positionen wie die Objekt-Physik"""
+    ref, soa_shots = _shots(), _shots()
+    soa  = ProjectileSoA(capacity=2)  # erzwingt _grow
+    for s in soa_shots:
+        soa.add(s)
+    game = _Game(k)
+    for _ in range(30):
+        for s in ref:
+            s.physics_update(game)
+        soa.step(k)
+    soa.sync_views()
+    assert [s.rect.topleft for s in soa_shots] == [s.rect.topleft for s in ref]
+
+
+def test_swap_remove_and_cull():
+    """Test: Swap-Remove hält Spalten konsistent, cull_rows trennt Viewport und Lebensdauer"""
+    shots = _shots()
+    soa   = ProjectileSoA()
+    for s in shots:
+        soa.add(s, ttl=5000.0)
+    assert soa.remove(shots[0]) and shots[0]._si == -1
+    assert not soa.remove(shots[0])
+    assert soa.objs[shots[3]._si] is shots[3] and len(soa) == 3
+
+    for _ in range(100):
+        soa.step(1.0, record_prev=True)
+    out, old = soa.cull_rows(0, 0, 800, 600, clock=0.0)
+    assert set(out) == set(shots[1:3]) and not old  # der gebremste Gegnerschuss bleibt im Bereich
+    assert soa.cull_rows(0, 0, 800, 600, clock=1e9)[1] == [shots[3]]
+    soa.sync_views()
+    assert shots[2].prev_x != shots[2].rect.x
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Tests für analytische Projektil-Bahnen und das TimerWheel
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from entities.projectile import Projectile
+from manager.projectile_soa import np
+from manager.projectile_trajectory import ProjectileTrajectories, ticks_until, travel
+from system.timer_wheel import TimerWheel
+
+
+def test_timer_wheel_rounds_and_order():
+    """Test: Einträge über mehrere Runden, Reihenfolge nach Tick, vergangene Ticks sofort"""
+    wheel = TimerWheel(size=8)
+    wheel.schedule(20, "c")
+    wheel.schedule(3, "a")
+    wheel.schedule(11, "b")  # gleicher Slot wie 3, nächste Runde
+    assert wheel.advance(3) == ["a"] and len(wheel) == 2
+    assert wheel.advance(19) == ["b"]
+    wheel.schedule(5, "late")  # liegt in der Vergangenheit -> nächster Tick (20, nach "c")
+    assert wheel.advance(25) == ["c", "late"] and len(wheel) == 0
+
+
+@pytest.mark.parametrize("step, b", [(5.0, 1.0), (2.0, 1.05), (6.0, 0.97)])
+def test_ticks_until_is_first_tick_past_distance(step, b):
+    """Test: ticks_until liefert genau den ersten Tick, dessen Weg die Distanz übersteigt"""
+    for dist in (0.0, 7.0, 150.0, 190.0):
+        n = ticks_until(dist, step, b)
+        if n is None:
+            assert b < 1.0 and travel(10000, step, b) <= dist
+            continue
+        assert travel(n, step, b) > dist and (n == 1 or travel(n - 1, step, b) <= dist)
+
+
+@pytest.mark.skipif(np is None, reason="numpy fehlt")
+def test_positions_match_stepwise_speed():
+    """Test: Position nach n Ticks = Summe der beschleunigten Einzelschritte, Pfad-Start = prev_tick"""
+    img  = pygame.Surface((4, 4))
+    traj = ProjectileTrajectories(16)
+    shot = Projectile(100, 500, 0, -4, img, 1, owner="player", kind="rocket", accel=1.05)
+    traj.add(shot)
+    x, y0, speed = shot.rect.x, float(shot.rect.y), 4.0
+    y = y0
+    for t in range(30):
+        traj.step(1.0, record_prev=(t == 29))
+        if t < 29:
+            speed *= 1.05
+            y -= speed
+    prev_y = y
+    speed *= 1.05
+    y -= speed
+    traj.sync_views()
+    assert shot.rect.x == x and shot.rect.y == int(y) and shot.prev_y == int(prev_y)
+    assert traj.exit_tick(shot, (800, 600)) == ticks_until(y0 + shot.rect.h, 4.0, 1.05)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Tests für die EntityRegistry (stabile IDs, O(1)-Entfernen, Kompaktierung)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.registry import EntityRegistry
+
+
+class _Entity:
+    pass
+
+
+def test_ids_and_liveness():
+    """Test: Eindeutige IDs, is_alive/contains nach dem Entfernen"""
+    reg = EntityRegistry()
+    a, b = _Entity(), _Entity()
+    ida, idb = reg.add(a), reg.add(b)
+    assert ida != idb and a.eid == ida
+    assert reg.is_alive(ida) and a in reg and len(reg) == 2
+
+    assert reg.remove(a) is True
+    assert reg.remove(a) is False  # doppeltes Entfernen
+    assert not reg.is_alive(ida) and a not in reg
+    assert reg.get(idb) is b and len(reg) == 1
+
+
+def test_remove_during_iteration_keeps_order():
+    """Test: Entfernen während der Iteration überspringt keine Entities"""
+    ents = [_Entity() for _ in range(10)]
+    reg  = EntityRegistry(ents)
+    seen = []
+    for e in reg:
+        seen.append(e)
+        reg.remove(e)
+        if e is ents[0]:
+            reg.remove(ents[5])  # Entity weiter hinten
+    assert seen == ents[:5] + ents[6:]
+    assert len(reg) == 0 and not reg
+
+
+def test_compact_and_readd():
+    """Test: Kompaktierung hält Positionen konsistent, erneutes Hinzufügen gibt neue ID"""
+    ents = [_Entity() for _ in range(6)]
+    reg  = EntityRegistry(ents)
+    for e in ents[::2]:
+        reg.remove(e)
+    reg.compact()
+    assert reg.snapshot() == ents[1::2]
+    assert all(reg.get(e.eid) is e for e in ents[1::2])
+
+    old = ents[0].eid
+    reg.add(ents[0])
+    assert ents[0].eid != old and not reg.is_alive(old)
+    assert list(reg) == ents[1::2] + [ents[0]]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Tests für die Auflösungs-Stufe (_resolve_hits): Kills nur einmal zählen, auch ohne Spatial Hash
+"""
+import sys
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+
+@pytest.fixture(scope="module")
+def game():
+    from game import Game
+    g = Game()
+    g.game_state = "playing"
+    return g
+
+
+@pytest.mark.parametrize("use_hash", [True, False])
+def test_two_aoe_shots_in_one_pass_count_kill_once(game, use_hash):
+    """Test: per Direkttreffer zerstörter Gegner wird von einer späteren AoE im selben Pass nicht erneut getötet"""
+    from entities import Enemy
+    from entities.projectile import Rocket
+    g = game
+    g._start_new_game()
+    g.enemies.clear(); g.fly_in_enemies.clear()
+    g.use_spatial_hash = use_hash
+
+    a = Enemy("alien", g.assets, 400, 300)
+    b = Enemy("alien", g.assets, 440, 300)
+    for en in (a, b):
+        g.enemies.add(en)
+    g.enemy_grid.rebuild(g.enemies, g.fly_in_enemies)
+
+    r1 = Rocket.create(*a.rect.center, g.assets)
+    r2 = Rocket.create(*b.rect.center, g.assets)
+    a.hp = int(r1.dmg * 1.5)   # AoE allein reicht nicht, der Direkttreffer danach schon
+    b.hp = 10 ** 9
+    for r in (r1, r2):
+        g.projectile_manager.add_player_shot(r)
+
+    g.score = g._total_kills = 0
+    g._hits_on_enemies = [(r1, a), (r2, b)]
+    g._resolve_hits(pygame.time.get_ticks(), 1 / 60)
+
+    assert g._total_kills == 1 and g.score == a.points
+    assert a not in g.enemies and b in g.enemies
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+"""
+Tests für den RotationCache (quantisierte Winkel, Offsets, Statistik)
+"""
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from system.rotation_cache import RotationCache
+
+
+def test_nearest_angle_and_center_offset():
+    """Test: Nächster Rasterwinkel, Blit-Position wie get_rect(center=...)"""
+    cache = RotationCache(steps=64)
+    img   = pygame.Surface((12, 24))
+    surf, (ox, oy) = cache.get(img, 44.0)  # Raster 5.625° -> 45°
+    ref = pygame.transform.rotate(img, 45.0)
+    assert surf.get_size() == ref.get_size()
+    assert (100 + ox, 80 + oy) == ref.get_rect(center=(100, 80)).topleft
+
+    assert cache.get(img, 45.5)[0] is surf    # gleicher Rasterwinkel
+    assert cache.get(img, -315.0)[0] is surf  # Winkel werden modulo 360 abgebildet
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_prewarm_builds_all_steps():
+    """Test: prewarm baut alle Winkel, danach nur noch Treffer"""
+    cache = RotationCache(steps=16)
+    img   = pygame.Surface((8, 8))
+    cache.prewarm(img)
+    for a in range(0, 360, 7):
+        cache.get(img, a)
+    st = cache.stats()
+    assert st["misses"] == 0 and st["hit_rate"] == 1.0 and st["bytes"] > 0
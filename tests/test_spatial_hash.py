@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Tests für den SpatialHash (Broadphase der Kollisionserkennung)
+Vergleicht die Grid-Abfragen mit dem Brute-Force-Ergebnis
+"""
+import random
+import pygame
+import sys
+import os
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.spatial_hash import SpatialHash
+
+
+class _Dummy:
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+def _random_objects(n, seed=7):
+    rnd = random.Random(seed)
+    return [_Dummy(rnd.randint(-100, 1900), rnd.randint(-100, 1000), rnd.randint(10, 150), rnd.randint(10, 150))
+            for _ in range(n)]
+
+
+def test_query_matches_brute_force():
+    """Test: Grid liefert dieselben Treffer wie der Brute-Force-Vergleich"""
+    objs = _random_objects(300)
+    grid = SpatialHash(64)
+    grid.rebuild(objs)
+
+    rnd = random.Random(3)
+    for _ in range(200):
+        probe = pygame.Rect(rnd.randint(-50, 1900), rnd.randint(-50, 1000), rnd.randint(2, 40), rnd.randint(2, 40))
+        brute = [o for o in objs if probe.colliderect(o.rect)]
+        hits  = [o for o in grid.query_rect(probe) if probe.colliderect(o.rect)]
+        assert hits == brute
+
+
+def test_query_order_and_groups():
+    """Test: Reihenfolge entspricht der Einfüge-Reihenfolge über mehrere Listen"""
+    a = [_Dummy(0, 0, 50, 50), _Dummy(10, 10, 50, 50)]
+    b = [_Dummy(5, 5, 50, 50)]
+    grid = SpatialHash(32)
+    grid.rebuild(a, b)
+    assert grid.query_rect(pygame.Rect(20, 20, 5, 5)) == [a[0], a[1], b[0]]
+    assert len(grid) == 3
+
+
+def test_remove():
+    """Test: Entfernte Objekte tauchen nicht mehr auf"""
+    objs = _random_objects(50)
+    grid = SpatialHash(100)
+    grid.rebuild(objs)
+    for o in objs[::2]:
+        grid.remove(o)
+    grid.remove(objs[0])  # doppeltes Entfernen ist no-op
+    assert len(grid) == 25
+    assert objs[0] not in grid and objs[1] in grid
+    everything = pygame.Rect(-200, -200, 2400, 1400)
+    assert set(map(id, grid.query_rect(everything))) == set(map(id, objs[1::2]))
+
+
+def test_query_radius_matches_brute_force():
+    """Test: Radius-Abfrage liefert dieselben Gegner und Distanzen wie math.hypot"""
+    import math
+    objs = _random_objects(300, seed=11)
+    grid = SpatialHash(128)
+    grid.rebuild(objs)
+
+    for cx, cy, radius in [(500, 400, 120), (0, 0, 300), (1800, 900, 40), (960, 540, 800)]:
+        brute = []
+        for o in objs:
+            ex, ey = o.rect.center
+            d = math.hypot(ex - cx, ey - cy)
+            if d <= radius:
+                brute.append((o, d))
+        hits = grid.query_radius(cx, cy, radius)
+        assert [o for o, _ in hits] == [o for o, _ in brute]
+        assert all(abs(a - b) < 1e-9 for (_, a), (_, b) in zip(hits, brute))
+
+
+def test_nearest_matches_linear_scan():
+    """Test: Ring-Suche findet dasselbe Ziel wie der lineare Scan der Homing-Projektile"""
+    import math
+    objs = _random_objects(200, seed=5)
+    grid = SpatialHash(96)
+    grid.rebuild(objs)
+
+    rnd = random.Random(9)
+    for _ in range(200):
+        x, y = rnd.randint(-300, 2200), rnd.randint(-300, 1300)
+        best, best_d = None, float('inf')
+        for o in objs:
+            ex, ey = o.rect.center
+            d = math.hypot(ex - x, ey - y)
+            if d < best_d:
+                best, best_d = o, d
+        assert grid.nearest(x, y) is best
+        assert grid.nearest(x, y, exclude=best) is not best
+
+    assert SpatialHash().nearest(0, 0) is None
+
+
+def test_raycast_matches_brute_force():
+    """Test: DDA-Raycast findet dasselbe erste Ziel wie der Slab-Test über alle Objekte"""
+    import math
+    from system.collision import ray_rect_entry
+    objs = _random_objects(250, seed=21)
+    grid = SpatialHash(128)
+    grid.rebuild(objs)
+
+    rnd = random.Random(17)
+    for _ in range(300):
+        x, y = rnd.uniform(-200, 2000), rnd.uniform(-200, 1100)
+        ang  = rnd.uniform(0, 2 * math.pi)
+        dx, dy = math.cos(ang), math.sin(ang)
+        best, best_t = None, 1500.0
+        for o in objs:
+            t = ray_rect_entry(x, y, dx, dy, o.rect)
+            if t is not None and t < best_t:
+                best, best_t = o, t
+        hit, t = grid.raycast(x, y, dx, dy, 1500.0)
+        assert abs(t - best_t) < 1e-9
+        if best is not None:
+            assert ray_rect_entry(x, y, dx, dy, hit.rect) == best_t
+
+    # accept filtert Objekte heraus
+    skip = set(map(id, objs))
+    assert grid.raycast(500, 1200, 0, -1, 2000, accept=lambda o: id(o) not in skip) == (None, 2000)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+"""
+Tests für die In-Memory-Telemetrie (Zähler, Histogramme, Hintergrund-Writer)
+"""
+import sys
+import os
+import json
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from system.telemetry import Telemetry
+
+
+def test_counters_are_bounded_and_histograms_bucket():
+    """Test: Labels über max_labels landen unter "other", Histogramm zählt pro Bucket"""
+    t = Telemetry(max_labels=2)
+    for label in ("nuke", "rocket", "laser", "blaster", "nuke"):
+        t.count("explosions", label)
+    assert t.counters["explosions"] == {"nuke": 2, "rocket": 1, "other": 2}
+    t.register_histogram("scale", (1.0, 2.0))
+    for v in (0.5, 1.0, 1.5, 4.0):
+        t.observe("scale", v)
+    t.observe("unbekannt", 1.0)                      # nicht registriert: ignoriert
+    assert t.snapshot()["histograms"]["scale"]["counts"] == [1, 2, 1]
+
+
+def test_writer_flushes_snapshots_periodically(tmp_path):
+    """Test: tick() gibt nach interval_ms einen Snapshot ab, der Writer schreibt JSON-Zeilen"""
+    path = tmp_path / "telemetry.jsonl"
+    t = Telemetry(str(path), interval_ms=1000)
+    t.count("kills")
+    t.gauge("explosions.live", 7)
+    assert not t.tick(0) and not t.tick(999)
+    assert t.tick(1000)
+    t.count("kills", n=2)
+    assert t.tick(2000)
+    t.close()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [l["counters"]["kills"]["total"] for l in lines] == [1, 3]
+    assert lines[0]["gauges"]["explosions.live"] == 7
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+Tests für die kompilierten WeaponSpecs (Läufe, Geschwindigkeiten, Unveränderlichkeit)
+"""
+import sys
+import os
+import math
+
+# Füge Parent-Verzeichnis zum Path hinzu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import pygame
+
+from config.ship import SHIP_CONFIG
+from config.weapon import PROJECTILES_CONFIG
+from entities.projectile import Laser, Rocket
+from entities.weapon_spec import weapon_spec
+
+
+def _assets():
+    names = ("laser_img", "laser_yellow_img", "double_laser_img", "rocket_img",
+             "homing_rocket_img", "blaster_img", "nuke_img")
+    return {n: pygame.Surface((4, 8)) for n in names}
+
+
+def test_player_stage_barrels_follow_ship_config():
+    """Test: Läufe = Muzzle-Offsets und Winkel der Stage (zyklisch), vx/vy wie früher in create()"""
+    assets = _assets()
+    stage  = max(SHIP_CONFIG)
+    cfg    = SHIP_CONFIG[stage]
+    spec   = weapon_spec("rocket", "player", stage, assets)
+    offs   = cfg["muzzles"]["rocket"]
+    angs   = cfg.get("angle", {}).get("rocket", []) or [0]
+    speed  = PROJECTILES_CONFIG["rocket"]["speed"]
+    assert len(spec.barrels) == cfg["weapons"]["rocket"]
+    for i, (dx, dy, ang, vx, vy) in enumerate(spec.barrels):
+        assert (dx, dy) == tuple(offs[i % len(offs)]) and ang == angs[i % len(angs)]
+        rad = math.radians(ang)
+        assert (vx, vy) == pytest.approx((speed * math.sin(rad), -speed * math.cos(rad)))
+    assert weapon_spec("rocket", "player", stage, assets) is spec  # nur einmal kompiliert
+    with pytest.raises(AttributeError):
+        spec.dmg = 1
+
+
+def test_create_uses_owner_specific_spec():
+    """Test: Enemy-Laser fliegt nach unten mit gelbem Bild, Raketen behalten Radius und accel"""
+    assets = _assets()
+    shot = Laser.create(100, 50, assets, owner="enemy", angle_deg=0)
+    assert shot.img is assets["laser_yellow_img"] and shot.vy > 0 and shot.kind == "laser"
+    rocket = Rocket.create(0, 0, assets, owner="player", angle_deg=30)
+    assert rocket.radius == PROJECTILES_CONFIG["rocket"]["radius"] and rocket.kind == "rocket"
+    assert rocket.accel == PROJECTILES_CONFIG["rocket"]["accel"] and rocket.vx > 0 > rocket.vy